@@ -0,0 +1,102 @@
+"""
+This file measures the event loop lag while a large config file is loaded with 'load_config_file' on the event loop
+and with 'aload_config_file' on a thread or process executor.
+A ticker task sleeps for '--tick-ms' and records how late it wakes up.
+
+Usage:
+    python benchmarks/bench_async_load.py [--keys 20000] [--file-type yaml] [--tick-ms 1]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config_generator import GENERATED_FILE_TYPE_LIST, generate_config_dict, write_config_file
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+
+
+async def measure_loop_lag(load_function, tick_seconds: float) -> tuple:
+    """
+    This function runs a load while a ticker task measures the event loop lag.
+
+    Parameters
+    ----------
+    load_function: Callable
+        This parameter retrieves a coroutine function that loads the config file.
+    tick_seconds: float
+        This parameter specifies the sleep of the ticker task in seconds.
+
+    Returns
+    -------
+    load_seconds: float
+        This returns the duration of the load in seconds.
+    max_lag_seconds: float
+        This returns the largest delay of the ticker task in seconds.
+    """
+    lag_list = []
+    is_loading = True
+
+    async def tick():
+        while is_loading:
+            start_time = time.perf_counter()
+            await asyncio.sleep(tick_seconds)
+            lag_list.append(time.perf_counter() - start_time - tick_seconds)
+
+    ticker_task = asyncio.ensure_future(tick())
+    await asyncio.sleep(0)
+    start_time = time.perf_counter()
+    await load_function()
+    load_seconds = time.perf_counter() - start_time
+    is_loading = False
+    await ticker_task
+    return load_seconds, max(lag_list)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--file-type", default="yaml", choices=GENERATED_FILE_TYPE_LIST)
+    parser.add_argument("--tick-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    config = CraftsEnvConfig()
+    config_file_params = {"root_full_path": "", "naming_case_type": "upper", "naming_case_join_type": ".",
+                          "dry_run": True}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, f"bench.{args.file_type}")
+        write_config_file(config_dict=generate_config_dict(key_count=args.keys, depth=4), file_path=file_path)
+
+        async def load_on_loop():
+            config.load_config_file(file_path=file_path, **config_file_params)
+
+        async def load_on_thread():
+            await config.aload_config_file(file_path=file_path, **config_file_params)
+
+        # The process is started before the measurement, so only the load is measured
+        process_executor = ProcessPoolExecutor(max_workers=1)
+        process_executor.submit(int).result()
+
+        async def load_on_process():
+            await config.aload_config_file(file_path=file_path, executor=process_executor, **config_file_params)
+
+        # Parsing on a thread still holds the GIL for most of the load, so the loop waits for its switch interval
+        print(f"{'mode':<32} {'load ms':>10} {'max loop lag ms':>16}")
+        for mode, load_function in [("load_config_file", load_on_loop),
+                                    ("aload_config_file, thread", load_on_thread),
+                                    ("aload_config_file, process", load_on_process)]:
+            load_seconds, max_lag_seconds = asyncio.run(measure_loop_lag(load_function, args.tick_ms / 1e3))
+            print(f"{mode:<32} {load_seconds * 1e3:>10.1f} {max_lag_seconds * 1e3:>16.1f}")
+        process_executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+This file compares the 'get' latency of the "os_env" and "munch" clients.
+
+Usage:
+    python benchmarks/bench_client_get.py [--repeat 200000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples/")
+
+GET_CASE_LIST = [
+    ("APPLICATION.NAME", str),
+    ("VERSION", float),
+    ("VERSION", int),
+    ("APPLICATION.OPTIONS.USE_SSL", bool),
+    ("APPLICATION.ALLOWED_HOSTS", list),
+    ("JSON_FORMAT", dict),
+]
+
+
+def bench_get(config: CraftsEnvConfig, key: str, value_type: type, repeat: int) -> float:
+    """
+    This function measures the average latency of 'get'.
+
+    Parameters
+    ----------
+    config: CraftsEnvConfig
+        This parameter retrieves the loaded config.
+    key: str
+        This parameter specifies the key.
+    value_type: type
+        This parameter specifies the value type.
+    repeat: int
+        This parameter specifies the number of calls.
+
+    Returns
+    -------
+    ns_per_call: float
+        This returns the nanoseconds per call.
+    """
+    get = config.get
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        get(key, value_type)
+    return (time.perf_counter() - start_time) / repeat * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200000)
+    args = parser.parse_args()
+
+    config_dict = {}
+    for client in ["os_env", "munch"]:
+        config = CraftsEnvConfig(client=client)
+        config.load_config_file(
+            file_path="yaml_config_file.yaml",
+            root_full_path=EXAMPLES_PATH,
+            naming_case_type="upper",
+            naming_case_join_type=".",
+        )
+        config_dict[client] = config
+
+    print(f"{'key':>28} {'type':>6} {'os_env ns':>10} {'munch ns':>10}")
+    for key, value_type in GET_CASE_LIST:
+        timing_list = [bench_get(config_dict[client], key, value_type, args.repeat) for client in ["os_env", "munch"]]
+        print(f"{key:>28} {value_type.__name__:>6} {timing_list[0]:>10.0f} {timing_list[1]:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
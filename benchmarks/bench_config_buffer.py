@@ -0,0 +1,89 @@
+"""
+This file measures the throughput of 'load_config_bytes' and 'load_config_stream' against 'load_config_file'
+on the same generated content of each file type, with the config type given and detected from the content.
+All loads are dry runs, so only reading, parsing and flattening are measured.
+
+Usage:
+    python benchmarks/bench_config_buffer.py [--keys 20000] [--depth 3] [--repeat 5] [--file-type yaml]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+from config_generator import GENERATED_FILE_TYPE_LIST, generate_config_dict, write_config_file
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+
+
+def measure(load_function, repeat: int) -> float:
+    """
+    This function returns the fastest duration of several loads.
+
+    Parameters
+    ----------
+    load_function: Callable
+        This parameter retrieves a function that loads the content once.
+    repeat: int
+        This parameter specifies the number of runs.
+
+    Returns
+    -------
+    seconds: float
+        This returns the fastest duration in seconds.
+    """
+    timing_list = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        load_function()
+        timing_list.append(time.perf_counter() - start_time)
+    return min(timing_list)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--file-type", default=None, choices=GENERATED_FILE_TYPE_LIST)
+    args = parser.parse_args()
+
+    config = CraftsEnvConfig()
+    config_file_params = {"naming_case_type": "upper", "naming_case_join_type": "_", "dry_run": True}
+    config_dict = generate_config_dict(key_count=args.keys, depth=args.depth)
+
+    print(f"{'type':<6} {'source':<28} {'ms':>10} {'MB/s':>8}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for file_type in [args.file_type] if args.file_type else GENERATED_FILE_TYPE_LIST:
+            file_path = os.path.join(temp_dir, f"bench.{file_type}")
+            write_config_file(config_dict=config_dict, file_path=file_path)
+            with open(file_path, "rb") as file:
+                content = file.read()
+            content_view = memoryview(bytearray(content))
+
+            case_list = [
+                ("path", lambda: config.load_config_file(file_path=file_path, root_full_path="",
+                                                         **config_file_params)),
+                ("bytes", lambda: config.load_config_bytes(buffer=content, config_type=file_type,
+                                                           **config_file_params)),
+                ("bytes, detected type", lambda: config.load_config_bytes(buffer=content, **config_file_params)),
+                ("memoryview", lambda: config.load_config_bytes(buffer=content_view, config_type=file_type,
+                                                                **config_file_params)),
+                ("BytesIO stream", lambda: config.load_config_stream(stream=io.BytesIO(content),
+                                                                     config_type=file_type, **config_file_params)),
+                ("BytesIO stream, detected type", lambda: config.load_config_stream(stream=io.BytesIO(content),
+                                                                                    **config_file_params)),
+            ]
+            for source, load_function in case_list:
+                seconds = measure(load_function=load_function, repeat=args.repeat)
+                print(f"{file_type:<6} {source:<28} {seconds * 1e3:>10.2f} {len(content) / seconds / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+This file measures changing the precedence of config files with layers, which writes only the keys of one layer,
+against loading all files again in the new order, and measures the layer lookup of a key.
+
+Usage:
+    python benchmarks/bench_config_layers.py [--keys 20000] [--layers 4] [--override-ratio 0.1] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+
+
+def write_layer_files(temp_dir: str, key_count: int, layer_count: int, override_ratio: float) -> list:
+    """
+    This function writes a defaults json file with all keys and override files with a part of the keys.
+
+    Parameters
+    ----------
+    temp_dir: str
+        This parameter specifies the directory of the files.
+    key_count: int
+        This parameter specifies the number of keys of the defaults file.
+    layer_count: int
+        This parameter specifies the number of files.
+    override_ratio: float
+        This parameter specifies the ratio of keys in each override file.
+
+    Returns
+    -------
+    file_path_list: list
+        This returns the file paths from the lowest to the highest precedence.
+    """
+    file_path_list = []
+    for layer_index in range(layer_count):
+        if layer_index == 0:
+            index_range = range(key_count)
+        else:
+            index_range = range(0, key_count, max(1, int(1 / override_ratio)))
+        file_path = os.path.join(temp_dir, f"layer_{layer_index}.json")
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump({"bench": {f"key_{index}": f"layer_{layer_index}" for index in index_range}}, file)
+        file_path_list.append(file_path)
+    return file_path_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--layers", type=int, default=4)
+    parser.add_argument("--override-ratio", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    previous_env_dict = dict(os.environ)
+    config_file_params = {"root_full_path": "", "naming_case_type": "upper", "naming_case_join_type": "_"}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path_list = write_layer_files(temp_dir=temp_dir, key_count=args.keys, layer_count=args.layers,
+                                           override_ratio=args.override_ratio)
+        config = CraftsEnvConfig()
+        for file_path in file_path_list:
+            config.load_config_file(file_path=file_path, layer_name=os.path.basename(file_path),
+                                    **config_file_params)
+        layer_name = config.layers.layer_name_list[-1]
+
+        reload_timing_list = []
+        toggle_timing_list = []
+        for _ in range(args.repeat):
+            start_time = time.perf_counter()
+            for file_path in file_path_list[:-1]:
+                config.load_config_file(file_path=file_path, **config_file_params)
+            reload_timing_list.append(time.perf_counter() - start_time)
+
+            start_time = time.perf_counter()
+            config.layers.disable_layer(layer_name)
+            config.layers.enable_layer(layer_name)
+            toggle_timing_list.append((time.perf_counter() - start_time) / 2)
+
+        env_key_list = [f"BENCH_KEY_{index}" for index in range(args.keys)]
+        start_time = time.perf_counter()
+        for env_key in env_key_list:
+            config.layers.get_layer_of_key(env_key)
+        lookup_seconds = time.perf_counter() - start_time
+
+    for key in list(os.environ):
+        if key not in previous_env_dict:
+            del os.environ[key]
+
+    print(f"{args.layers} files, {args.keys} keys, {args.override_ratio:.0%} of the keys in each override file")
+    print(f"{'operation':<36} {'ms':>10}")
+    print(f"{'reload the other files':<36} {min(reload_timing_list) * 1e3:>10.2f}")
+    print(f"{'disable the layer':<36} {min(toggle_timing_list) * 1e3:>10.2f}")
+    print(f"{'layer of a key':<36} {lookup_seconds / args.keys * 1e9:>10.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
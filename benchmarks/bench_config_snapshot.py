@@ -0,0 +1,75 @@
+"""
+This file compares loading a yaml config file with loading the snapshot file built from it,
+and a lookup in the mapped snapshot with a lookup in a dict.
+
+Usage:
+    python benchmarks/bench_config_snapshot.py [--keys 20000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from config_generator import generate_config_dict, write_config_file
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.config_snapshot import ConfigSnapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    config_file_params = {"root_full_path": "", "naming_case_type": "upper", "naming_case_join_type": "."}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "bench.yaml")
+        snapshot_path = os.path.join(temp_dir, "bench.snapshot")
+        write_config_file(config_dict=generate_config_dict(key_count=args.keys, depth=4), file_path=file_path)
+        config_env_dict = CraftsEnvConfig().build_config_snapshot(
+            snapshot_path=snapshot_path, file_path_list=[file_path], **config_file_params
+        )
+        print(f"{args.keys} keys, yaml {os.path.getsize(file_path)} bytes, "
+              f"snapshot {os.path.getsize(snapshot_path)} bytes")
+
+        def load_yaml():
+            CraftsEnvConfig().load_config_file(file_path=file_path, dry_run=True, **config_file_params)
+
+        def load_snapshot():
+            with ConfigSnapshot(snapshot_path=snapshot_path) as config_snapshot:
+                config_snapshot.to_dict()
+
+        def load_snapshot_without_checksum():
+            with ConfigSnapshot(snapshot_path=snapshot_path, is_verify_checksum=False) as config_snapshot:
+                config_snapshot.to_dict()
+
+        print(f"{'mode':<36} {'ms per load':>12}")
+        for mode, function in [("load_config_file, dry run", load_yaml),
+                               ("snapshot, decode all", load_snapshot),
+                               ("snapshot, decode all, no checksum", load_snapshot_without_checksum)]:
+            timing_list = []
+            for _ in range(args.repeat):
+                start_time = time.perf_counter()
+                function()
+                timing_list.append(time.perf_counter() - start_time)
+            print(f"{mode:<36} {min(timing_list) * 1e3:>12.2f}")
+
+        key_list = list(config_env_dict)[::max(1, len(config_env_dict) // 1000)]
+        with ConfigSnapshot(snapshot_path=snapshot_path) as config_snapshot:
+            assert all(config_snapshot[key] == config_env_dict[key] for key in key_list)
+            print(f"{'lookup':<36} {'us per key':>12}")
+            for mode, mapping in [("dict", config_env_dict), ("mapped snapshot", config_snapshot)]:
+                start_time = time.perf_counter()
+                for key in key_list:
+                    mapping[key]
+                print(f"{mode:<36} {(time.perf_counter() - start_time) / len(key_list) * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+This file benchmarks the streaming env file parser of LoadConfigFile.
+
+Usage:
+    python benchmarks/bench_env_parser.py [--max-lines 1000000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env.utils.load_config_file import LoadConfigFile
+
+
+def write_env_file(file_path: str, line_count: int) -> None:
+    """
+    This function writes a generated env file.
+
+    Parameters
+    ----------
+    file_path: str
+        This parameter specifies the file location path.
+    line_count: int
+        This parameter specifies the number of variables in the file.
+
+    Returns
+    -------
+    None.
+    """
+    with open(file_path, "w") as f:
+        for index in range(line_count):
+            if index % 100 == 0:
+                f.write(f"# section {index}\n\n")
+            f.write(f'export APPLICATION_KEY_{index}="https://host-{index}.example.com/?a=1&b=2"\n')
+
+
+def bench_env_parser(line_count: int) -> dict:
+    """
+    This function measures the time and peak memory of streaming an env file.
+
+    Parameters
+    ----------
+    line_count: int
+        This parameter specifies the number of variables in the file.
+
+    Returns
+    -------
+    result: dict
+        This returns the elapsed seconds, nanoseconds per line and peak traced bytes.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "bench.env")
+        write_env_file(file_path=file_path, line_count=line_count)
+
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        for _ in LoadConfigFile.iter_env_config_file(file_path=file_path):
+            pass
+        elapsed_time = time.perf_counter() - start_time
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "lines": line_count,
+        "seconds": elapsed_time,
+        "ns_per_line": elapsed_time / line_count * 1e9,
+        "peak_bytes": peak_bytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-lines", type=int, default=1000000)
+    args = parser.parse_args()
+
+    line_count = 1000
+    print(f"{'lines':>10} {'seconds':>10} {'ns/line':>10} {'peak KiB':>10}")
+    while line_count <= args.max_lines:
+        result = bench_env_parser(line_count=line_count)
+        print(f"{result['lines']:>10} {result['seconds']:>10.3f} "
+              f"{result['ns_per_line']:>10.0f} {result['peak_bytes'] / 1024:>10.1f}")
+        line_count *= 10
+
+
+if __name__ == "__main__":
+    main()
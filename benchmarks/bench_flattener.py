@@ -0,0 +1,120 @@
+"""
+This file measures ConfigFlattener on wide, deep and list-heavy configs and compares it with the former
+recursive flattening, which copied the key list at every key and stopped at the recursion limit.
+
+Usage:
+    python benchmarks/bench_flattener.py [--width 100000] [--depth 5000] [--list-length 10000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env.utils.config_flattener import ConfigFlattener, stringify_config_value
+from craftsperson_env.utils.convert_naming_case_type import get_naming_case_converter
+from craftsperson_env.utils.literal_classifier import classify_literal
+
+
+def flatten_recursively(data: dict, config_env_dict: dict, naming_case_converter, keys: list = []) -> None:
+    """
+    This function flattens a config dict the way the former recursive 'add_config_env' did.
+
+    Parameters
+    ----------
+    data: dict
+        This parameter retrieves the config dict.
+    config_env_dict: dict
+        This parameter retrieves the staging dict.
+    naming_case_converter: Callable
+        This parameter retrieves the naming case converter.
+    keys: list, optional
+        This parameter retrieves the key path of the data. The default value is [].
+
+    Returns
+    -------
+    None.
+    """
+    for key, value in data.items():
+        key_list = keys + [key]
+        if isinstance(value, str):
+            value, is_dict_value = classify_literal(value)
+        else:
+            is_dict_value = False
+
+        if isinstance(value, dict) and is_dict_value is False:
+            flatten_recursively(value, config_env_dict, naming_case_converter, key_list)
+        else:
+            config_env_dict[naming_case_converter(tuple(key_list))] = stringify_config_value(value)
+
+
+def measure(function, repeat: int) -> float:
+    """
+    This function returns the fastest duration of several runs of a function, or None if it fails.
+
+    Parameters
+    ----------
+    function: Callable
+        This parameter retrieves the measured function.
+    repeat: int
+        This parameter specifies the number of runs.
+
+    Returns
+    -------
+    seconds: float
+        This returns the fastest duration in seconds.
+    """
+    timing_list = []
+    for _ in range(repeat):
+        get_naming_case_converter(naming_case_type="upper", naming_case_join_type="_").cache_clear()
+        start_time = time.perf_counter()
+        try:
+            function()
+        except RecursionError:
+            return None
+        timing_list.append(time.perf_counter() - start_time)
+    return min(timing_list)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=100000)
+    parser.add_argument("--depth", type=int, default=5000)
+    parser.add_argument("--list-length", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    deep_dict = {"value": "leaf"}
+    for level in range(args.depth):
+        deep_dict = {f"level_{level}": deep_dict, f"key_{level}": level}
+
+    config_dict_dict = {
+        f"wide/{args.width}": {"root": {f"key_{index}": index for index in range(args.width)}},
+        f"deep/{args.depth}": deep_dict,
+        f"list/{args.list_length}": {"servers": [{"host": f"host-{index}", "port": index}
+                                                 for index in range(args.list_length)]},
+    }
+
+    naming_case_converter = get_naming_case_converter(naming_case_type="upper", naming_case_join_type="_")
+    print(f"{'config':<16} {'recursive':>12} {'iterative':>12} {'index':>12}")
+    for name, config_dict in config_dict_dict.items():
+        recursive_seconds = measure(lambda: flatten_recursively(config_dict, {}, naming_case_converter), args.repeat)
+        iterative_seconds = measure(
+            lambda: ConfigFlattener(naming_case_type="upper", naming_case_join_type="_")
+            .add_config_env(config_dict, {}),
+            args.repeat,
+        )
+        index_seconds = measure(
+            lambda: ConfigFlattener(naming_case_type="upper", naming_case_join_type="_", list_index_type="index")
+            .add_config_env(config_dict, {}),
+            args.repeat,
+        )
+        print(" ".join([f"{name:<16}"] + [f"{seconds:>12.4f}" if seconds is not None else f"{'recursion':>12}"
+                                          for seconds in [recursive_seconds, iterative_seconds, index_seconds]]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+This file checks the import cost of craftsperson_env with 'python -X importtime'.
+It exits with status 1 if the cumulative import time exceeds the budget or if a format backend is imported eagerly.
+
+Usage:
+    python benchmarks/bench_import_time.py [--budget-ms 50] [--repeat 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+LAZY_MODULE_LIST = ["yaml", "toml", "tomllib", "orjson", "xmltodict", "dotenv", "json", "concurrent.futures", "multiprocessing"]
+
+
+def measure_import_time() -> tuple:
+    """
+    This function imports craftsperson_env in a fresh interpreter.
+
+    Returns
+    -------
+    import_ms: float
+        This returns the cumulative import time of craftsperson_env in milliseconds.
+    eager_module_list: list
+        This returns the lazy modules that were imported anyway.
+    """
+    code = (
+        "import sys, craftsperson_env; "
+        f"print(','.join(name for name in {LAZY_MODULE_LIST!r} if name in sys.modules))"
+    )
+    repository_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([repository_path, os.environ.get("PYTHONPATH", "")])}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True, env=env,
+    )
+
+    import_ms = None
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == "craftsperson_env":
+            import_ms = int(fields[1]) / 1000
+
+    eager_module_list = [name for name in result.stdout.strip().split(",") if name]
+    return import_ms, eager_module_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    measurement_list = [measure_import_time() for _ in range(args.repeat)]
+    import_ms = min(import_ms for import_ms, _ in measurement_list)
+    eager_module_list = measurement_list[0][1]
+
+    print(f"import craftsperson_env: {import_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+    if eager_module_list:
+        print(f"eagerly imported backends: {', '.join(eager_module_list)}")
+
+    if import_ms > args.budget_ms or eager_module_list:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+This file measures 'interpolate_config_env' on values without references, where it should cost one scan,
+and on values that reference other values in chains.
+
+Usage:
+    python benchmarks/bench_interpolation.py [--keys 100000] [--chain-length 10] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env.utils.config_interpolator import interpolate_config_env
+
+
+def measure(config_env_dict: dict, repeat: int) -> float:
+    """
+    This function returns the fastest duration of several interpolations.
+
+    Parameters
+    ----------
+    config_env_dict: dict
+        This parameter retrieves the flattened key-value pairs.
+    repeat: int
+        This parameter specifies the number of runs.
+
+    Returns
+    -------
+    seconds: float
+        This returns the fastest duration in seconds.
+    """
+    timing_list = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        interpolate_config_env(config_env_dict=config_env_dict, get_value_function=os.environ.get)
+        timing_list.append(time.perf_counter() - start_time)
+    return min(timing_list)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--chain-length", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    plain_dict = {f"KEY_{index}": f"value_{index}" for index in range(args.keys)}
+
+    reference_dict = dict(plain_dict)
+    for index in range(0, args.keys, 10):
+        reference_dict[f"KEY_{index}"] = f"${{KEY_{index + 1}}}/path"
+
+    chain_dict = {}
+    for index in range(args.keys):
+        if index % args.chain_length == args.chain_length - 1:
+            chain_dict[f"KEY_{index}"] = "https"
+        else:
+            chain_dict[f"KEY_{index}"] = f"${{KEY_{index + 1}}}:{index}"
+
+    print(f"{'values':<36} {'ms':>10} {'ns per key':>12}")
+    for mode, config_env_dict in [("without references", plain_dict),
+                                  ("10% with one reference", reference_dict),
+                                  (f"chains of {args.chain_length}", chain_dict)]:
+        seconds = measure(config_env_dict=config_env_dict, repeat=args.repeat)
+        print(f"{mode:<36} {seconds * 1e3:>10.2f} {seconds / args.keys * 1e9:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
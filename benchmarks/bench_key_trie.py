@@ -0,0 +1,62 @@
+"""
+This file compares subtree queries through the key trie with a scan of every environment variable key.
+
+Usage:
+    python benchmarks/bench_key_trie.py [--keys 20000] [--repeat 100]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from config_generator import generate_config_dict, write_config_file
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    previous_env_dict = dict(os.environ)
+    config = CraftsEnvConfig()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "bench.json")
+        write_config_file(config_dict=generate_config_dict(key_count=args.keys, depth=4), file_path=file_path)
+        config.load_config_file(file_path=file_path, root_full_path="", naming_case_type="upper",
+                                naming_case_join_type=".")
+
+    start_time = time.perf_counter()
+    config.keys_under("")
+    print(f"first query, building the trie: {(time.perf_counter() - start_time) * 1e3:.1f} ms")
+
+    prefix = "LEVEL0_0.LEVEL1_0"
+
+    def scan_keys():
+        return [key for key in os.environ if key.startswith(prefix + ".")]
+
+    assert sorted(scan_keys()) == sorted(config.keys_under(prefix))
+
+    print(f"{'query':<28} {'us per call':>12} (prefix with {len(scan_keys())} of {args.keys} keys)")
+    for name, function in [("os.environ scan", scan_keys),
+                           ("keys_under", lambda: config.keys_under(prefix)),
+                           ("get_prefix", lambda: config.get_prefix(prefix))]:
+        start_time = time.perf_counter()
+        for _ in range(args.repeat):
+            function()
+        print(f"{name:<28} {(time.perf_counter() - start_time) / args.repeat * 1e6:>12.1f}")
+
+    for key in list(os.environ):
+        if key not in previous_env_dict:
+            del os.environ[key]
+
+
+if __name__ == "__main__":
+    main()
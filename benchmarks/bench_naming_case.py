@@ -0,0 +1,63 @@
+"""
+This file benchmarks the naming case converters over generated key paths.
+
+Usage:
+    python benchmarks/bench_naming_case.py [--key-count 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env.utils.contraster import NAMING_CASE_LIST, OTHER_CONFIG_NAME_TYPE_LIST
+from craftsperson_env.utils.convert_naming_case_type import get_naming_case_converter
+
+
+def generate_key_paths(key_count: int) -> list:
+    """
+    This function generates key paths that share prefixes like a large config file.
+
+    Parameters
+    ----------
+    key_count: int
+        This parameter specifies the number of key paths.
+
+    Returns
+    -------
+    key_path_list: list
+        This returns the list of key path tuples.
+    """
+    return [
+        ("application", f"service_{index % 50}", f"options_{index % 7}", f"key_{index}")
+        for index in range(key_count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--key-count", type=int, default=100000)
+    args = parser.parse_args()
+
+    key_path_list = generate_key_paths(key_count=args.key_count)
+
+    print(f"{'naming case':>16} {'cold ns/key':>12} {'warm ns/key':>12}")
+    for naming_case_type in NAMING_CASE_LIST + OTHER_CONFIG_NAME_TYPE_LIST:
+        converter = get_naming_case_converter(naming_case_type=naming_case_type, naming_case_join_type=".")
+        converter.cache_clear()
+
+        timing_list = []
+        for _ in range(2):
+            start_time = time.perf_counter()
+            for key_path in key_path_list:
+                converter(key_path)
+            timing_list.append((time.perf_counter() - start_time) / len(key_path_list) * 1e9)
+
+        print(f"{naming_case_type:>16} {timing_list[0]:>12.0f} {timing_list[1]:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+This file measures the first 'get' of each key after a load, where the "os_env" client either returns the
+parsed value that the load kept or parses the 'os.environ' string, for int, float, bool, list and dict values.
+The parsed values are dropped with 'clear_cache' to measure the parsing.
+
+Usage:
+    python benchmarks/bench_native_values.py [--keys 20000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+
+VALUE_TYPE_LIST = [int, float, bool, list, dict]
+
+
+def write_typed_file(temp_dir: str, key_count: int) -> str:
+    """
+    This function writes a json config file with int, float, bool, list and dict values in turn.
+
+    Parameters
+    ----------
+    temp_dir: str
+        This parameter specifies the directory of the file.
+    key_count: int
+        This parameter specifies the number of keys.
+
+    Returns
+    -------
+    file_path: str
+        This returns the file path.
+    """
+    value_list = [8080, 0.5, True, ["it's", "b", "c"], "{'retries': 3, 'timeout': 1.5}"]
+    file_path = os.path.join(temp_dir, "typed.json")
+    with open(file_path, "w", encoding="utf-8") as file:
+        json.dump({"bench": {f"key_{index}": value_list[index % len(value_list)] for index in range(key_count)}},
+                  file)
+    return file_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    previous_env_dict = dict(os.environ)
+    config_file_params = {"root_full_path": "", "naming_case_type": "upper", "naming_case_join_type": "_"}
+    get_case_list = [(f"BENCH_KEY_{index}", VALUE_TYPE_LIST[index % len(VALUE_TYPE_LIST)])
+                     for index in range(args.keys)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = write_typed_file(temp_dir=temp_dir, key_count=args.keys)
+        config = CraftsEnvConfig()
+
+        load_timing_list = []
+        timing_dict = {"kept values": [], "parsed strings": []}
+        for _ in range(args.repeat):
+            for mode, timing_list in timing_dict.items():
+                start_time = time.perf_counter()
+                config.load_config_file(file_path=file_path, **config_file_params)
+                load_timing_list.append(time.perf_counter() - start_time)
+                if mode == "parsed strings":
+                    CraftsEnvConfig.clear_cache()
+
+                start_time = time.perf_counter()
+                for env_key, value_type in get_case_list:
+                    config.get(env_key, value_type)
+                timing_list.append(time.perf_counter() - start_time)
+
+    for key in list(os.environ):
+        if key not in previous_env_dict:
+            del os.environ[key]
+
+    print(f"{args.keys} keys, load {min(load_timing_list) * 1e3:.1f} ms")
+    print(f"{'first get of each key':<24} {'ms':>10} {'ns per key':>12}")
+    for mode, timing_list in timing_dict.items():
+        seconds = min(timing_list)
+        print(f"{mode:<24} {seconds * 1e3:>10.2f} {seconds / args.keys * 1e9:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+This file measures the speed of every installed parser backend on generated yaml, json and toml files.
+The backends are checked to give the same flattened config by tests/test_parser_backend.py.
+
+Usage:
+    python benchmarks/bench_parser_backends.py [--sizes 1000,100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from config_generator import generate_config_dict, write_config_file
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env.utils.config_flattener import flatten_config_file
+from craftsperson_env.utils.contraster import PARSER_BACKEND_DICT
+from craftsperson_env.utils.parser_backend import get_available_parser_backend_list, set_parser_backend
+
+
+def flatten_with_backend(file_path: str, parser_backend: str, is_native_value: bool = False, **flatten_params) -> dict:
+    """
+    This function flattens a config file with a forced parser backend.
+
+    Parameters
+    ----------
+    file_path: str
+        This parameter specifies the file location path.
+    parser_backend: str
+        This parameter specifies the parser backend.
+    is_native_value: bool, optional
+        This parameter determines whether the parsed values are kept instead of their strings.
+            The default value is False.
+
+    Returns
+    -------
+    config_env_dict: dict
+        This returns the flattened environment variable key-value pairs.
+    """
+    file_type = os.path.splitext(file_path)[1][1:]
+    set_parser_backend(file_type=file_type, parser_backend=parser_backend)
+    try:
+        return flatten_config_file(file_path=file_path, is_native_value=is_native_value, **flatten_params)
+    finally:
+        set_parser_backend(file_type=file_type)
+
+
+def bench_speed(file_path_list: list, repeat: int) -> None:
+    """
+    This function prints the fastest flatten duration of every installed backend.
+
+    Parameters
+    ----------
+    file_path_list: list
+        This parameter retrieves the yaml, json and toml file location paths.
+    repeat: int
+        This parameter specifies the number of runs.
+
+    Returns
+    -------
+    None.
+    """
+    for file_path in file_path_list:
+        file_type = os.path.splitext(file_path)[1][1:]
+        for parser_backend in get_available_parser_backend_list(file_type):
+            timing_list = []
+            for _ in range(repeat):
+                start_time = time.perf_counter()
+                flatten_with_backend(file_path, parser_backend)
+                timing_list.append(time.perf_counter() - start_time)
+            print(f"{os.path.basename(file_path):<30} {parser_backend:<10} {min(timing_list) * 1000:>10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generated_path_list = []
+        for key_count in [int(size) for size in args.sizes.split(",")]:
+            config_dict = generate_config_dict(key_count=key_count, depth=4)
+            for file_type in PARSER_BACKEND_DICT:
+                file_path = os.path.join(temp_dir, f"bench_{key_count}.{file_type}")
+                write_config_file(config_dict=config_dict, file_path=file_path)
+                generated_path_list.append(file_path)
+
+        bench_speed(generated_path_list, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+This file compares filling a config object with one 'get' call per field and with 'load_schema'.
+
+Usage:
+    python benchmarks/bench_schema_load.py [--fields 60] [--repeat 2000]
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+
+FIELD_TYPE_LIST = [(str, "value"), (int, "42"), (float, "2.5"), (bool, "true"), (list, "['a', 'b']"),
+                   (dict, "\"{'test': 1}\"")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    config = CraftsEnvConfig()
+    field_list = []
+    for index in range(args.fields):
+        value_type, value = FIELD_TYPE_LIST[index % len(FIELD_TYPE_LIST)]
+        config.set(f"BENCH_FIELD_{index}", value)
+        field_list.append((f"field_{index}", value_type))
+    schema_class = dataclasses.make_dataclass("BenchSchema", field_list)
+
+    def load_with_get():
+        return schema_class(**{name: config.get(f"BENCH_{name.upper()}", value_type)
+                               for name, value_type in field_list})
+
+    def load_with_schema():
+        return config.load_schema(schema_class, prefix="BENCH_")
+
+    assert load_with_get().__dict__ == load_with_schema().to_dict()
+
+    print(f"{'mode':<24} {'us per load':>12}")
+    for mode, function in [("get, warm cache", load_with_get), ("load_schema", load_with_schema)]:
+        start_time = time.perf_counter()
+        for _ in range(args.repeat):
+            function()
+        print(f"{mode:<24} {(time.perf_counter() - start_time) / args.repeat * 1e6:>12.1f}")
+
+    for mode, function in [("get, cold cache", load_with_get), ("load_schema", load_with_schema)]:
+        start_time = time.perf_counter()
+        for _ in range(args.repeat // 10):
+            config.clear_cache()
+            function()
+        print(f"{mode + ', cleared':<24} {(time.perf_counter() - start_time) / (args.repeat // 10) * 1e6:>12.1f}")
+
+    for index in range(args.fields):
+        os.environ.pop(f"BENCH_FIELD_{index}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+This file measures the cost of passing a flattened config to child processes: loading it into 'os.environ'
+and copying the environment for each child, reusing a 'SubprocessEnv', and reusing its cached byte form.
+Each child is started with 'os.posix_spawn' of the 'true' command, so the spawn itself is included.
+
+Usage:
+    python benchmarks/bench_subprocess_env.py [--keys 5000] [--spawns 200]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+
+
+def spawn(executable_path: str, env: dict) -> None:
+    """
+    This function starts the 'true' command with an environment and waits for it.
+
+    Parameters
+    ----------
+    executable_path: str
+        This parameter specifies the path of the 'true' command.
+    env: dict
+        This parameter retrieves the environment of the child process.
+
+    Returns
+    -------
+    None.
+    """
+    pid = os.posix_spawn(executable_path, [executable_path], env)
+    os.waitpid(pid, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=5000)
+    parser.add_argument("--spawns", type=int, default=200)
+    args = parser.parse_args()
+
+    executable_path = shutil.which("true")
+    previous_env_dict = dict(os.environ)
+    config_file_params = {"root_full_path": "", "naming_case_type": "upper", "naming_case_join_type": "_"}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "config.json")
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump({"bench": {f"key_{index}": f"value_{index}" for index in range(args.keys)}}, file)
+
+        config = CraftsEnvConfig()
+        subprocess_env = config.build_subprocess_env(file_path_list=[file_path], base_env=os.environ,
+                                                     **config_file_params)
+        config.load_config_file(file_path=file_path, **config_file_params)
+
+        timing_dict = {}
+        for mode in ["copy of os.environ", "SubprocessEnv", "SubprocessEnv.environb"]:
+            start_time = time.perf_counter()
+            for _ in range(args.spawns):
+                if mode == "copy of os.environ":
+                    spawn(executable_path=executable_path, env=dict(os.environ))
+                elif mode == "SubprocessEnv":
+                    spawn(executable_path=executable_path, env=subprocess_env)
+                else:
+                    spawn(executable_path=executable_path, env=subprocess_env.environb)
+            timing_dict[mode] = (time.perf_counter() - start_time) / args.spawns
+
+    for key in list(os.environ):
+        if key not in previous_env_dict:
+            del os.environ[key]
+
+    print(f"{args.keys} config keys, {args.spawns} spawns")
+    print(f"{'environment':<28} {'us per spawn':>14}")
+    for mode, seconds in timing_dict.items():
+        print(f"{mode:<28} {seconds * 1e6:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
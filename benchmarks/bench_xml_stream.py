@@ -0,0 +1,86 @@
+"""
+This file compares the duration and peak memory of flattening an xml file through the xmltodict tree and
+through the streaming parser, and checks that both give the same keys and values.
+
+Usage:
+    python benchmarks/bench_xml_stream.py [--sizes 1000,100000] [--depths 2,6]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from config_generator import generate_config_dict, write_config_file
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env.utils.config_flattener import flatten_config_file
+
+
+def measure_flatten(file_path: str, is_stream_xml: bool) -> tuple:
+    """
+    This function flattens an xml file once while tracing its memory.
+
+    Parameters
+    ----------
+    file_path: str
+        This parameter specifies the file location path.
+    is_stream_xml: bool
+        This parameter determines whether the streaming parser is used.
+
+    Returns
+    -------
+    config_env_dict: dict
+        This returns the flattened environment variable key-value pairs.
+    seconds: float
+        This returns the duration in seconds.
+    peak_bytes: int
+        This returns the peak traced memory in bytes.
+    """
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    config_env_dict = flatten_config_file(file_path=file_path, naming_case_type="upper", naming_case_join_type="_",
+                                          is_stream_xml=is_stream_xml)
+    seconds = time.perf_counter() - start_time
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return config_env_dict, seconds, peak_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,100000")
+    parser.add_argument("--depths", default="2,6")
+    args = parser.parse_args()
+
+    mismatch_count = 0
+    print(f"{'file':<24} {'mode':<8} {'seconds':>10} {'peak MB':>10} {'file MB':>10}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for key_count in [int(size) for size in args.sizes.split(",")]:
+            for depth in [int(depth) for depth in args.depths.split(",")]:
+                file_path = os.path.join(temp_dir, f"bench_{key_count}_{depth}.xml")
+                write_config_file(config_dict=generate_config_dict(key_count=key_count, depth=depth),
+                                  file_path=file_path)
+                file_megabytes = os.path.getsize(file_path) / 2 ** 20
+
+                result_dict = {}
+                for mode, is_stream_xml in [("tree", False), ("stream", True)]:
+                    config_env_dict, seconds, peak_bytes = measure_flatten(file_path, is_stream_xml)
+                    result_dict[mode] = config_env_dict
+                    print(f"{os.path.basename(file_path):<24} {mode:<8} {seconds:>10.3f} "
+                          f"{peak_bytes / 2 ** 20:>10.1f} {file_megabytes:>10.1f}")
+
+                if result_dict["tree"] != result_dict["stream"]:
+                    mismatch_count += 1
+                    print(f"MISMATCH {os.path.basename(file_path)}")
+
+    print(f"{mismatch_count} mismatch(es)")
+    sys.exit(1 if mismatch_count else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+This file generates synthetic config files for the benchmarks.
+"""
+
+import json
+import math
+import os
+
+GENERATED_FILE_TYPE_LIST = ["env", "yaml", "json", "xml", "toml"]
+
+
+def generate_config_dict(key_count: int, depth: int) -> dict:
+    """
+    This function generates a nested config dict with mixed value types.
+
+    Parameters
+    ----------
+    key_count: int
+        This parameter specifies the number of leaf keys.
+    depth: int
+        This parameter specifies the nesting depth of the leaf keys.
+
+    Returns
+    -------
+    config_dict: dict
+        This returns the nested config dict.
+    """
+    fanout = max(2, math.ceil(key_count ** (1 / depth))) if depth > 1 else 1
+    value_function_list = [
+        lambda index: f"https://host-{index}.example.com/path",
+        lambda index: index,
+        lambda index: index / 4,
+        lambda index: index % 2 == 0,
+        lambda index: [f"item-{index}", f"item-{index + 1}"],
+    ]
+
+    config_dict = {}
+    for index in range(key_count):
+        node = config_dict
+        for level in range(depth - 1):
+            section = (index // fanout ** (depth - 2 - level)) % fanout
+            node = node.setdefault(f"level{level}_{section}", {})
+        node[f"key_{index}"] = value_function_list[index % len(value_function_list)](index)
+
+    return config_dict
+
+
+def iter_leaf_items(config_dict: dict, keys: tuple = ()):
+    """
+    This function yields the key paths and values of the leaves of a nested config dict.
+
+    Parameters
+    ----------
+    config_dict: dict
+        This parameter retrieves the nested config dict.
+    keys: tuple, optional
+        This parameter retrieves the key path of the dict. The default is ().
+
+    Returns
+    -------
+    leaf_item: tuple
+        This yields the key path and value of each leaf.
+    """
+    for key, value in config_dict.items():
+        if isinstance(value, dict):
+            yield from iter_leaf_items(value, keys + (key,))
+        else:
+            yield keys + (key,), value
+
+
+def write_xml_node(file, config_dict: dict, indent: str) -> None:
+    """
+    This function writes a nested config dict as xml elements.
+
+    Parameters
+    ----------
+    file: TextIO
+        This parameter retrieves the open file.
+    config_dict: dict
+        This parameter retrieves the nested config dict.
+    indent: str
+        This parameter specifies the indentation of the elements.
+
+    Returns
+    -------
+    None.
+    """
+    for key, value in config_dict.items():
+        if isinstance(value, dict):
+            file.write(f"{indent}<{key}>\n")
+            write_xml_node(file, value, indent + "  ")
+            file.write(f"{indent}</{key}>\n")
+        elif isinstance(value, list):
+            file.write(f"{indent}<{key}>\n")
+            for item in value:
+                file.write(f"{indent}  <item>{item}</item>\n")
+            file.write(f"{indent}</{key}>\n")
+        else:
+            file.write(f"{indent}<{key}>{value}</{key}>\n")
+
+
+def write_config_file(config_dict: dict, file_path: str) -> None:
+    """
+    This function writes a nested config dict in the format of the file extension.
+
+    Parameters
+    ----------
+    config_dict: dict
+        This parameter retrieves the nested config dict.
+    file_path: str
+        This parameter specifies the file location path ending with env, yaml, json, xml or toml.
+
+    Returns
+    -------
+    None.
+    """
+    file_type = os.path.splitext(file_path)[1][1:]
+
+    with open(file_path, "w") as file:
+        if file_type == "env":
+            for key_path, value in iter_leaf_items(config_dict):
+                file.write(f"{'_'.join(key_path).upper()}={value}\n")
+
+        elif file_type == "yaml":
+            import yaml
+
+            yaml.safe_dump(config_dict, file, sort_keys=False)
+
+        elif file_type == "json":
+            json.dump(config_dict, file)
+
+        elif file_type == "xml":
+            file.write("<config>\n")
+            write_xml_node(file, config_dict, "  ")
+            file.write("</config>\n")
+
+        elif file_type == "toml":
+            import toml
+
+            toml.dump(config_dict, file)
@@ -0,0 +1,319 @@
+"""
+This file runs the benchmark suite and writes the results as JSON.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json [--sizes 10,1000,100000] [--depths 2,6]
+    python benchmarks/run_benchmarks.py --compare base.json new.json [--threshold 0.1]
+
+The suite measures 'load_config_file' end to end and per phase (read, parse, flatten, commit) for every format,
+'CraftsEnvConfig.get' for every value type and 'convert_naming_case_type' for every naming case.
+Setting environment variables costs O(n) per key in the C library, so files with more than '--max-commit-keys' keys
+are measured with 'dry_run=True' and without the commit phase.
+The compare mode exits with status 1 if a benchmark is slower than the base run by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from config_generator import GENERATED_FILE_TYPE_LIST, generate_config_dict, iter_leaf_items, write_config_file
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.config_flattener import ConfigFlattener, flatten_config_file
+from craftsperson_env.utils.contraster import NAMING_CASE_LIST, OTHER_CONFIG_NAME_TYPE_LIST
+from craftsperson_env.utils.convert_naming_case_type import convert_naming_case_type, get_naming_case_converter
+from craftsperson_env.utils.environ_committer import commit_config_env
+from craftsperson_env.utils.load_config_file import LoadConfigFile
+
+GET_VALUE_DICT = {
+    "str": (str, "MyWebApp"),
+    "int": (int, "42"),
+    "float": (float, "2.5"),
+    "bool": (bool, "true"),
+    "list": (list, "['mywebapp.example.com', 'api.mywebapp.example.com']"),
+    "dict": (dict, "\"{'test': 1}\""),
+}
+
+
+def measure(function, repeat: int, *args, **kwargs) -> float:
+    """
+    This function returns the fastest duration of several runs of a function.
+
+    Parameters
+    ----------
+    function: Callable
+        This parameter retrieves the measured function.
+    repeat: int
+        This parameter specifies the number of runs.
+
+    Returns
+    -------
+    seconds: float
+        This returns the fastest duration in seconds.
+    """
+    timing_list = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(*args, **kwargs)
+        timing_list.append(time.perf_counter() - start_time)
+    return min(timing_list)
+
+
+def parse_config_file(file_path: str) -> dict:
+    """
+    This function parses a generated config file with LoadConfigFile.
+
+    Parameters
+    ----------
+    file_path: str
+        This parameter specifies the file location path.
+
+    Returns
+    -------
+    config_dict: dict
+        This returns the parsed config dict.
+    """
+    load_config_file = LoadConfigFile()
+    if file_path.endswith("env"):
+        return load_config_file.load_diff_type_env_config_file(
+            file_path=file_path, config_env_replace_first_value=None, naming_case_join_type=""
+        )
+    return getattr(load_config_file, f"load_{file_path.rsplit('.', 1)[1]}_config_file")(file_path=file_path)
+
+
+def bench_load(result_dict: dict, temp_dir: str, key_count: int, depth: int, repeat: int,
+               max_commit_keys: int) -> None:
+    """
+    This function measures 'load_config_file' end to end and per phase for every format.
+
+    Parameters
+    ----------
+    result_dict: dict
+        This parameter retrieves the result dict that is updated.
+    temp_dir: str
+        This parameter specifies the directory of the generated files.
+    key_count: int
+        This parameter specifies the number of leaf keys.
+    depth: int
+        This parameter specifies the nesting depth.
+    repeat: int
+        This parameter specifies the number of runs.
+    max_commit_keys: int
+        This parameter specifies the maximum number of keys that are committed to the 'os.environ' system.
+
+    Returns
+    -------
+    None.
+    """
+    is_commit = key_count <= max_commit_keys
+    config_dict = generate_config_dict(key_count=key_count, depth=depth)
+    config = CraftsEnvConfig()
+
+    for file_type in GENERATED_FILE_TYPE_LIST:
+        file_path = os.path.join(temp_dir, f"bench_{key_count}_{depth}.{file_type}")
+        write_config_file(config_dict=config_dict, file_path=file_path)
+        name = f"load/{file_type}/{key_count}/depth{depth}"
+
+        def read_file():
+            with open(file_path, "rb") as file:
+                file.read()
+
+        parsed_dict = parse_config_file(file_path)
+        config_env_dict = flatten_config_file(file_path=file_path, naming_case_type="upper", naming_case_join_type="_")
+        previous_env_dict = dict(os.environ)
+
+        result_dict[f"{name}/read"] = measure(read_file, repeat)
+        result_dict[f"{name}/parse"] = measure(parse_config_file, repeat, file_path)
+        result_dict[f"{name}/flatten"] = measure(
+            lambda: ConfigFlattener(naming_case_type="upper", naming_case_join_type="_").add_config_env(parsed_dict, {}),
+            repeat,
+        )
+        if is_commit:
+            result_dict[f"{name}/commit"] = measure(commit_config_env, repeat, config_env_dict)
+
+        result_dict[f"{name}/end_to_end" if is_commit else f"{name}/end_to_end_dry_run"] = measure(
+            config.load_config_file, repeat,
+            file_path=file_path, root_full_path="", naming_case_type="upper", naming_case_join_type="_",
+            dry_run=not is_commit,
+        )
+
+        if is_commit:
+            for key in config_env_dict:
+                if key not in previous_env_dict:
+                    os.environ.pop(key, None)
+
+
+def bench_get(result_dict: dict, repeat: int, call_count: int = 100000) -> None:
+    """
+    This function measures 'CraftsEnvConfig.get' for every value type, with a warm and a cleared cache.
+
+    Parameters
+    ----------
+    result_dict: dict
+        This parameter retrieves the result dict that is updated.
+    repeat: int
+        This parameter specifies the number of runs.
+    call_count: int, optional
+        This parameter specifies the number of calls of each run. The default is 100000.
+
+    Returns
+    -------
+    None.
+    """
+    config = CraftsEnvConfig()
+
+    for type_name, (value_type, value) in GET_VALUE_DICT.items():
+        key = f"CRAFTSPERSON_BENCH_{type_name.upper()}"
+        config.set(key, value)
+
+        def get_warm():
+            for _ in range(call_count):
+                config.get(key, value_type)
+
+        def get_cold():
+            for _ in range(call_count // 10):
+                config.clear_cache()
+                config.get(key, value_type)
+
+        result_dict[f"get/{type_name}/warm"] = measure(get_warm, repeat) / call_count
+        result_dict[f"get/{type_name}/cold"] = measure(get_cold, repeat) / (call_count // 10)
+        os.environ.pop(key)
+
+
+def bench_naming_case(result_dict: dict, repeat: int, key_count: int = 10000) -> None:
+    """
+    This function measures 'convert_naming_case_type' for every naming case with a cleared converter cache.
+
+    Parameters
+    ----------
+    result_dict: dict
+        This parameter retrieves the result dict that is updated.
+    repeat: int
+        This parameter specifies the number of runs.
+    key_count: int, optional
+        This parameter specifies the number of key paths. The default is 10000.
+
+    Returns
+    -------
+    None.
+    """
+    key_list_list = [list(key_path) for key_path, _ in iter_leaf_items(generate_config_dict(key_count, 4))]
+
+    for naming_case_type in NAMING_CASE_LIST + OTHER_CONFIG_NAME_TYPE_LIST:
+        converter = get_naming_case_converter(naming_case_type=naming_case_type, naming_case_join_type=".")
+
+        def convert_all():
+            converter.cache_clear()
+            for key_list in key_list_list:
+                convert_naming_case_type(key_list, naming_case_type, ".")
+
+        result_dict[f"naming_case/{naming_case_type}"] = measure(convert_all, repeat) / len(key_list_list)
+
+
+def run(args) -> None:
+    """
+    This function runs the suite and writes the JSON results.
+
+    Parameters
+    ----------
+    args: Namespace
+        This parameter retrieves the command line arguments.
+
+    Returns
+    -------
+    None.
+    """
+    result_dict = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for key_count in [int(size) for size in args.sizes.split(",")]:
+            for depth in [int(depth) for depth in args.depths.split(",")]:
+                print(f"load: {key_count} keys, depth {depth}", file=sys.stderr)
+                bench_load(result_dict, temp_dir, key_count, depth, args.repeat, args.max_commit_keys)
+
+    print("get", file=sys.stderr)
+    bench_get(result_dict, args.repeat)
+    print("naming case", file=sys.stderr)
+    bench_naming_case(result_dict, args.repeat)
+
+    output = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": result_dict,
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(output, file, indent=2)
+    else:
+        json.dump(output, sys.stdout, indent=2)
+
+
+def compare(base_path: str, new_path: str, threshold: float) -> int:
+    """
+    This function compares two result files and prints the slower and faster benchmarks.
+
+    Parameters
+    ----------
+    base_path: str
+        This parameter specifies the base result file path.
+    new_path: str
+        This parameter specifies the new result file path.
+    threshold: float
+        This parameter specifies the allowed relative slowdown.
+
+    Returns
+    -------
+    regression_count: int
+        This returns the number of regressions.
+    """
+    with open(base_path) as file:
+        base_result_dict = json.load(file)["results"]
+    with open(new_path) as file:
+        new_result_dict = json.load(file)["results"]
+
+    regression_count = 0
+    print(f"{'benchmark':<50} {'base':>12} {'new':>12} {'ratio':>7}")
+    for name in sorted(set(base_result_dict) & set(new_result_dict)):
+        base_seconds, new_seconds = base_result_dict[name], new_result_dict[name]
+        ratio = new_seconds / base_seconds if base_seconds else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regression_count += 1
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        print(f"{name:<50} {base_seconds:>12.3e} {new_seconds:>12.3e} {ratio:>7.2f}{flag}")
+
+    print(f"{regression_count} regression(s) over {threshold:.0%}")
+    return regression_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--sizes", default="10,1000,100000")
+    parser.add_argument("--depths", default="2,6")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-commit-keys", type=int, default=20000)
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), default=None)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, threshold=args.threshold) else 0)
+
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
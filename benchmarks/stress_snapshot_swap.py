@@ -0,0 +1,151 @@
+"""
+This file runs many reader threads while a writer thread reloads two config files in turn.
+Every value of a file is the name of the file, so a reader that sees values of both files in one read
+has seen a half-applied config. The readers check the snapshot of 'is_snapshot_read=True' and the
+'os.environ' system of the default instance for comparison, and check that the snapshot version never decreases.
+It exits with status 1 if a snapshot read is half-applied. A bounded version of this check runs in
+tests/test_config_env_snapshot.py.
+
+Usage:
+    python benchmarks/stress_snapshot_swap.py [--keys 2000] [--readers 16] [--seconds 3] [--client os_env]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# The scripts import the package of this checkout, so they run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from craftsperson_env import CraftsEnvConfig
+
+
+def write_generation_files(temp_dir: str, key_count: int) -> list:
+    """
+    This function writes two json config files with the same keys, whose values are the file names.
+
+    Parameters
+    ----------
+    temp_dir: str
+        This parameter specifies the directory of the files.
+    key_count: int
+        This parameter specifies the number of keys.
+
+    Returns
+    -------
+    file_path_list: list
+        This returns the file paths.
+    """
+    file_path_list = []
+    for generation in ["first", "second"]:
+        file_path = os.path.join(temp_dir, f"{generation}.json")
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump({"stress": {f"key_{index}": generation for index in range(key_count)}}, file)
+        file_path_list.append(file_path)
+    return file_path_list
+
+
+def run_stress(config: CraftsEnvConfig, file_path_list: list, reader_count: int, seconds: float,
+               is_snapshot_read: bool) -> dict:
+    """
+    This function runs the readers and the writer.
+
+    Parameters
+    ----------
+    config: CraftsEnvConfig
+        This parameter retrieves the config instance.
+    file_path_list: list
+        This parameter retrieves the config files loaded in turn.
+    reader_count: int
+        This parameter specifies the number of reader threads.
+    seconds: float
+        This parameter specifies the duration of the run.
+    is_snapshot_read: bool
+        This parameter determines whether the readers read the snapshot or the 'os.environ' system.
+
+    Returns
+    -------
+    result: dict
+        This returns the number of reads, half-applied reads, version errors and reloads.
+    """
+    config_file_params = {"root_full_path": "", "naming_case_type": "upper", "naming_case_join_type": "."}
+    config.load_config_file(file_path=file_path_list[0], **config_file_params)
+    env_key_list = config.keys_under("STRESS")
+    stop_event = threading.Event()
+    result = {"reads": 0, "half_applied_reads": 0, "version_errors": 0, "reloads": 0}
+    result_lock = threading.Lock()
+
+    def read():
+        read_count = half_applied_count = version_error_count = 0
+        last_version = -1
+        while not stop_event.is_set():
+            if is_snapshot_read:
+                snapshot_version = config.snapshot_version
+                snapshot = config.snapshot
+                if snapshot_version < last_version:
+                    version_error_count += 1
+                last_version = snapshot_version
+                value_set = {snapshot[env_key] for env_key in env_key_list}
+            else:
+                value_set = {os.environ[env_key] for env_key in env_key_list}
+            read_count += 1
+            half_applied_count += len(value_set) > 1
+        with result_lock:
+            result["reads"] += read_count
+            result["half_applied_reads"] += half_applied_count
+            result["version_errors"] += version_error_count
+
+    def write():
+        while not stop_event.is_set():
+            config.load_config_file(file_path=file_path_list[result["reloads"] % 2], **config_file_params)
+            result["reloads"] += 1
+
+    thread_list = [threading.Thread(target=read) for _ in range(reader_count)] + [threading.Thread(target=write)]
+    for thread in thread_list:
+        thread.start()
+    time.sleep(seconds)
+    stop_event.set()
+    for thread in thread_list:
+        thread.join()
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--client", default="os_env", choices=["os_env", "munch"])
+    args = parser.parse_args()
+
+    previous_env_dict = dict(os.environ)
+    is_failed = False
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path_list = write_generation_files(temp_dir=temp_dir, key_count=args.keys)
+
+        print(f"{'reader':<16} {'reads':>10} {'half-applied':>14} {'version errors':>16} {'reloads':>10}")
+        for mode, is_snapshot_read in [("os.environ", False), ("snapshot", True)]:
+            if not is_snapshot_read and args.client == "munch":
+                continue
+            config = CraftsEnvConfig(client=args.client, is_snapshot_read=is_snapshot_read)
+            result = run_stress(config=config, file_path_list=file_path_list, reader_count=args.readers,
+                                seconds=args.seconds, is_snapshot_read=is_snapshot_read)
+            print(f"{mode:<16} {result['reads']:>10} {result['half_applied_reads']:>14} "
+                  f"{result['version_errors']:>16} {result['reloads']:>10}")
+            if is_snapshot_read:
+                is_failed = bool(result["half_applied_reads"] or result["version_errors"])
+
+    for key in list(os.environ):
+        if key not in previous_env_dict:
+            del os.environ[key]
+
+    sys.exit(1 if is_failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,19 +2,35 @@
 This file serves as the main class.
 """
 
-import json
 import os
-from typing import Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable
 
-import toml
-import xmltodict
-import yaml
-from dotenv import load_dotenv
-
-from craftsperson_env.utils.base_config import BaseConfigClass
-from craftsperson_env.utils.convert_naming_case_type import convert_naming_case_type
+from craftsperson_env.utils.base_config import BaseConfigClass, DefaultInstanceMethod
+from craftsperson_env.utils.config_cache import ParsedConfigCache
+from craftsperson_env.utils.config_env_snapshot import ConfigEnvSnapshot
+from craftsperson_env.utils.config_flattener import (flatten_config_file, stringify_config_value,
+                                                     timed_flatten_config_file)
+from craftsperson_env.utils.environ_committer import commit_config_env
+from craftsperson_env.utils.key_trie import KeyTrie
+from craftsperson_env.utils.load_stats import LoadStats
+from craftsperson_env.utils.munch_store import MUNCH_MISSING, MunchStore
+from craftsperson_env.utils.parser_backend import get_parser_backend, set_parser_backend
 from craftsperson_env.utils.path_modifier import add_base_path
-from craftsperson_env.utils.load_config_file import LoadConfigFile
+from craftsperson_env.utils.value_cache import CACHE_MISS, CONVERSION_FAILED, TypedValueCache
+from craftsperson_env.utils.value_converter import convert_value, is_value_of_type
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from concurrent.futures import Executor
+    from types import MappingProxyType
+
+    from craftsperson_env.utils.config_layers import ConfigLayers
+    from craftsperson_env.utils.config_schema import SlotsConfig
+    from craftsperson_env.utils.config_snapshot import ConfigSnapshot
+    from craftsperson_env.utils.config_watcher import ConfigWatcher
+    from craftsperson_env.utils.subprocess_env import SubprocessEnv
 
 
 class CraftsEnvConfig(BaseConfigClass):
@@ -25,63 +41,226 @@ class CraftsEnvConfig(BaseConfigClass):
 
     Parameters
     ----------
-    None.
+    client : str, optional
+        This parameter specifies where config values are kept, allowing values such as "os_env" or "munch".
+            The "os_env" client writes string values to the 'os.environ' system. The "munch" client keeps native
+            values in an in-memory store of this instance. The default is "os_env".
+    is_snapshot_read : bool, optional
+        This parameter determines whether reads use an immutable snapshot of the committed keys that each commit
+            replaces atomically, so threads reading during a reload never see a half-applied config.
+            Keys that were not committed by this instance are read from the 'os.environ' system.
+            The default value is False.
 
     Returns
     -------
     None.
     """
 
-    def __init__(self):
+    __value_cache = TypedValueCache()
+
+    def __init__(self, client: str = "os_env", is_snapshot_read: bool = False):
+        self.checker.check_client_method(client=client)
+        self.__client = client
+        self.__munch_store = MunchStore() if client == "munch" else None
+        self.__config_env_snapshot = ConfigEnvSnapshot() if is_snapshot_read else None
+        self.__writer_lock = threading.Lock()
+        self.__config_layers = None
+        self.__environ_layer_dict = None
+        self.__key_trie_dict = {}
         self.__is_remove_xml_first_level = False
         self.__is_change_config_env_format = False
         self.__config_env_replace_first_value = None
         self.__extra_config_file_params = {}
-        self.__load_config_file = LoadConfigFile()
 
-    def __add_config_env(self, data: Any, keys: list = []):
+    def __get_config_file_params(
+        self,
+        file_path: str,
+        root_full_path: str = "./",
+        naming_case_type: str = None,
+        naming_case_join_type: str = "",
+        is_change_config_env_format: bool = False,
+        config_env_replace_first_value: str = None,
+        is_remove_xml_first_level: bool = False,
+        is_stream_xml: bool = False,
+        list_index_type: str = "none",
+        extra_config_file_params: dict = {},
+        config_cache: ParsedConfigCache = None,
+    ) -> dict:
         """
-        This function adds config file key-value pairs to the 'os.environ' system.
+        This function checks the parameters of a config file and returns the keyword arguments of 'flatten_config_file'.
 
         Parameters
         ----------
-        data : Any
-            This parameter retrieves environment variable values.
-        keys : list, optional
-            This parameter retrieves the list of environment variable keys. The default value is [].
+        The parameters are the same as the parameters of 'load_config_file'.
 
         Returns
         -------
-        None.
+        config_file_params: dict
+            This returns the keyword arguments of 'flatten_config_file'.
         """
-        for key, value in data.items():
-            key_list = keys + [key]
+        self.checker.check_config_type(file_path=file_path)
+        self.checker.check_naming_case_type(naming_case_type=naming_case_type)
+        self.checker.check_list_index_type(list_index_type=list_index_type)
+        file_path = add_base_path(file_path=file_path, root_full_path=root_full_path)
 
-            if isinstance(value, str):
-                try:
-                    value = eval(value)
-                    is_dict_value = True
-                except Exception:
-                    is_dict_value = False
-            else:
-                is_dict_value = False
+        # Set naming case attributes
+        self.naming_case_type = naming_case_type
+        self.naming_case_join_type = naming_case_join_type
+        self.__is_remove_xml_first_level = is_remove_xml_first_level
+        self.__extra_config_file_params = extra_config_file_params
+
+        return {
+            "file_path": file_path,
+            "naming_case_type": naming_case_type,
+            "naming_case_join_type": naming_case_join_type,
+            "config_env_replace_first_value": config_env_replace_first_value,
+            "extra_config_file_params": extra_config_file_params,
+            "config_cache": config_cache,
+            "is_native_value": self.__client == "munch",
+            "is_remove_xml_first_level": is_remove_xml_first_level,
+            "is_stream_xml": is_stream_xml,
+            "list_index_type": list_index_type,
+        }
 
-            if isinstance(value, dict) and is_dict_value is False:
-                self.__add_config_env(value, key_list)
+    def __commit_config_env(self, config_env_dict: dict, is_atomic_commit: bool, removed_key_list: list = ()) -> None:
+        """
+        This function writes the staged key-value pairs to the 'os.environ' system and invalidates their cached values,
+            or to the in-memory store of the "munch" client. Commits are serialized, and the snapshot is replaced
+            after the store is written.
+
+        Parameters
+        ----------
+        config_env_dict : dict
+            This parameter retrieves the staged environment variable key-value pairs.
+        is_atomic_commit : bool
+            This parameter determines whether the previous values are restored if the commit fails.
+        removed_key_list : list, optional
+            This parameter retrieves the environment variable keys to remove. The default is ().
 
+        Returns
+        -------
+        None.
+        """
+        with self.__writer_lock:
+            if self.__munch_store is not None:
+                self.__munch_store.update(config_env_dict)
+                for env_key in removed_key_list:
+                    self.__munch_store.pop(env_key)
             else:
-                key_list = (
-                    key_list[1:] if self.__is_remove_xml_first_level else key_list
-                )
-                env_key = convert_naming_case_type(
-                    key_list=key_list,
-                    naming_case_type=self.naming_case_type,
-                    naming_case_join_type=self.naming_case_join_type,
-                )
-                if isinstance(value, dict):
-                    os.environ[env_key] = f'"{value}"'
-                else:
-                    os.environ[env_key] = f"{value}"
+                commit_config_env(config_env_dict=config_env_dict, is_atomic_commit=is_atomic_commit)
+                for env_key in config_env_dict:
+                    self.__value_cache.invalidate(env_key)
+                for env_key in removed_key_list:
+                    os.environ.pop(env_key, None)
+                    self.__value_cache.invalidate(env_key)
+
+            if self.__config_env_snapshot is not None:
+                self.__config_env_snapshot.publish(config_env_dict=config_env_dict, removed_key_list=removed_key_list)
+
+    def __interpolate_config_env(self, config_env_dict: dict, native_value_dict: dict = None) -> dict:
+        """
+        This function replaces the '${KEY}' references of staged key-value pairs with the staged values,
+            or else the values in the 'os.environ' system or the in-memory store of the "munch" client.
+
+        Parameters
+        ----------
+        config_env_dict : dict
+            This parameter retrieves the staged environment variable key-value pairs.
+        native_value_dict : dict, optional
+            This parameter retrieves the parsed values of the staged keys. The values of keys whose references
+                are resolved are removed, since they were parsed before the references were resolved.
+                The default is None.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the key-value pairs with resolved references.
+        """
+        from craftsperson_env.utils.config_interpolator import interpolate_config_env
+
+        if self.__munch_store is not None:
+            return interpolate_config_env(
+                config_env_dict=config_env_dict,
+                get_value_function=lambda env_key: self.__munch_store.get(env_key, None),
+            )
+
+        interpolated_config_env_dict = interpolate_config_env(config_env_dict=config_env_dict,
+                                                              get_value_function=os.environ.get)
+        if native_value_dict and interpolated_config_env_dict is not config_env_dict:
+            # Unchanged values are the same objects in both dicts
+            for env_key in [env_key for env_key in native_value_dict
+                            if interpolated_config_env_dict[env_key] is not config_env_dict[env_key]]:
+                del native_value_dict[env_key]
+        return interpolated_config_env_dict
+
+    def __set_native_values(self, config_env_dict: dict, native_value_dict: dict) -> None:
+        """
+        This function adds the parsed values of committed keys of the "os_env" client to the typed value cache,
+            keyed by the type of each value and validated by the string it was written as. 'get' then returns
+            the parsed value of that type until the key is changed, and parses the string after that.
+
+        Parameters
+        ----------
+        config_env_dict : dict
+            This parameter retrieves the flattened key-value pairs of the config file, as they were written.
+        native_value_dict : dict
+            This parameter retrieves the parsed values of the keys whose values are not strings, or None.
+
+        Returns
+        -------
+        None.
+        """
+        if not native_value_dict or self.__munch_store is not None:
+            return
+
+        value_cache = self.__value_cache
+        for env_key, value in native_value_dict.items():
+            value_cache.set(env_key, type(value), config_env_dict[env_key], value)
+
+    def __commit_loaded_config_env(self, config_env_dict: dict, is_atomic_commit: bool, layer_name: str) -> None:
+        """
+        This function writes the key-value pairs of a loaded config file, or sets them as a config layer.
+
+        Parameters
+        ----------
+        config_env_dict : dict
+            This parameter retrieves the staged environment variable key-value pairs.
+        is_atomic_commit : bool
+            This parameter determines whether the previous values are restored if the commit fails.
+        layer_name : str
+            This parameter specifies the config layer, or None.
+
+        Returns
+        -------
+        None.
+        """
+        if layer_name is None:
+            self.__commit_config_env(config_env_dict=config_env_dict, is_atomic_commit=is_atomic_commit)
+        else:
+            self.layers.set_layer(layer_name=layer_name, config_env_dict=config_env_dict)
+
+    def __get_key_trie(self, naming_case_type: str, naming_case_join_type: str) -> KeyTrie:
+        """
+        This function returns the key trie of a naming case type and join type.
+
+        Parameters
+        ----------
+        naming_case_type : str
+            This parameter specifies the naming case type of the keys.
+        naming_case_join_type : str
+            This parameter specifies the join type of the keys.
+
+        Returns
+        -------
+        key_trie: KeyTrie
+            This returns the key trie.
+        """
+        key_trie = self.__key_trie_dict.get((naming_case_type, naming_case_join_type))
+        if key_trie is None:
+            key_trie = self.__key_trie_dict[(naming_case_type, naming_case_join_type)] = KeyTrie(
+                naming_case_type=naming_case_type, naming_case_join_type=naming_case_join_type
+            )
+        return key_trie
 
     def load_config_file(
         self,
@@ -92,8 +271,17 @@ class CraftsEnvConfig(BaseConfigClass):
         is_change_config_env_format: bool = False,
         config_env_replace_first_value: str = None,
         is_remove_xml_first_level: bool = False,
+        is_stream_xml: bool = False,
+        list_index_type: str = "none",
         extra_config_file_params: dict = {},
-    ):
+        config_cache: ParsedConfigCache = None,
+        is_atomic_commit: bool = False,
+        dry_run: bool = False,
+        is_interpolate: bool = False,
+        stats_callback: Callable = None,
+        is_profile: bool = False,
+        layer_name: str = None,
+    ) -> dict:
         """
         This function processes and uses a config file.
 
@@ -114,16 +302,239 @@ class CraftsEnvConfig(BaseConfigClass):
             This parameter specifies the replacement value for the first occurrence. The default is None.
         is_remove_xml_first_level : bool, optional
             This parameter determines whether to remove the first level. The default value is False.
+        is_stream_xml : bool, optional
+            This parameter determines whether xml files are streamed into environment variable keys without
+                building the whole xmltodict tree, which keeps the memory of large files low. The file is read
+                and parsed twice, first to find the repeated elements, so a streamed load takes about twice the
+                read and parse time of one pass. A list of repeated elements can then follow the keys of siblings
+                between its elements. The default value is False.
+        list_index_type : str, optional
+            This parameter specifies how lists of dicts are flattened, allowing values such as "none" or "index".
+                "none" keeps the whole list as one value. "index" flattens each item under its index,
+                such as 'SERVERS.0.HOST'. The default is "none".
         extra_config_file_params : dict, optional
             This parameter retrieves additional XML or TOML configuration parameters. The default value is {}.
+        config_cache : ParsedConfigCache, optional
+            This parameter specifies the cache directory of flattened config files. A warm start skips
+                reading, parsing and flattening the file. The default is None.
+        is_atomic_commit : bool, optional
+            This parameter determines whether the previous 'os.environ' values are restored
+                if the commit fails. The default value is False.
+        dry_run : bool, optional
+            This parameter determines whether the 'os.environ' system is left untouched. The default value is False.
+        is_interpolate : bool, optional
+            This parameter determines whether '${KEY}' and '${KEY:-default}' references in the values are replaced
+                with the values of the loaded keys or the existing keys before the commit. The default value is False.
+        stats_callback : Callable, optional
+            This parameter retrieves a function that receives the LoadStats of the load, with the read, parse,
+                flatten, convert and commit durations, the key count, the key depth and the bytes read.
+                The default is None.
+        is_profile : bool, optional
+            This parameter determines whether the load runs under cProfile. The 'pstats.Stats' result is stored
+                in the 'profile' attribute of the LoadStats. The default value is False.
+        layer_name : str, optional
+            This parameter specifies the config layer of the file. The key-value pairs replace the layer, or are added
+                as the highest layer, and only the keys that the layers resolve to a new value are written.
+                The default is None, which writes all key-value pairs over the existing values.
 
         Returns
         -------
-        None.
+        config_env_dict: dict
+            This returns the flattened environment variable key-value pairs of the config file.
         """
-        self.checker.check_config_type(file_path=file_path)
+        config_file_params = self.__get_config_file_params(
+            file_path=file_path,
+            root_full_path=root_full_path,
+            naming_case_type=naming_case_type,
+            naming_case_join_type=naming_case_join_type,
+            is_change_config_env_format=is_change_config_env_format,
+            config_env_replace_first_value=config_env_replace_first_value,
+            is_remove_xml_first_level=is_remove_xml_first_level,
+            is_stream_xml=is_stream_xml,
+            list_index_type=list_index_type,
+            extra_config_file_params=extra_config_file_params,
+            config_cache=config_cache,
+        )
+        native_value_dict = None
+        if not dry_run:
+            config_file_params["key_path_dict"] = self.__get_key_trie(
+                naming_case_type=naming_case_type, naming_case_join_type=naming_case_join_type
+            ).key_path_dict
+            if self.__munch_store is None:
+                native_value_dict = config_file_params["native_value_dict"] = {}
+
+        if stats_callback is None and not is_profile:
+            config_env_dict = flatten_config_file(**config_file_params)
+            if is_interpolate:
+                config_env_dict = self.__interpolate_config_env(config_env_dict=config_env_dict,
+                                                                native_value_dict=native_value_dict)
+            if not dry_run:
+                self.__commit_loaded_config_env(config_env_dict=config_env_dict, is_atomic_commit=is_atomic_commit,
+                                                layer_name=layer_name)
+                self.__set_native_values(config_env_dict=config_env_dict, native_value_dict=native_value_dict)
+            return config_env_dict
+
+        stats = LoadStats(file_path=config_file_params["file_path"])
+        if is_profile:
+            import cProfile
+            import pstats
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        try:
+            config_env_dict = flatten_config_file(**config_file_params, stats=stats)
+            if is_interpolate:
+                start_time = time.perf_counter()
+                config_env_dict = self.__interpolate_config_env(config_env_dict=config_env_dict,
+                                                                native_value_dict=native_value_dict)
+                stats.convert_seconds += time.perf_counter() - start_time
+            if not dry_run:
+                start_time = time.perf_counter()
+                self.__commit_loaded_config_env(config_env_dict=config_env_dict, is_atomic_commit=is_atomic_commit,
+                                                layer_name=layer_name)
+                self.__set_native_values(config_env_dict=config_env_dict, native_value_dict=native_value_dict)
+                stats.commit_seconds = time.perf_counter() - start_time
+        finally:
+            if is_profile:
+                profiler.disable()
+                stats.profile = pstats.Stats(profiler)
+
+        if stats_callback is not None:
+            stats_callback(stats)
+
+        return config_env_dict
+
+    def load_config_bytes(
+        self,
+        buffer: Any,
+        config_type: str = None,
+        naming_case_type: str = None,
+        naming_case_join_type: str = "",
+        config_env_replace_first_value: str = None,
+        is_remove_xml_first_level: bool = False,
+        list_index_type: str = "none",
+        extra_config_file_params: dict = {},
+        is_atomic_commit: bool = False,
+        dry_run: bool = False,
+        is_interpolate: bool = False,
+        layer_name: str = None,
+    ) -> dict:
+        """
+        This function processes and uses config content held in memory, such as a config received over a socket,
+            without writing it to a file. Bytes-like content is parsed without copying it first.
+
+        Parameters
+        ----------
+        buffer : Any
+            This parameter retrieves the content as bytes, bytearray, memoryview or str.
+        config_type : str, optional
+            This parameter specifies the config type, allowing values such as "env", "yaml", "json", "xml" or "toml".
+                The default is None, which detects the type from the first lines of the content.
+        The other parameters are the same as the parameters of 'load_config_file'.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the flattened environment variable key-value pairs of the content.
+        """
+        return self.__load_config_source(
+            source=buffer,
+            config_type=config_type,
+            naming_case_type=naming_case_type,
+            naming_case_join_type=naming_case_join_type,
+            config_env_replace_first_value=config_env_replace_first_value,
+            is_remove_xml_first_level=is_remove_xml_first_level,
+            list_index_type=list_index_type,
+            extra_config_file_params=extra_config_file_params,
+            is_atomic_commit=is_atomic_commit,
+            dry_run=dry_run,
+            is_interpolate=is_interpolate,
+            layer_name=layer_name,
+        )
+
+    def load_config_stream(
+        self,
+        stream: Any,
+        config_type: str = None,
+        naming_case_type: str = None,
+        naming_case_join_type: str = "",
+        config_env_replace_first_value: str = None,
+        is_remove_xml_first_level: bool = False,
+        list_index_type: str = "none",
+        extra_config_file_params: dict = {},
+        is_atomic_commit: bool = False,
+        dry_run: bool = False,
+        is_interpolate: bool = False,
+        layer_name: str = None,
+    ) -> dict:
+        """
+        This function processes and uses config content read from a binary or text file-like object,
+            such as 'socket.makefile("rb")', without writing it to a file. Yaml and binary xml streams are parsed
+            while they are read, and env streams line by line. Without a config type, the type is detected from the
+            head of the stream, which is read until it holds 4096 characters or bytes or the whole stream.
+            A stream that cannot seek returns its head again before the rest of its content.
+
+        Parameters
+        ----------
+        stream : Any
+            This parameter retrieves the binary or text file-like object.
+        config_type : str, optional
+            This parameter specifies the config type, allowing values such as "env", "yaml", "json", "xml" or "toml".
+                The default is None, which detects the type from the head of the stream.
+        The other parameters are the same as the parameters of 'load_config_file'.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the flattened environment variable key-value pairs of the content.
+        """
+        return self.__load_config_source(
+            source=stream,
+            config_type=config_type,
+            naming_case_type=naming_case_type,
+            naming_case_join_type=naming_case_join_type,
+            config_env_replace_first_value=config_env_replace_first_value,
+            is_remove_xml_first_level=is_remove_xml_first_level,
+            list_index_type=list_index_type,
+            extra_config_file_params=extra_config_file_params,
+            is_atomic_commit=is_atomic_commit,
+            dry_run=dry_run,
+            is_interpolate=is_interpolate,
+            layer_name=layer_name,
+        )
+
+    def __load_config_source(
+        self,
+        source: Any,
+        config_type: str,
+        naming_case_type: str,
+        naming_case_join_type: str,
+        config_env_replace_first_value: str,
+        is_remove_xml_first_level: bool,
+        list_index_type: str,
+        extra_config_file_params: dict,
+        is_atomic_commit: bool,
+        dry_run: bool,
+        is_interpolate: bool,
+        layer_name: str,
+    ) -> dict:
+        """
+        This function parses, flattens and commits config content of a buffer or a stream.
+
+        Parameters
+        ----------
+        The parameters are the same as the parameters of 'load_config_bytes' and 'load_config_stream'.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the flattened environment variable key-value pairs of the content.
+        """
+        self.checker.check_config_content_type(config_type=config_type)
         self.checker.check_naming_case_type(naming_case_type=naming_case_type)
-        file_path = add_base_path(file_path=file_path, root_full_path=root_full_path)
+        self.checker.check_list_index_type(list_index_type=list_index_type)
+        from craftsperson_env.utils.config_flattener import flatten_config_source
 
         # Set naming case attributes
         self.naming_case_type = naming_case_type
@@ -131,47 +542,695 @@ class CraftsEnvConfig(BaseConfigClass):
         self.__is_remove_xml_first_level = is_remove_xml_first_level
         self.__extra_config_file_params = extra_config_file_params
 
-        if file_path.endswith("env"):
-            self.__is_remove_xml_first_level = False
-            config_dict = self.__load_config_file.load_diff_type_env_config_file(
-                file_path=file_path,
-                config_env_replace_first_value=config_env_replace_first_value,
-                naming_case_join_type=naming_case_join_type,
-            )
-            self.__add_config_env(config_dict)
+        key_path_dict = native_value_dict = None
+        if not dry_run:
+            key_path_dict = self.__get_key_trie(
+                naming_case_type=naming_case_type, naming_case_join_type=naming_case_join_type
+            ).key_path_dict
+            if self.__munch_store is None:
+                native_value_dict = {}
 
-        elif file_path.endswith("yaml"):
-            self.__is_remove_xml_first_level = False
-            config_dict = self.__load_config_file.load_yaml_config_file(
-                file_path=file_path
-            )
-            self.__add_config_env(config_dict)
+        config_env_dict = flatten_config_source(
+            source=source,
+            config_type=config_type,
+            naming_case_type=naming_case_type,
+            naming_case_join_type=naming_case_join_type,
+            config_env_replace_first_value=config_env_replace_first_value,
+            extra_config_file_params=extra_config_file_params,
+            is_native_value=self.__client == "munch",
+            is_remove_xml_first_level=is_remove_xml_first_level,
+            list_index_type=list_index_type,
+            key_path_dict=key_path_dict,
+            native_value_dict=native_value_dict,
+        )
+        if is_interpolate:
+            config_env_dict = self.__interpolate_config_env(config_env_dict=config_env_dict,
+                                                            native_value_dict=native_value_dict)
+        if not dry_run:
+            self.__commit_loaded_config_env(config_env_dict=config_env_dict, is_atomic_commit=is_atomic_commit,
+                                            layer_name=layer_name)
+            self.__set_native_values(config_env_dict=config_env_dict, native_value_dict=native_value_dict)
+        return config_env_dict
 
-        elif file_path.endswith("json"):
-            self.__is_remove_xml_first_level = False
-            config_dict = self.__load_config_file.load_json_config_file(
-                file_path=file_path
-            )
-            self.__add_config_env(config_dict)
+    def __get_config_file_params_list(self, file_path_list: list, config_file_params: dict) -> list:
+        """
+        This function checks the parameters of several config files and returns the keyword arguments
+            of 'flatten_config_file' of each file.
+
+        Parameters
+        ----------
+        file_path_list : list
+            This parameter retrieves file location paths. Each item is either a path or a dict of
+                'load_config_file' parameters that override the shared parameters for that file.
+        config_file_params : dict
+            This parameter retrieves the shared 'load_config_file' parameters.
 
-        elif file_path.endswith("xml"):
-            self.__is_remove_xml_first_level = False
-            config_dict = self.__load_config_file.load_xml_config_file(
-                file_path=file_path
+        Returns
+        -------
+        config_file_params_list: list
+            This returns the keyword arguments of 'flatten_config_file' of each file in the declared order.
+        """
+        config_file_params_list = []
+        for file_path in file_path_list:
+            file_params = {**config_file_params, "file_path": file_path} if isinstance(file_path, str) \
+                else {**config_file_params, **file_path}
+            config_file_params_list.append(self.__get_config_file_params(**file_params))
+        return config_file_params_list
+
+    def __commit_config_files(
+        self,
+        config_file_params_list: list,
+        result_list: list,
+        is_atomic_commit: bool,
+        dry_run: bool,
+        is_interpolate: bool,
+        stats_callback: Callable,
+    ) -> dict:
+        """
+        This function merges flattened config files in the declared order and commits them in one step.
+
+        Parameters
+        ----------
+        config_file_params_list : list
+            This parameter retrieves the keyword arguments of 'flatten_config_file' of each file.
+        result_list : list
+            This parameter retrieves the result of 'timed_flatten_config_file' of each file.
+        The other parameters are the same as the parameters of 'load_config_files'.
+
+        Returns
+        -------
+        load_result: dict
+            This returns the load result of 'load_config_files'.
+        """
+        config_env_dict = {}
+        file_timing_list = []
+        stats_list = []
+        for file_params, (file_config_env_dict, seconds, stats, _, _) in zip(config_file_params_list, result_list):
+            config_env_dict.update(file_config_env_dict)
+            file_timing_list.append((file_params["file_path"], seconds))
+            stats_list.append(stats)
+
+        if is_interpolate:
+            # References are resolved across all files after the merge
+            config_env_dict = self.__interpolate_config_env(config_env_dict=config_env_dict)
+
+        if not dry_run:
+            start_time = time.perf_counter()
+            self.__commit_config_env(config_env_dict=config_env_dict, is_atomic_commit=is_atomic_commit)
+            commit_seconds = time.perf_counter() - start_time
+
+            for file_params, (file_config_env_dict, _, _, key_path_dict, native_value_dict) in zip(
+                config_file_params_list, result_list
+            ):
+                self.__get_key_trie(
+                    naming_case_type=file_params["naming_case_type"],
+                    naming_case_join_type=file_params["naming_case_join_type"],
+                ).key_path_dict.update(key_path_dict)
+                self.__set_native_values(config_env_dict=file_config_env_dict, native_value_dict=native_value_dict)
+
+        load_result = {"config_env_dict": config_env_dict, "file_timing_list": file_timing_list}
+        if stats_callback is None:
+            return load_result
+
+        for stats in stats_list:
+            stats.commit_seconds = 0.0 if dry_run else commit_seconds
+            stats_callback(stats)
+
+        load_result["stats_list"] = stats_list
+        return load_result
+
+    def __flatten_config_files(
+        self,
+        file_path_list: list,
+        executor_type: str,
+        max_workers: int,
+        is_collect_stats: bool,
+        config_file_params: dict,
+    ) -> tuple:
+        """
+        This function reads, parses and flattens several config files concurrently without committing them.
+
+        Parameters
+        ----------
+        The parameters are the same as the parameters of 'load_config_files'.
+
+        Returns
+        -------
+        config_file_params_list: list
+            This returns the keyword arguments of 'flatten_config_file' of each file in the declared order.
+        result_list: list
+            This returns the result of 'timed_flatten_config_file' of each file in the declared order.
+        """
+        self.checker.check_executor_type(executor_type=executor_type)
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        from itertools import repeat
+
+        config_file_params_list = self.__get_config_file_params_list(
+            file_path_list=file_path_list, config_file_params=config_file_params
+        )
+
+        executor_class = ThreadPoolExecutor if executor_type == "thread" else ProcessPoolExecutor
+        with executor_class(max_workers=max_workers) as executor:
+            result_list = list(executor.map(
+                timed_flatten_config_file, config_file_params_list, repeat(is_collect_stats)
+            ))
+
+        return config_file_params_list, result_list
+
+    def load_config_files(
+        self,
+        file_path_list: list,
+        executor_type: str = "thread",
+        max_workers: int = None,
+        is_atomic_commit: bool = False,
+        dry_run: bool = False,
+        is_interpolate: bool = False,
+        stats_callback: Callable = None,
+        **config_file_params,
+    ) -> dict:
+        """
+        This function reads and parses several config files concurrently and applies them in the declared order,
+            so a later file overrides the keys of an earlier file.
+
+        Parameters
+        ----------
+        file_path_list : list
+            This parameter retrieves file location paths. Each item is either a path or a dict of
+                'load_config_file' parameters that override the shared parameters for that file.
+        executor_type : str, optional
+            This parameter specifies the executor type, allowing values such as "thread" or "process".
+                The process executor suits CPU-heavy yaml or xml files. The default is "thread".
+        max_workers : int, optional
+            This parameter specifies the maximum number of workers. The default is None.
+        is_atomic_commit : bool, optional
+            This parameter determines whether the previous 'os.environ' values are restored
+                if the commit fails. The default value is False.
+        dry_run : bool, optional
+            This parameter determines whether the 'os.environ' system is left untouched. The default value is False.
+        is_interpolate : bool, optional
+            This parameter determines whether '${KEY}' and '${KEY:-default}' references in the values are replaced
+                after the files are merged. The default value is False.
+        stats_callback : Callable, optional
+            This parameter retrieves a function that receives the LoadStats of each file in the declared order.
+                The commit duration of every file is the duration of the shared commit. The default is None.
+        **config_file_params
+            These parameters retrieve the shared 'load_config_file' parameters, such as root_full_path,
+                naming_case_type, naming_case_join_type and config_cache.
+
+        Returns
+        -------
+        load_result: dict
+            This returns the merged key-value pairs as 'config_env_dict' and the duration of each file
+                as 'file_timing_list', a list of (file_path, seconds) tuples in the declared order.
+                If 'stats_callback' is given, the LoadStats of each file are also returned as 'stats_list'.
+        """
+        config_file_params_list, result_list = self.__flatten_config_files(
+            file_path_list=file_path_list,
+            executor_type=executor_type,
+            max_workers=max_workers,
+            is_collect_stats=stats_callback is not None,
+            config_file_params=config_file_params,
+        )
+
+        return self.__commit_config_files(
+            config_file_params_list=config_file_params_list,
+            result_list=result_list,
+            is_atomic_commit=is_atomic_commit,
+            dry_run=dry_run,
+            is_interpolate=is_interpolate,
+            stats_callback=stats_callback,
+        )
+
+    async def aload_config_file(
+        self,
+        file_path: str,
+        executor: "Executor" = None,
+        is_atomic_commit: bool = False,
+        dry_run: bool = False,
+        is_interpolate: bool = False,
+        stats_callback: Callable = None,
+        **config_file_params,
+    ) -> dict:
+        """
+        This function processes and uses a config file without blocking the event loop. The file is read, parsed
+            and flattened on an executor, and the result is committed on the event loop in one step,
+            so a cancelled load commits nothing.
+
+        Parameters
+        ----------
+        file_path : str
+            This parameter specifies the file location path.
+        executor : Executor, optional
+            This parameter retrieves the executor that reads and parses the file. A process executor suits
+                CPU-heavy yaml or xml files. The default is None, which uses the default executor of the event loop.
+        is_atomic_commit : bool, optional
+            This parameter determines whether the previous 'os.environ' values are restored
+                if the commit fails. The default value is False.
+        dry_run : bool, optional
+            This parameter determines whether the 'os.environ' system is left untouched. The default value is False.
+        is_interpolate : bool, optional
+            This parameter determines whether '${KEY}' and '${KEY:-default}' references in the values are replaced
+                after the files are merged. The default value is False.
+        stats_callback : Callable, optional
+            This parameter retrieves a function that receives the LoadStats of the load. The default is None.
+        **config_file_params
+            These parameters retrieve the other 'load_config_file' parameters, such as root_full_path,
+                naming_case_type, naming_case_join_type and config_cache.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the flattened environment variable key-value pairs of the config file.
+        """
+        load_result = await self.aload_config_files(
+            file_path_list=[file_path],
+            executor=executor,
+            is_atomic_commit=is_atomic_commit,
+            dry_run=dry_run,
+            is_interpolate=is_interpolate,
+            stats_callback=stats_callback,
+            **config_file_params,
+        )
+        return load_result["config_env_dict"]
+
+    async def aload_config_files(
+        self,
+        file_path_list: list,
+        executor: "Executor" = None,
+        is_atomic_commit: bool = False,
+        dry_run: bool = False,
+        is_interpolate: bool = False,
+        stats_callback: Callable = None,
+        **config_file_params,
+    ) -> dict:
+        """
+        This function reads and parses several config files concurrently on an executor without blocking
+            the event loop, and commits them on the event loop in one step in the declared order,
+            so a later file overrides the keys of an earlier file and a cancelled load commits nothing.
+
+        Parameters
+        ----------
+        file_path_list : list
+            This parameter retrieves file location paths. Each item is either a path or a dict of
+                'load_config_file' parameters that override the shared parameters for that file.
+        executor : Executor, optional
+            This parameter retrieves the executor that reads and parses the files. The default is None,
+                which uses the default executor of the event loop.
+        is_atomic_commit : bool, optional
+            This parameter determines whether the previous 'os.environ' values are restored
+                if the commit fails. The default value is False.
+        dry_run : bool, optional
+            This parameter determines whether the 'os.environ' system is left untouched. The default value is False.
+        is_interpolate : bool, optional
+            This parameter determines whether '${KEY}' and '${KEY:-default}' references in the values are replaced
+                after the files are merged. The default value is False.
+        stats_callback : Callable, optional
+            This parameter retrieves a function that receives the LoadStats of each file in the declared order.
+                The default is None.
+        **config_file_params
+            These parameters retrieve the shared 'load_config_file' parameters.
+
+        Returns
+        -------
+        load_result: dict
+            This returns the same load result as 'load_config_files'.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        config_file_params_list = self.__get_config_file_params_list(
+            file_path_list=file_path_list, config_file_params=config_file_params
+        )
+        result_list = await asyncio.gather(*(
+            loop.run_in_executor(executor, timed_flatten_config_file, file_params, stats_callback is not None)
+            for file_params in config_file_params_list
+        ))
+
+        return self.__commit_config_files(
+            config_file_params_list=config_file_params_list,
+            result_list=result_list,
+            is_atomic_commit=is_atomic_commit,
+            dry_run=dry_run,
+            is_interpolate=is_interpolate,
+            stats_callback=stats_callback,
+        )
+
+    def build_config_snapshot(
+        self,
+        snapshot_path: str,
+        file_path_list: list,
+        executor_type: str = "thread",
+        max_workers: int = None,
+        is_interpolate: bool = False,
+        **config_file_params,
+    ) -> dict:
+        """
+        This function flattens several config files in the declared order and writes the merged key-value pairs
+            to a snapshot file, without changing the 'os.environ' system. Worker processes load the snapshot
+            with 'load_config_snapshot' instead of parsing the files again.
+
+        Parameters
+        ----------
+        snapshot_path : str
+            This parameter specifies the snapshot file path. The file is replaced atomically.
+        file_path_list : list
+            This parameter retrieves file location paths in override order. Each item is either a path or a dict of
+                'load_config_file' parameters that override the shared parameters for that file.
+        executor_type : str, optional
+            This parameter specifies the executor type, allowing values such as "thread" or "process".
+                The default is "thread".
+        max_workers : int, optional
+            This parameter specifies the maximum number of workers. The default is None.
+        is_interpolate : bool, optional
+            This parameter determines whether '${KEY}' and '${KEY:-default}' references in the values are replaced
+                when the snapshot is built, with the environment of the building process. The default value is False.
+        **config_file_params
+            These parameters retrieve the shared 'load_config_file' parameters, such as root_full_path,
+                naming_case_type, naming_case_join_type and config_cache.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the merged key-value pairs written to the snapshot file.
+        """
+        from craftsperson_env.utils.config_snapshot import write_config_snapshot
+
+        config_file_params_list, result_list = self.__flatten_config_files(
+            file_path_list=file_path_list,
+            executor_type=executor_type,
+            max_workers=max_workers,
+            is_collect_stats=False,
+            config_file_params=config_file_params,
+        )
+
+        config_env_dict = {}
+        key_path_group_dict = {}
+        for file_params, (file_config_env_dict, _, _, key_path_dict, _) in zip(config_file_params_list, result_list):
+            config_env_dict.update(file_config_env_dict)
+            key_path_group_dict.setdefault(
+                (file_params["naming_case_type"], file_params["naming_case_join_type"]), {}
+            ).update(key_path_dict)
+
+        if is_interpolate:
+            config_env_dict = self.__interpolate_config_env(config_env_dict=config_env_dict)
+
+        write_config_snapshot(
+            snapshot_path=snapshot_path,
+            config_env_dict=config_env_dict,
+            key_path_group_list=[
+                (naming_case_type, naming_case_join_type, key_path_dict)
+                for (naming_case_type, naming_case_join_type), key_path_dict in key_path_group_dict.items()
+            ],
+        )
+        return config_env_dict
+
+    def build_subprocess_env(
+        self,
+        file_path_list: list,
+        base_env: "Mapping" = None,
+        executor_type: str = "thread",
+        max_workers: int = None,
+        is_interpolate: bool = False,
+        **config_file_params,
+    ) -> "SubprocessEnv":
+        """
+        This function flattens several config files in the declared order into an immutable environment for
+            child processes, without changing the 'os.environ' system. The environment can be passed as 'env' to
+            'subprocess' or 'os.posix_spawn' for every child, and its byte form is encoded only once.
+
+        Parameters
+        ----------
+        file_path_list : list
+            This parameter retrieves file location paths in override order. Each item is either a path or a dict of
+                'load_config_file' parameters that override the shared parameters for that file.
+        base_env : Mapping, optional
+            This parameter retrieves the environment below the config, such as 'os.environ'.
+                The default is None, which means only the config.
+        executor_type : str, optional
+            This parameter specifies the executor type, allowing values such as "thread" or "process".
+                The default is "thread".
+        max_workers : int, optional
+            This parameter specifies the maximum number of workers. The default is None.
+        is_interpolate : bool, optional
+            This parameter determines whether '${KEY}' and '${KEY:-default}' references in the values are replaced
+                with the config values or else the values of the base environment. The default value is False.
+        **config_file_params
+            These parameters retrieve the shared 'load_config_file' parameters, such as root_full_path,
+                naming_case_type, naming_case_join_type and config_cache.
+
+        Returns
+        -------
+        subprocess_env: SubprocessEnv
+            This returns the read-only environment variable key-value pairs.
+        """
+        from craftsperson_env.utils.subprocess_env import SubprocessEnv
+
+        _, result_list = self.__flatten_config_files(
+            file_path_list=file_path_list,
+            executor_type=executor_type,
+            max_workers=max_workers,
+            is_collect_stats=False,
+            config_file_params=config_file_params,
+        )
+
+        config_env_dict = {}
+        for file_config_env_dict, _, _, _, _ in result_list:
+            config_env_dict.update(file_config_env_dict)
+
+        if is_interpolate:
+            from craftsperson_env.utils.config_interpolator import interpolate_config_env
+
+            config_env_dict = interpolate_config_env(
+                config_env_dict=config_env_dict,
+                get_value_function=(lambda env_key: None) if base_env is None else base_env.get,
             )
-            self.__add_config_env(config_dict)
 
-        elif file_path.endswith("toml"):
-            self.__is_remove_xml_first_level = False
-            config_dict = self.__load_config_file.load_toml_config_file(
-                file_path=file_path
+        return SubprocessEnv(config_env_dict=config_env_dict, base_env=base_env)
+
+    def load_config_snapshot(
+        self,
+        snapshot_path: str,
+        is_atomic_commit: bool = False,
+        is_verify_checksum: bool = True,
+    ) -> "ConfigSnapshot":
+        """
+        This function maps a snapshot file built by 'build_config_snapshot' and writes its key-value pairs to the
+            'os.environ' system, or to the in-memory store of the "munch" client as strings. Nothing is parsed,
+            and processes that map the same file share its pages.
+
+        Parameters
+        ----------
+        snapshot_path : str
+            This parameter specifies the snapshot file path.
+        is_atomic_commit : bool, optional
+            This parameter determines whether the previous 'os.environ' values are restored
+                if the commit fails. The default value is False.
+        is_verify_checksum : bool, optional
+            This parameter determines whether the checksum of the snapshot file is verified. The default value is True.
+
+        Returns
+        -------
+        config_snapshot: ConfigSnapshot
+            This returns the mapped snapshot, a read-only mapping of its key-value pairs. Call 'close' to unmap it.
+        """
+        from craftsperson_env.utils.config_snapshot import ConfigSnapshot
+
+        config_snapshot = ConfigSnapshot(snapshot_path=snapshot_path, is_verify_checksum=is_verify_checksum)
+        self.__commit_config_env(config_env_dict=config_snapshot.to_dict(), is_atomic_commit=is_atomic_commit)
+
+        for naming_case_type, naming_case_join_type, key_path_dict in config_snapshot.key_path_group_list:
+            self.__get_key_trie(
+                naming_case_type=naming_case_type, naming_case_join_type=naming_case_join_type
+            ).key_path_dict.update(key_path_dict)
+            # Subtree queries use the naming case of the snapshot like the naming case of the last load
+            self.naming_case_type = naming_case_type
+            self.naming_case_join_type = naming_case_join_type
+
+        return config_snapshot
+
+    def __apply_config_env_diff(self, config_env_diff: dict) -> None:
+        """
+        This function sets, updates or unsets only the changed keys in the 'os.environ' system or the munch store.
+
+        Parameters
+        ----------
+        config_env_diff : dict
+            This parameter retrieves the 'added', 'updated' and 'removed' keys of a config env diff.
+
+        Returns
+        -------
+        None.
+        """
+        config_env_dict = dict(config_env_diff["added"])
+        config_env_dict.update((key, value) for key, (_, value) in config_env_diff["updated"].items())
+        self.__commit_config_env(config_env_dict=config_env_dict, is_atomic_commit=False,
+                                 removed_key_list=list(config_env_diff["removed"]))
+
+        for env_key in config_env_diff["removed"]:
+            for key_trie in self.__key_trie_dict.values():
+                key_trie.remove(env_key)
+
+    def watch_config_files(
+        self,
+        file_path_list: list,
+        callback: Callable = None,
+        poll_interval: float = 1.0,
+        debounce_seconds: float = 0.1,
+        is_use_inotify: bool = True,
+        is_interpolate: bool = False,
+        **config_file_params,
+    ) -> "ConfigWatcher":
+        """
+        This function loads config files and starts a watcher that applies only the changed keys
+            when a file changes. Keys removed from the files are removed from the 'os.environ' system.
+
+        Parameters
+        ----------
+        file_path_list : list
+            This parameter retrieves file location paths in override order. Each item is either a path or a dict of
+                'load_config_file' parameters that override the shared parameters for that file.
+        callback : Callable, optional
+            This parameter retrieves a function that receives the config env diff of each reload. The default is None.
+        poll_interval : float, optional
+            This parameter specifies the seconds between two checks of the files. The default is 1.0.
+        debounce_seconds : float, optional
+            This parameter specifies the seconds without changes before a reload. The default is 0.1.
+        is_use_inotify : bool, optional
+            This parameter determines whether inotify is used where available. The default value is True.
+        is_interpolate : bool, optional
+            This parameter determines whether '${KEY}' and '${KEY:-default}' references in the values are replaced
+                after the files are merged, on each reload. The default value is False.
+        **config_file_params
+            These parameters retrieve the shared 'load_config_file' parameters.
+
+        Returns
+        -------
+        watcher: ConfigWatcher
+            This returns the started watcher. Call 'stop' to stop it.
+        """
+        from craftsperson_env.utils.config_watcher import ConfigWatcher
+
+        config_file_params_list = self.__get_config_file_params_list(
+            file_path_list=file_path_list, config_file_params=config_file_params
+        )
+        for file_params in config_file_params_list:
+            # Reloaded key paths are indexed as well
+            file_params["key_path_dict"] = self.__get_key_trie(
+                naming_case_type=file_params["naming_case_type"],
+                naming_case_join_type=file_params["naming_case_join_type"],
+            ).key_path_dict
+
+        watcher = ConfigWatcher(
+            config_file_params_list=config_file_params_list,
+            apply_function=self.__apply_config_env_diff,
+            poll_interval=poll_interval,
+            debounce_seconds=debounce_seconds,
+            is_use_inotify=is_use_inotify,
+            interpolate_function=self.__interpolate_config_env if is_interpolate else None,
+        )
+        self.__commit_config_env(config_env_dict=watcher.config_env_dict, is_atomic_commit=False)
+
+        if callback is not None:
+            watcher.add_callback(callback)
+
+        return watcher.start()
+
+    @property
+    def layers(self) -> "ConfigLayers":
+        """
+        This function returns the config layers, such as defaults, shared, region and host files. A key is supplied
+            by the highest enabled layer with the key, and enabling, disabling, moving or removing a layer writes
+            only the keys that change, without reading any file again. The first call records the 'os.environ'
+            system for 'add_environ_layer', and for the "os_env" client a key that no enabled layer supplies
+            returns to its recorded value, or is removed.
+
+        Returns
+        -------
+        layers: ConfigLayers
+            This returns the config layers.
+        """
+        if self.__config_layers is None:
+            from craftsperson_env.utils.config_layers import ConfigLayers
+
+            self.__environ_layer_dict = dict(os.environ)
+            self.__config_layers = ConfigLayers(
+                apply_function=self.__apply_config_env_diff,
+                base_config_env_dict=self.__environ_layer_dict if self.__munch_store is None else None,
             )
-            self.__add_config_env(config_dict)
+        return self.__config_layers
 
-    @staticmethod
-    def get(key: str, value_type: Any = str, default: Any = None) -> Any:
+    def add_environ_layer(self, layer_name: str = "environ", position: int = None) -> dict:
         """
-        This function retrieves the value associated with the key from the 'os.environ' system.
+        This function adds the 'os.environ' system as a config layer, as it was before any layer was written.
+            As the highest layer, the real environment overrides the values of the config files.
+
+        Parameters
+        ----------
+        layer_name : str, optional
+            This parameter specifies the layer name. The default is "environ".
+        position : int, optional
+            This parameter specifies the position of the layer in the 'list.insert' style. The default is None,
+                which adds it as the highest layer.
+
+        Returns
+        -------
+        config_env_diff: dict
+            This returns the applied config env diff.
+        """
+        config_layers = self.layers
+        return config_layers.set_layer(layer_name=layer_name, config_env_dict=self.__environ_layer_dict,
+                                       position=position)
+
+    @property
+    def store(self) -> MunchStore:
+        """
+        This function returns the in-memory store of the "munch" client. Its values can be read with attribute access,
+            such as 'config.store.APPLICATION.NAME' when the naming case join type is ".".
+
+        Returns
+        -------
+        store: MunchStore
+            This returns the store, or None for the "os_env" client.
+        """
+        return self.__munch_store
+
+    @property
+    def snapshot(self) -> "MappingProxyType":
+        """
+        This function returns the read-only snapshot of the committed keys. A reader that takes the snapshot once
+            sees the keys of one commit, even while another thread reloads the config.
+
+        Returns
+        -------
+        snapshot: MappingProxyType
+            This returns the environment variable key-value pairs, or None if 'is_snapshot_read' is False.
+        """
+        if self.__config_env_snapshot is None:
+            return None
+        return self.__config_env_snapshot.mapping
+
+    @property
+    def snapshot_version(self) -> int:
+        """
+        This function returns the version of the snapshot, which grows by one with each commit.
+
+        Returns
+        -------
+        snapshot_version: int
+            This returns the version, or None if 'is_snapshot_read' is False.
+        """
+        if self.__config_env_snapshot is None:
+            return None
+        return self.__config_env_snapshot.version
+
+    @DefaultInstanceMethod
+    def get(self, key: str, value_type: Any = str, default: Any = None) -> Any:
+        """
+        This function retrieves the value associated with the key from the 'os.environ' system,
+            or from the in-memory store of the "munch" client. 'CraftsEnvConfig.get' reads the 'os.environ'
+            system through a default "os_env" instance.
+        Parsed values are cached per (key, value_type) until the raw string of the key changes,
+            and each call returns its own copy of cached dict and list values.
 
         Parameters
         ----------
@@ -189,59 +1248,175 @@ class CraftsEnvConfig(BaseConfigClass):
         value: Any
             This returns the value of the given environment variable key with the specified type.
         """
-        value = os.getenv(key, None)
+        if self.__munch_store is not None:
+            return self.__get_munch_value(key=key, value_type=value_type, default=default)
+
+        if self.__config_env_snapshot is not None:
+            value = self.__config_env_snapshot.mapping.get(key, None)
+            if value is None:
+                value = os.getenv(key, None)
+        else:
+            value = os.getenv(key, None)
 
         # Return default if key not found
         if value is None:
             return default
 
-        # Type conversion based on value_type
-        if value_type == dict:
-            try:
-                # Handle both single and double quotes in JSON strings
-                json_value = value.strip().strip('"').strip("'")
-                return json.loads(json_value.replace("'", '"'))
-            except (json.JSONDecodeError, AttributeError):
-                return default
-
-        elif value_type == float:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return default
-
-        elif value_type == int:
-            try:
-                return int(float(value))  # Handle "2.0" -> 2
-            except (ValueError, TypeError):
-                return default
-
-        elif value_type == bool:
-            if isinstance(value, bool):
-                return value
-            return str(value).lower() in ("true", "1", "yes")
-
-        elif value_type == list:
-            try:
-                json_value = value.strip().strip('"').strip("'")
-                return json.loads(json_value.replace("'", '"'))
-            except (json.JSONDecodeError, AttributeError):
-                # Fallback: split by comma
-                return [item.strip() for item in value.split(",")]
-
-        elif value_type == str:
-            return str(value)
-
-        # For any other type, try direct conversion
-        try:
-            return value_type(value)
-        except (ValueError, TypeError):
+        typed_value = self.__value_cache.get(key, value_type, value)
+        if typed_value is CACHE_MISS:
+            typed_value = convert_value(value, value_type)
+            self.__value_cache.set(key, value_type, value, typed_value)
+
+        return default if typed_value is CONVERSION_FAILED else typed_value
+
+    def __get_munch_value(self, key: str, value_type: Any, default: Any) -> Any:
+        """
+        This function retrieves a native value from the in-memory store of the "munch" client.
+            Values that already have the requested type are returned without conversion.
+
+        Parameters
+        ----------
+        key: str
+            This parameter retrieves the environment variable key or dotted key.
+        value_type: Any
+            This parameter accepts value types such as int, str, float, list, dict, bool and others.
+        default: Any
+            This parameter retrieves the default value if the key is not found.
+
+        Returns
+        -------
+        value: Any
+            This returns the value of the given key with the specified type.
+        """
+        value = MUNCH_MISSING
+        if self.__config_env_snapshot is not None:
+            value = self.__config_env_snapshot.mapping.get(key, MUNCH_MISSING)
+        if value is MUNCH_MISSING:
+            # Dotted key prefixes return subtrees of the store
+            value = self.__munch_store.get(key, MUNCH_MISSING)
+
+        if value is MUNCH_MISSING or value is None:
             return default
 
-    @staticmethod
-    def set(key: str, value: str) -> None:
+        if is_value_of_type(value, value_type):
+            return value
+
+        if value_type in (int, float) and isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value_type(value)
+
+        if not isinstance(value, str):
+            value = stringify_config_value(value)
+
+        typed_value = convert_value(value, value_type)
+        return default if typed_value is CONVERSION_FAILED else typed_value
+
+    def keys_under(self, prefix: str, naming_case_type: str = None, naming_case_join_type: str = None) -> list:
+        """
+        This function returns the loaded environment variable keys under a key path prefix, in time proportional
+            to the size of the subtree instead of the whole environment.
+
+        Parameters
+        ----------
+        prefix: str
+            This parameter specifies the key path prefix in the naming case of the loaded keys,
+                such as 'APPLICATION.OPTIONS'. An empty prefix selects every loaded key.
+        naming_case_type: str, optional
+            This parameter specifies the naming case type of the loaded keys.
+                The default is None, which uses the naming case type of the last load.
+        naming_case_join_type: str, optional
+            This parameter specifies the join type of the loaded keys.
+                The default is None, which uses the join type of the last load.
+
+        Returns
+        -------
+        env_key_list: list
+            This returns the environment variable keys.
+        """
+        key_trie = self.__get_key_trie(
+            naming_case_type=naming_case_type if naming_case_type is not None else self.naming_case_type,
+            naming_case_join_type=(naming_case_join_type if naming_case_join_type is not None
+                                   else self.naming_case_join_type),
+        )
+        if self.__config_env_snapshot is not None:
+            store = self.__config_env_snapshot.mapping
+        else:
+            store = self.__munch_store if self.__munch_store is not None else os.environ
+        return key_trie.keys_under(prefix=prefix, is_key_function=store.__contains__)
+
+    def get_prefix(self, prefix: str, naming_case_type: str = None, naming_case_join_type: str = None) -> dict:
+        """
+        This function rebuilds the nested dict of the loaded keys under a key path prefix, in time proportional
+            to the size of the subtree instead of the whole environment.
+
+        Parameters
+        ----------
+        prefix: str
+            This parameter specifies the key path prefix in the naming case of the loaded keys,
+                such as 'APPLICATION.OPTIONS'. An empty prefix selects every loaded key.
+        naming_case_type: str, optional
+            This parameter specifies the naming case type of the loaded keys.
+                The default is None, which uses the naming case type of the last load.
+        naming_case_join_type: str, optional
+            This parameter specifies the join type of the loaded keys.
+                The default is None, which uses the join type of the last load.
+
+        Returns
+        -------
+        config_dict: dict
+            This returns the nested dict with the original key names and the current values.
+        """
+        key_trie = self.__get_key_trie(
+            naming_case_type=naming_case_type if naming_case_type is not None else self.naming_case_type,
+            naming_case_join_type=(naming_case_join_type if naming_case_join_type is not None
+                                   else self.naming_case_join_type),
+        )
+        if self.__config_env_snapshot is not None:
+            # The values of one snapshot are read, so the subtree is never half-applied
+            return key_trie.get_prefix(prefix=prefix, get_value_function=self.__config_env_snapshot.mapping.get)
+        if self.__munch_store is not None:
+            return key_trie.get_prefix(prefix=prefix, get_value_function=self.__munch_store.get,
+                                       missing_value=MUNCH_MISSING)
+        return key_trie.get_prefix(prefix=prefix, get_value_function=os.environ.get)
+
+    def load_schema(self, schema_class: type, prefix: str = "") -> "SlotsConfig":
+        """
+        This function fills a config object of a typed config class in one pass over its fields, instead of
+            one 'get' call per field. The class is compiled once, and every missing or invalid field is
+            reported together in one AssertionError.
+
+        Parameters
+        ----------
+        schema_class: type
+            This parameter retrieves a dataclass or a class with annotated fields, such as int, list or
+                Optional[int]. The environment variable key of a field is the 'env_key' of its dataclass field
+                metadata, or else the prefix and the upper field name. Fields with a default may be missing.
+        prefix: str, optional
+            This parameter specifies the prefix of the environment variable keys. The default is "".
+
+        Returns
+        -------
+        config: SlotsConfig
+            This returns the config object with one slot per field.
+        """
+        from craftsperson_env.utils.config_schema import compile_config_schema
+
+        compiled_config_schema = compile_config_schema(schema_class=schema_class, prefix=prefix)
+        if self.__config_env_snapshot is None:
+            return compiled_config_schema.load(environ=self.__munch_store)
+
+        # The fields are read from one snapshot, so the config object is never half-applied
+        from collections import ChainMap
+
+        environ = self.__config_env_snapshot.mapping
+        return compiled_config_schema.load(environ=environ if self.__munch_store is not None
+                                           else ChainMap(environ, os.environ))
+
+    @DefaultInstanceMethod
+    def set(self, key: str, value: Any) -> None:
         """
-        This function sets a key-value pair in the 'os.environ' system.
+        This function sets a key-value pair in the 'os.environ' system, or in the in-memory store of the "munch" client,
+            which keeps the value without converting it to a string. 'CraftsEnvConfig.set' writes to the 'os.environ'
+            system through a default "os_env" instance.
 
         Parameters
         ----------
@@ -255,4 +1430,67 @@ class CraftsEnvConfig(BaseConfigClass):
         -------
         None.
         """
-        os.environ[key] = str(value)
+        self.__commit_config_env(
+            config_env_dict={key: value if self.__munch_store is not None else str(value)},
+            is_atomic_commit=False,
+        )
+
+    @staticmethod
+    def cache_info() -> dict:
+        """
+        This function returns the counters of the typed value cache used by 'get'.
+
+        Returns
+        -------
+        cache_info: dict
+            This returns the hits, misses, number of cached (key, value_type) entries and the max size.
+        """
+        return CraftsEnvConfig.__value_cache.cache_info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        This function removes all values from the typed value cache used by 'get'.
+
+        Returns
+        -------
+        None.
+        """
+        CraftsEnvConfig.__value_cache.clear()
+
+    @staticmethod
+    def get_parser_backend(file_type: str) -> str:
+        """
+        This function returns the parser backend used for yaml, json or toml files.
+
+        Parameters
+        ----------
+        file_type: str
+            This parameter specifies the file type, allowing values such as "yaml", "json" or "toml".
+
+        Returns
+        -------
+        parser_backend: str
+            This returns the forced parser backend, or else the fastest installed one.
+        """
+        return get_parser_backend(file_type=file_type)
+
+    @staticmethod
+    def set_parser_backend(file_type: str, parser_backend: str = None) -> None:
+        """
+        This function forces the parser backend used for yaml, json or toml files.
+
+        Parameters
+        ----------
+        file_type: str
+            This parameter specifies the file type, allowing values such as "yaml", "json" or "toml".
+        parser_backend: str, optional
+            This parameter specifies the parser backend, allowing values such as "libyaml" or "pyyaml" for yaml,
+                "orjson" or "json" for json and "tomllib" or "toml" for toml. The default is None, which selects
+                the fastest installed one.
+
+        Returns
+        -------
+        None.
+        """
+        set_parser_backend(file_type=file_type, parser_backend=parser_backend)
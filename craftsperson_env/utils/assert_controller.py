@@ -1,4 +1,6 @@
-from craftsperson_env.utils.contraster import CONFIG_FILE_TYPE_LIST, NAMING_CASE_LIST, OTHER_CONFIG_NAME_TYPE_LIST
+from craftsperson_env.utils.contraster import (CONFIG_FILE_TYPE_LIST, ENV_CLIENT_METHOD_LIST, EXECUTOR_TYPE_LIST,
+                                               LIST_INDEX_TYPE_LIST, NAMING_CASE_LIST, OTHER_CONFIG_NAME_TYPE_LIST,
+                                               PARSER_BACKEND_DICT)
 
 
 class Checker:
@@ -29,6 +31,50 @@ class Checker:
         self.__checker(condition_result=is_config_file_true,
                        error_message=error_message)
 
+    def check_config_content_type(self, config_type: str) -> None:
+        """
+        This function checks the config type of config content without a file path.
+
+        Parameters
+        ----------
+        config_type: str
+            This parameter accepts a config type such as env, yaml, json, xml, or toml, or None to detect it.
+
+        Returns
+        -------
+        None.
+        """
+        is_config_type_true = config_type is None or config_type in CONFIG_FILE_TYPE_LIST
+
+        error_message = (f"Enter a config type that is not valid. Approved config types include: "
+                         f"{', '.join(CONFIG_FILE_TYPE_LIST)}")
+
+        self.__checker(condition_result=is_config_type_true,
+                       error_message=error_message)
+
+    def check_config_content(self, config_dict, config_type: str) -> None:
+        """
+        This function checks that the top level of parsed config content is a mapping of keys.
+
+        Parameters
+        ----------
+        config_dict: Any
+            This parameter retrieves the parsed config content, or None if the content is empty.
+        config_type: str
+            This parameter specifies the given or detected config type.
+
+        Returns
+        -------
+        None.
+        """
+        is_config_content_true = config_dict is None or isinstance(config_dict, dict)
+
+        error_message = (f"Enter config content whose top level is a mapping of keys. The {config_type} content "
+                         f"was parsed as {type(config_dict).__name__}")
+
+        self.__checker(condition_result=is_config_content_true,
+                       error_message=error_message)
+
     def check_naming_case_type(self, naming_case_type: str) -> None:
         """
         This function checks naming case types.
@@ -50,3 +96,187 @@ class Checker:
 
         self.__checker(condition_result=is_naming_case_type_true,
                        error_message=error_message)
+
+    def check_executor_type(self, executor_type: str) -> None:
+        """
+        This function checks executor types.
+
+        Parameters
+        ----------
+        executor_type: str
+            This parameter accepts executor types, including thread or process.
+
+        Returns
+        -------
+        None.
+        """
+        is_executor_type_true = executor_type in EXECUTOR_TYPE_LIST
+
+        error_message = f"Enter an executor type that is not valid. Approved executor types: {', '.join(EXECUTOR_TYPE_LIST)}"
+
+        self.__checker(condition_result=is_executor_type_true,
+                       error_message=error_message)
+
+    def check_list_index_type(self, list_index_type: str) -> None:
+        """
+        This function checks list index types.
+
+        Parameters
+        ----------
+        list_index_type: str
+            This parameter accepts list index types, including none or index.
+
+        Returns
+        -------
+        None.
+        """
+        is_list_index_type_true = list_index_type in LIST_INDEX_TYPE_LIST
+
+        error_message = (f"Enter a list index type that is not valid. "
+                         f"Approved list index types: {', '.join(LIST_INDEX_TYPE_LIST)}")
+
+        self.__checker(condition_result=is_list_index_type_true,
+                       error_message=error_message)
+
+    def check_parser_backend(self, file_type: str, parser_backend: str, available_parser_backend_list: list) -> None:
+        """
+        This function checks parser backends.
+
+        Parameters
+        ----------
+        file_type: str
+            This parameter accepts file types with several parser backends, including yaml, json or toml.
+        parser_backend: str
+            This parameter accepts the parser backends of the file type.
+        available_parser_backend_list: list
+            This parameter retrieves the parser backends that are installed.
+
+        Returns
+        -------
+        None.
+        """
+        is_file_type_true = file_type in PARSER_BACKEND_DICT
+
+        error_message = f"Enter a file type that is not valid. Approved file types: {', '.join(PARSER_BACKEND_DICT)}"
+
+        self.__checker(condition_result=is_file_type_true,
+                       error_message=error_message)
+
+        is_parser_backend_true = parser_backend in available_parser_backend_list
+
+        error_message = (f"Enter a parser backend that is not valid or not installed. "
+                         f"Approved parser backends: {', '.join(available_parser_backend_list)}")
+
+        self.__checker(condition_result=is_parser_backend_true,
+                       error_message=error_message)
+
+    def check_config_schema_error(self, error_list: list, schema_name: str) -> None:
+        """
+        This function checks that every field of a config schema was loaded.
+
+        Parameters
+        ----------
+        error_list: list
+            This parameter retrieves the missing and invalid fields.
+        schema_name: str
+            This parameter specifies the name of the config schema.
+
+        Returns
+        -------
+        None.
+        """
+        is_config_schema_true = not error_list
+
+        error_message = (f"Enter valid environment variables for every field of {schema_name}. "
+                         f"Missing or invalid fields: {'; '.join(error_list)}")
+
+        self.__checker(condition_result=is_config_schema_true,
+                       error_message=error_message)
+
+    def check_config_snapshot_error(self, error: str, snapshot_path: str) -> None:
+        """
+        This function checks that a snapshot file is valid.
+
+        Parameters
+        ----------
+        error: str
+            This parameter retrieves the reason why the snapshot file is not valid, or None if it is valid.
+        snapshot_path: str
+            This parameter specifies the snapshot file path.
+
+        Returns
+        -------
+        None.
+        """
+        is_config_snapshot_true = error is None
+
+        error_message = (f"Enter a config snapshot file that is valid. The snapshot file {snapshot_path} is not "
+                         f"valid because {error}. Approved snapshot files are built by 'build_config_snapshot'")
+
+        self.__checker(condition_result=is_config_snapshot_true,
+                       error_message=error_message)
+
+    def check_interpolation_cycle(self, cycle_key_list: list) -> None:
+        """
+        This function checks that config values do not reference each other in a cycle.
+
+        Parameters
+        ----------
+        cycle_key_list: list
+            This parameter retrieves the keys of the cycle, starting and ending with the same key,
+                or an empty list if there is no cycle.
+
+        Returns
+        -------
+        None.
+        """
+        is_interpolation_true = not cycle_key_list
+
+        error_message = (f"Enter config values without circular references. "
+                         f"Circular references: {' -> '.join(cycle_key_list)}")
+
+        self.__checker(condition_result=is_interpolation_true,
+                       error_message=error_message)
+
+    def check_config_layer(self, layer_name: str, layer_name_list: list) -> None:
+        """
+        This function checks that a config layer exists.
+
+        Parameters
+        ----------
+        layer_name: str
+            This parameter specifies the layer name.
+        layer_name_list: list
+            This parameter retrieves the names of the existing layers.
+
+        Returns
+        -------
+        None.
+        """
+        is_config_layer_true = layer_name in layer_name_list
+
+        error_message = (f"Enter a valid config layer. "
+                         f"Approved layers: {layer_name_list}")
+
+        self.__checker(condition_result=is_config_layer_true,
+                       error_message=error_message)
+
+    def check_client_method(self, client: str) -> None:
+        """
+        This function checks env client methods.
+
+        Parameters
+        ----------
+        client: str
+            This parameter accepts env client methods, including os_env or munch.
+
+        Returns
+        -------
+        None.
+        """
+        is_client_method_true = client in ENV_CLIENT_METHOD_LIST
+
+        error_message = f"Enter a client method that is not valid. Approved client methods: {', '.join(ENV_CLIENT_METHOD_LIST)}"
+
+        self.__checker(condition_result=is_client_method_true,
+                       error_message=error_message)
@@ -2,7 +2,73 @@
 This file is metaclass file of other classes.
 """
 
+import threading
+from functools import update_wrapper
+from typing import Any, Callable
+
 from craftsperson_env.utils.assert_controller import Checker
+
+DEFAULT_INSTANCE_DICT = {}
+DEFAULT_INSTANCE_LOCK = threading.Lock()
+
+
+def get_default_instance(owner: type) -> Any:
+    """
+    This function returns the default instance of a class, which is created with no arguments on first use.
+
+    Parameters
+    ----------
+    owner : type
+        This parameter retrieves the class.
+
+    Returns
+    -------
+    instance: Any
+        This returns the default instance of the class.
+    """
+    instance = DEFAULT_INSTANCE_DICT.get(owner)
+    if instance is None:
+        with DEFAULT_INSTANCE_LOCK:
+            instance = DEFAULT_INSTANCE_DICT.get(owner)
+            if instance is None:
+                instance = DEFAULT_INSTANCE_DICT[owner] = owner()
+    return instance
+
+
+class DefaultInstanceMethod:
+    """
+    Task
+    ----
+    This class decorates a method that can also be called on the class. Called on an instance, it is bound to
+    the instance, and the bound method is kept in the instance so later calls skip this descriptor. Called on
+    the class, it is bound to the default instance of the class, so a method that used to be a static method
+    keeps its class-level calls.
+
+    Parameters
+    ----------
+    function : Callable
+        This parameter retrieves the method.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self, function: Callable):
+        self.__function = function
+        self.__name = function.__name__
+        update_wrapper(self, function)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__name = name
+
+    def __get__(self, instance: Any, owner: type = None) -> Callable:
+        if instance is None:
+            return self.__function.__get__(get_default_instance(owner), owner)
+
+        bound_method = self.__function.__get__(instance, owner)
+        instance.__dict__[self.__name] = bound_method
+        return bound_method
 class BaseConfigClass:
     """
     Task
@@ -41,7 +107,7 @@ class BaseConfigClass:
         instance : object
            The newly created instance of the class.
         """
-        instance = super().__new__(cls, *args, **kwargs)
+        instance = super().__new__(cls)
 
         instance.naming_case_type = "upper-flat"
         instance.naming_case_join_type = ""
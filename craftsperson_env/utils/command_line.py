@@ -0,0 +1,114 @@
+"""
+This file serves as the command line interface, installed as the 'craftsperson-env' command.
+
+Usage:
+    craftsperson-env build-snapshot config.snapshot app.yaml local.env --naming-case-type upper --naming-case-join-type .
+    craftsperson-env show-snapshot config.snapshot [--key APPLICATION.NAME]
+"""
+
+import argparse
+import sys
+
+from craftsperson_env.utils.contraster import (EXECUTOR_TYPE_LIST, LIST_INDEX_TYPE_LIST, NAMING_CASE_LIST,
+                                               OTHER_CONFIG_NAME_TYPE_LIST)
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    """
+    This function returns the argument parser of the command line interface.
+
+    Returns
+    -------
+    argument_parser: argparse.ArgumentParser
+        This returns the argument parser.
+    """
+    argument_parser = argparse.ArgumentParser(prog="craftsperson-env", description=__doc__,
+                                              formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = argument_parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build-snapshot", help="flatten config files into a snapshot file, such as during a deploy"
+    )
+    build_parser.add_argument("snapshot_path", help="snapshot file path")
+    build_parser.add_argument("file_path_list", nargs="+", metavar="file_path",
+                              help="config file paths in override order")
+    build_parser.add_argument("--root-full-path", default="./")
+    build_parser.add_argument("--naming-case-type", required=True,
+                              choices=NAMING_CASE_LIST + OTHER_CONFIG_NAME_TYPE_LIST)
+    build_parser.add_argument("--naming-case-join-type", default="")
+    build_parser.add_argument("--config-env-replace-first-value", default=None)
+    build_parser.add_argument("--is-remove-xml-first-level", action="store_true")
+    build_parser.add_argument("--is-stream-xml", action="store_true")
+    build_parser.add_argument("--list-index-type", default="none", choices=LIST_INDEX_TYPE_LIST)
+    build_parser.add_argument("--is-interpolate", action="store_true")
+    build_parser.add_argument("--executor-type", default="thread", choices=EXECUTOR_TYPE_LIST)
+    build_parser.add_argument("--max-workers", type=int, default=None)
+
+    show_parser = subparsers.add_parser("show-snapshot", help="verify a snapshot file and print its header or a value")
+    show_parser.add_argument("snapshot_path", help="snapshot file path")
+    show_parser.add_argument("--key", default=None, help="print the value of a key instead of the header")
+
+    return argument_parser
+
+
+def main(argument_list: list = None) -> int:
+    """
+    This function runs the command line interface.
+
+    Parameters
+    ----------
+    argument_list : list, optional
+        This parameter retrieves the command line arguments. The default is None, which reads 'sys.argv'.
+
+    Returns
+    -------
+    exit_status: int
+        This returns 0 on success, and 1 if the snapshot file or the key is not valid.
+    """
+    from craftsperson_env import CraftsEnvConfig
+    from craftsperson_env.utils.config_snapshot import ConfigSnapshot
+
+    arguments = get_argument_parser().parse_args(argument_list)
+
+    if arguments.command == "build-snapshot":
+        config_env_dict = CraftsEnvConfig().build_config_snapshot(
+            snapshot_path=arguments.snapshot_path,
+            file_path_list=arguments.file_path_list,
+            executor_type=arguments.executor_type,
+            max_workers=arguments.max_workers,
+            is_interpolate=arguments.is_interpolate,
+            root_full_path=arguments.root_full_path,
+            naming_case_type=arguments.naming_case_type,
+            naming_case_join_type=arguments.naming_case_join_type,
+            config_env_replace_first_value=arguments.config_env_replace_first_value,
+            is_remove_xml_first_level=arguments.is_remove_xml_first_level,
+            is_stream_xml=arguments.is_stream_xml,
+            list_index_type=arguments.list_index_type,
+        )
+        print(f"wrote {len(config_env_dict)} keys to {arguments.snapshot_path}")
+        return 0
+
+    try:
+        config_snapshot = ConfigSnapshot(snapshot_path=arguments.snapshot_path)
+    except (AssertionError, OSError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    with config_snapshot:
+        if arguments.key is None:
+            print(f"format_version: {config_snapshot.format_version}")
+            print(f"checksum: {config_snapshot.checksum:#010x}")
+            print(f"key_count: {len(config_snapshot)}")
+            return 0
+
+        value = config_snapshot.get(arguments.key)
+        if value is None:
+            print(f"{arguments.key} is not in the snapshot", file=sys.stderr)
+            return 1
+
+        print(value)
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
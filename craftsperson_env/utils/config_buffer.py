@@ -0,0 +1,441 @@
+"""
+This file detects the format of config content and parses config buffers and streams without temporary files.
+"""
+
+import re
+from typing import Any
+
+from craftsperson_env.utils.contraster import CONFIG_SNIFF_SIZE
+from craftsperson_env.utils.load_config_file import LoadConfigFile
+from craftsperson_env.utils.parser_backend import get_parser_backend
+
+# A bare, double-quoted or single-quoted key
+TOML_KEY_PART = r"(?:[A-Za-z0-9_\-]+|\"[^\"\n]*\"|'[^'\n]*')"
+# '[table]', '[dotted.table]' or '[[array.of.tables]]'
+TOML_TABLE_PATTERN = re.compile(rf"\[\[?\s*{TOML_KEY_PART}(?:\s*\.\s*{TOML_KEY_PART})*\s*\]\]?\s*(#.*)?")
+# 'key = "value"', 'key = 1', 'key = true' or 'key = [...]'
+TOML_KEY_PATTERN = re.compile(r"[\w.\-\"']+\s*=\s*([\"'\[{]|true\b|false\b|[+\-]?\d|[+\-]?inf\b|[+\-]?nan\b)")
+# 'KEY=value' or 'export KEY=value'
+ENV_KEY_PATTERN = re.compile(r"(export\s+)?[A-Za-z_][\w.\-]*=")
+ENV_SPACED_KEY_PATTERN = re.compile(r"(export\s+)?[A-Za-z_][\w.\-]*\s+=")
+# 'key:' or 'key: value'
+YAML_KEY_PATTERN = re.compile(r"[^\s#:\-][^:]*:(\s|$)")
+
+
+def sniff_config_type(head: str) -> str:
+    """
+    This function detects the format of config content from its first lines. Content that starts with '<' is xml,
+        '{' or '[' is json, unless the first line is a toml table. A first line that is also a json array,
+        such as '["a"]' or '[1]', is a toml table only if a toml key or table follows it. Otherwise the first line
+        that is not blank or a comment decides: '---', '%YAML' or '- ' is yaml, a toml table is toml,
+        'KEY=value' is env, 'key = <toml value>' is toml, 'KEY = value' is env and 'key: value' is yaml.
+        Env content is toml instead if a later line is a toml table, or if every line is 'key=<toml value>' and
+        a key has lowercase letters, such as 'title="x"'. Other content is yaml.
+
+    Parameters
+    ----------
+    head: str
+        This parameter retrieves the first characters of the content.
+
+    Returns
+    -------
+    config_type: str
+        This returns the config type, such as "env", "yaml", "json", "xml" or "toml".
+    """
+    text = head.lstrip("\ufeff \t\r\n")
+    first_line = text.split("\n", 1)[0].strip()
+
+    if text.startswith("<"):
+        return "xml"
+    if text.startswith("{"):
+        return "json"
+    if text.startswith("["):
+        if not TOML_TABLE_PATTERN.fullmatch(first_line):
+            return "json"
+        if not is_json_value(first_line):
+            return "toml"
+        for line in text.splitlines()[1:]:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                return "toml" if TOML_TABLE_PATTERN.fullmatch(line) or TOML_KEY_PATTERN.match(line) else "json"
+        return "json"
+
+    line_list = [line for line in (line.strip() for line in text.splitlines()) if line and not line.startswith("#")]
+    if not line_list:
+        return "yaml"
+
+    first_line = line_list[0]
+    if first_line.startswith(("---", "%YAML", "- ")):
+        return "yaml"
+    if TOML_TABLE_PATTERN.fullmatch(first_line):
+        return "toml"
+    if ENV_KEY_PATTERN.match(first_line):
+        return "toml" if is_toml_line_list(line_list) else "env"
+    if TOML_KEY_PATTERN.match(first_line):
+        return "toml"
+    if ENV_SPACED_KEY_PATTERN.match(first_line):
+        return "toml" if is_toml_line_list(line_list) else "env"
+
+    return "yaml"
+
+
+def is_toml_line_list(line_list: list) -> bool:
+    """
+    This function checks whether lines that start like env content are toml. They are toml if a line is a toml
+        table, or if every line is 'key=<toml value>' and a key has lowercase letters.
+
+    Parameters
+    ----------
+    line_list: list
+        This parameter retrieves the lines that are not blank or comments.
+
+    Returns
+    -------
+    is_toml: bool
+        This returns whether the lines are toml.
+    """
+    if any(TOML_TABLE_PATTERN.fullmatch(line) for line in line_list):
+        return True
+
+    is_lower_key = False
+    for line in line_list:
+        if not TOML_KEY_PATTERN.match(line):
+            return False
+        key = line.partition("=")[0].strip()
+        is_lower_key = is_lower_key or key != key.upper()
+    return is_lower_key
+
+
+def is_json_value(text: str) -> bool:
+    """
+    This function checks whether a text is a complete json value.
+
+    Parameters
+    ----------
+    text: str
+        This parameter retrieves the text.
+
+    Returns
+    -------
+    is_json_value: bool
+        This returns whether the text is parsed by the json module.
+    """
+    import json
+
+    try:
+        json.loads(text)
+    except ValueError:
+        return False
+    return True
+
+
+def iter_text_lines(text: str):
+    """
+    This function yields the lines of a text one by one, without splitting the whole text into a list first.
+        Lines end with a line feed, a carriage return or both, as in files opened in text mode,
+        and a byte order mark is removed.
+
+    Parameters
+    ----------
+    text: str
+        This parameter retrieves the text.
+
+    Returns
+    -------
+    line: str
+        This yields each line without its line ending.
+    """
+    start = 1 if text.startswith("\ufeff") else 0
+    text_length = len(text)
+    while start < text_length:
+        end = text.find("\n", start)
+        if end == -1:
+            end = text_length
+        line = text[start:end - 1 if end > start and text[end - 1] == "\r" else end]
+        start = end + 1
+        if "\r" in line:
+            yield from line.split("\r")
+        else:
+            yield line
+
+
+def iter_stream_lines(stream: Any):
+    """
+    This function yields the lines of a binary or text stream as strings. Binary lines are decoded as UTF-8,
+        and a byte order mark at the start of the first line is removed.
+
+    Parameters
+    ----------
+    stream: Any
+        This parameter retrieves a binary or text file-like object.
+
+    Returns
+    -------
+    line: str
+        This yields each line.
+    """
+    line_iterator = iter(stream)
+    first_line = next(line_iterator, None)
+    if first_line is None:
+        return
+    yield first_line.decode("utf-8-sig") if isinstance(first_line, bytes) else first_line.lstrip("\ufeff")
+
+    for line in line_iterator:
+        yield line.decode("utf-8") if isinstance(line, bytes) else line
+
+
+def decode_config_buffer(buffer: Any) -> str:
+    """
+    This function decodes a config buffer in one step, removing a UTF-8 byte order mark.
+
+    Parameters
+    ----------
+    buffer: Any
+        This parameter retrieves the content as str, bytes, bytearray or memoryview.
+
+    Returns
+    -------
+    text: str
+        This returns the content as str.
+    """
+    if isinstance(buffer, str):
+        return buffer
+    return str(buffer, "utf-8-sig")
+
+
+def parse_config_buffer(
+    buffer: Any,
+    config_type: str = None,
+    config_env_replace_first_value: str = None,
+    naming_case_join_type: str = "",
+    extra_config_file_params: dict = {},
+) -> tuple:
+    """
+    This function parses config content held in memory. Bytes-like content is passed to orjson and the xml parser
+        as it is, and the other parsers decode it once, so no copy of the content is made before parsing.
+        Content detected as json that the json parser rejects is parsed as yaml.
+
+    Parameters
+    ----------
+    buffer: Any
+        This parameter retrieves the content as str, bytes, bytearray or memoryview.
+    config_type: str, optional
+        This parameter specifies the config type, allowing values such as "env", "yaml", "json", "xml" or "toml".
+            The default is None, which detects the type from the content.
+    config_env_replace_first_value: str, optional
+        This parameter specifies the replacement value for the first occurrence in env keys. The default is None.
+    naming_case_join_type: str, optional
+        This parameter specifies the join type that replaces the first occurrence. The default is "".
+    extra_config_file_params: dict, optional
+        This parameter retrieves additional XML or TOML configuration parameters. The default value is {}.
+
+    Returns
+    -------
+    config_dict: dict
+        This returns the parsed config.
+    config_type: str
+        This returns the given or detected config type.
+    """
+    if not isinstance(buffer, (str, bytes)):
+        buffer = memoryview(buffer)
+
+    is_detected_type = config_type is None
+    if is_detected_type:
+        head = buffer[:CONFIG_SNIFF_SIZE]
+        # A multi-byte character can be cut at the end of the head
+        config_type = sniff_config_type(head if isinstance(head, str) else str(head, "utf-8", "ignore"))
+
+    if config_type == "json":
+        try:
+            return LoadConfigFile.load_json_content(buffer), config_type
+        except ValueError:
+            # Detected json content that is not valid json, such as the yaml flow mapping '{a: 1}', is yaml
+            if not is_detected_type:
+                raise
+            config_type = "yaml"
+
+    if config_type == "xml":
+        import xmltodict
+
+        return xmltodict.parse(buffer, **extra_config_file_params), config_type
+
+    text = decode_config_buffer(buffer)
+
+    if config_type == "env":
+        config_dict = LoadConfigFile.get_env_config_dict(
+            key_value_iterator=LoadConfigFile.iter_env_lines(iter_text_lines(text)),
+            config_env_replace_first_value=config_env_replace_first_value,
+            naming_case_join_type=naming_case_join_type,
+        )
+        return config_dict, config_type
+
+    if config_type == "toml":
+        if not extra_config_file_params and get_parser_backend("toml") == "tomllib":
+            import tomllib
+
+            return tomllib.loads(text), config_type
+
+        import toml
+
+        return toml.loads(text, **extra_config_file_params), config_type
+
+    import yaml
+
+    loader = yaml.CSafeLoader if get_parser_backend("yaml") == "libyaml" else yaml.SafeLoader
+    return yaml.load(text, Loader=loader), config_type
+
+
+class HeadReplayStream:
+    """
+    Task
+    ----
+    This class wraps a stream whose head was already read, and returns the head again before the rest of
+        the stream, so a stream that cannot seek is still parsed while it is read.
+
+    Parameters
+    ----------
+    head : Any
+        This parameter retrieves the characters or bytes read from the start of the stream.
+    stream : Any
+        This parameter retrieves the binary or text file-like object after its head.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self, head: Any, stream: Any):
+        self.__head = head
+        self.__stream = stream
+
+    def read(self, size: int = -1) -> Any:
+        head = self.__head
+        if not head:
+            return self.__stream.read() if size is None or size < 0 else self.__stream.read(size)
+
+        if size is None or size < 0:
+            self.__head = head[:0]
+            return head + self.__stream.read()
+
+        self.__head = head[size:]
+        return head[:size]
+
+    def readline(self) -> Any:
+        head = self.__head
+        if not head:
+            return self.__stream.readline()
+
+        line_end = head.find(b"\n" if isinstance(head, bytes) else "\n") + 1
+        if line_end:
+            self.__head = head[line_end:]
+            return head[:line_end]
+
+        self.__head = head[:0]
+        return head + self.__stream.readline()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+
+def read_config_stream_head(stream: Any) -> tuple:
+    """
+    This function reads the first CONFIG_SNIFF_SIZE characters or bytes of a stream, or the whole stream if it
+        is shorter. Reads are repeated, since a read or peek of a socket file can return only a few bytes.
+        A seekable stream is sought back, and another stream is wrapped so its head is read again.
+
+    Parameters
+    ----------
+    stream: Any
+        This parameter retrieves a binary or text file-like object.
+
+    Returns
+    -------
+    head: Any
+        This returns the first characters or bytes.
+    stream: Any
+        This returns the stream, positioned at the start of the content.
+    """
+    seekable = getattr(stream, "seekable", None)
+    position = stream.tell() if seekable is not None and seekable() else None
+
+    chunk_list = []
+    head_size = 0
+    while head_size < CONFIG_SNIFF_SIZE:
+        chunk = stream.read(CONFIG_SNIFF_SIZE - head_size)
+        if not chunk:
+            break
+        chunk_list.append(chunk)
+        head_size += len(chunk)
+    head = chunk[:0].join(chunk_list)
+
+    if position is not None:
+        stream.seek(position)
+        return head, stream
+    return head, HeadReplayStream(head=head, stream=stream)
+
+
+def parse_config_stream(
+    stream: Any,
+    config_type: str = None,
+    config_env_replace_first_value: str = None,
+    naming_case_join_type: str = "",
+    extra_config_file_params: dict = {},
+) -> tuple:
+    """
+    This function parses config content from a binary or text file-like object, such as a socket file.
+        Yaml and binary xml streams are parsed while they are read, and env streams line by line. Json, toml
+        and text xml streams are read once and parsed. Without a config type, the type is detected from the head
+        of the stream. The head is read until it holds CONFIG_SNIFF_SIZE characters or bytes or the whole stream,
+        and a stream that cannot seek returns its head again before the rest of its content.
+
+    Parameters
+    ----------
+    stream: Any
+        This parameter retrieves a binary or text file-like object.
+    The other parameters are the same as the parameters of 'parse_config_buffer'.
+
+    Returns
+    -------
+    config_dict: dict
+        This returns the parsed config.
+    config_type: str
+        This returns the given or detected config type.
+    """
+    is_detected_type = config_type is None
+    if is_detected_type:
+        head, stream = read_config_stream_head(stream)
+        config_type = sniff_config_type(head if isinstance(head, str) else str(head, "utf-8", "ignore"))
+
+    if config_type in ("json", "toml"):
+        # Detected types are detected again from the same head, so invalid json falls back to yaml
+        return parse_config_buffer(
+            buffer=stream.read(),
+            config_type=None if is_detected_type else config_type,
+            extra_config_file_params=extra_config_file_params,
+        )
+
+    if config_type == "xml":
+        import xmltodict
+
+        # The xml parser reads bytes from streams, so text streams are read once
+        xml_input = stream.read() if isinstance(stream.read(0), str) else stream
+        return xmltodict.parse(xml_input, **extra_config_file_params), config_type
+
+    if config_type == "env":
+        config_dict = LoadConfigFile.get_env_config_dict(
+            key_value_iterator=LoadConfigFile.iter_env_lines(iter_stream_lines(stream)),
+            config_env_replace_first_value=config_env_replace_first_value,
+            naming_case_join_type=naming_case_join_type,
+        )
+        return config_dict, config_type
+
+    import yaml
+
+    loader = yaml.CSafeLoader if get_parser_backend("yaml") == "libyaml" else yaml.SafeLoader
+    return yaml.load(stream, Loader=loader), config_type
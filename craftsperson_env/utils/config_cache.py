@@ -0,0 +1,333 @@
+"""
+This file stores flattened config files in a cache directory.
+
+A cache file is a header and the marshalled key-value pairs and key paths:
+
+    magic | format version | checksum | payload size
+    marshalled (config_env_dict, key_path_list)
+
+The checksum is the CRC32 of the payload, which is checked before the payload is unmarshalled,
+since 'marshal' is not safe against corrupted data.
+"""
+
+import marshal
+import os
+import threading
+
+from craftsperson_env.utils.contraster import (CONFIG_CACHE_FILE_SUFFIX, CONFIG_CACHE_FORMAT_VERSION,
+                                               CONFIG_CACHE_MAGIC)
+from craftsperson_env.utils.path_modifier import set_shared_file_mode
+
+# The struct and zlib modules are imported when a cache file is read or written, to keep the package import fast
+CACHE_HEADER_FORMAT = "<8sIIQ"
+
+
+class ParsedConfigCache:
+    """
+    Task
+    ----
+    This class stores the flattened key-value pairs of config files in a cache directory,
+    so a warm start skips reading, parsing and flattening. Entries are keyed by the file path, modification time,
+    size, optional content hash, parser backend and flatten parameters, and the least recently used entries
+    are evicted first.
+
+    Parameters
+    ----------
+    cache_dir : str
+        This parameter specifies the cache directory path.
+    max_entries : int, optional
+        This parameter specifies the maximum number of cache files. The default is 256.
+    max_bytes : int, optional
+        This parameter specifies the maximum total size of cache files. The default is None.
+    is_hash_content : bool, optional
+        This parameter determines whether the file content hash is part of the cache key. The default value is False.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_entries: int = 256,
+        max_bytes: int = None,
+        is_hash_content: bool = False,
+    ):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.is_hash_content = is_hash_content
+        # The size of each known cache file, built by one directory scan and updated by each save
+        self.__size_dict = None
+        self.__total_bytes = 0
+        self.__lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """
+        This function returns the picklable state of the cache, which is sent to the workers of a process pool.
+            The lock and the in-memory index are left out, since the index of another process may be stale.
+
+        Returns
+        -------
+        state: dict
+            This returns the attributes of the cache without the lock and the index.
+        """
+        state = self.__dict__.copy()
+        del state["_ParsedConfigCache__lock"]
+        state["_ParsedConfigCache__size_dict"] = None
+        state["_ParsedConfigCache__total_bytes"] = 0
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        This function restores the cache from its pickled state with a new lock. The index is rebuilt by the
+            first save.
+
+        Parameters
+        ----------
+        state : dict
+            This parameter retrieves the attributes of the cache.
+
+        Returns
+        -------
+        None.
+        """
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def get_cache_path(self, file_path: str, flatten_params: dict) -> str:
+        """
+        This function returns the cache file path of a config file.
+
+        Parameters
+        ----------
+        file_path : str
+            This parameter specifies the config file location path.
+        flatten_params : dict
+            This parameter retrieves the parser backend and the parameters that change the flattened result.
+
+        Returns
+        -------
+        cache_path: str
+            This returns the cache file path.
+        """
+        import hashlib
+
+        file_stat = os.stat(file_path)
+        key_hash = hashlib.sha256()
+        key_hash.update(repr((
+            CONFIG_CACHE_FORMAT_VERSION,
+            os.path.abspath(file_path),
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            sorted(flatten_params.items()),
+        )).encode())
+
+        if self.is_hash_content:
+            with open(file_path, "rb") as file:
+                for chunk in iter(lambda: file.read(1 << 20), b""):
+                    key_hash.update(chunk)
+
+        return os.path.join(self.cache_dir, key_hash.hexdigest() + CONFIG_CACHE_FILE_SUFFIX)
+
+    @staticmethod
+    def load(cache_path: str, key_path_dict: dict = None) -> dict:
+        """
+        This function loads a cache file. A missing or corrupt cache file returns None,
+            and a corrupt one is removed. The header and checksum are checked before the payload is unmarshalled.
+
+        Parameters
+        ----------
+        cache_path : str
+            This parameter specifies the cache file path.
+        key_path_dict : dict, optional
+            This parameter retrieves a dict that receives the cached key path tuple of each key.
+                The default is None.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the cached key-value pairs, or None.
+        """
+        import struct
+        import zlib
+
+        try:
+            with open(cache_path, "rb") as file:
+                cache_bytes = file.read()
+        except FileNotFoundError:
+            return None
+
+        header_struct = struct.Struct(CACHE_HEADER_FORMAT)
+
+        config_env_dict, key_path_list = None, None
+        if len(cache_bytes) >= header_struct.size:
+            magic, format_version, checksum, payload_size = header_struct.unpack_from(cache_bytes, 0)
+            # The payload is read through a view, so it is not copied
+            payload_view = memoryview(cache_bytes)[header_struct.size:]
+            if (magic == CONFIG_CACHE_MAGIC and format_version == CONFIG_CACHE_FORMAT_VERSION
+                    and len(payload_view) == payload_size and zlib.crc32(payload_view) == checksum):
+                try:
+                    config_env_dict, key_path_list = marshal.loads(payload_view)
+                except Exception:
+                    config_env_dict, key_path_list = None, None
+
+        if not isinstance(config_env_dict, dict) or not isinstance(key_path_list, list):
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+            return None
+
+        # Touch the cache file so eviction removes the least recently used files first
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+        if key_path_dict is not None:
+            key_path_dict.update(zip(config_env_dict, key_path_list))
+
+        return config_env_dict
+
+    def save(self, cache_path: str, config_env_dict: dict, key_path_dict: dict) -> None:
+        """
+        This function writes a cache file atomically and evicts old cache files over the limits.
+            Key-value pairs that cannot be marshalled are not cached. The limits are checked against an in-memory
+            index of the cache files, so the cache directory is scanned only when the index is built and when
+            it crosses a limit.
+
+        Parameters
+        ----------
+        cache_path : str
+            This parameter specifies the cache file path.
+        config_env_dict : dict
+            This parameter retrieves the flattened key-value pairs.
+        key_path_dict : dict
+            This parameter retrieves the key path tuple of each key.
+
+        Returns
+        -------
+        None.
+        """
+        import struct
+        import tempfile
+        import zlib
+
+        header_struct = struct.Struct(CACHE_HEADER_FORMAT)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                set_shared_file_mode(file.fileno())
+                key_path_list = [key_path_dict[env_key] for env_key in config_env_dict]
+                payload_bytes = marshal.dumps((config_env_dict, key_path_list))
+                file.write(header_struct.pack(CONFIG_CACHE_MAGIC, CONFIG_CACHE_FORMAT_VERSION,
+                                              zlib.crc32(payload_bytes), len(payload_bytes)))
+                file.write(payload_bytes)
+            os.replace(temp_path, cache_path)
+        except ValueError:
+            # Native values such as datetimes cannot be marshalled, so the file is not cached
+            os.remove(temp_path)
+            return
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        with self.__lock:
+            if self.__size_dict is None:
+                self.__scan()
+            else:
+                cache_size = header_struct.size + len(payload_bytes)
+                self.__total_bytes += cache_size - self.__size_dict.get(cache_path, 0)
+                self.__size_dict[cache_path] = cache_size
+
+            if self.__is_over_limits():
+                self.__evict()
+
+    def __is_over_limits(self) -> bool:
+        """
+        This function checks whether the indexed cache files are over the limits.
+
+        Returns
+        -------
+        is_over_limits: bool
+            This returns whether the cache is over its limits.
+        """
+        return (len(self.__size_dict) > self.max_entries
+                or (self.max_bytes is not None and self.__total_bytes > self.max_bytes))
+
+    def __scan(self) -> list:
+        """
+        This function scans the cache directory and rebuilds the index of the cache files.
+
+        Returns
+        -------
+        cache_file_list: list
+            This returns the (modification time, size, path) of each cache file, from the least recently used.
+        """
+        cache_file_list = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(CONFIG_CACHE_FILE_SUFFIX):
+                try:
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                cache_file_list.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry.path))
+
+        cache_file_list.sort()
+        self.__size_dict = {cache_path: size for _, size, cache_path in cache_file_list}
+        self.__total_bytes = sum(self.__size_dict.values())
+        return cache_file_list
+
+    def __evict(self) -> None:
+        """
+        This function scans the cache directory, which also finds the cache files of other processes and
+            the modification times that loads refreshed, and removes the least recently used cache files
+            until the cache is within its limits.
+
+        Returns
+        -------
+        None.
+        """
+        for _, size, cache_path in self.__scan():
+            if not self.__is_over_limits():
+                break
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+            del self.__size_dict[cache_path]
+            self.__total_bytes -= size
+
+    def evict(self) -> None:
+        """
+        This function removes the least recently used cache files until the cache is within its limits.
+
+        Returns
+        -------
+        None.
+        """
+        with self.__lock:
+            self.__evict()
+
+    def clear(self) -> None:
+        """
+        This function removes all cache files.
+
+        Returns
+        -------
+        None.
+        """
+        with self.__lock:
+            self.__size_dict = None
+            self.__total_bytes = 0
+
+            if not os.path.isdir(self.cache_dir):
+                return
+
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(CONFIG_CACHE_FILE_SUFFIX):
+                    os.remove(entry.path)
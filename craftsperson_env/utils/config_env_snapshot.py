@@ -0,0 +1,89 @@
+"""
+This file keeps an immutable, versioned snapshot of the committed config values for lock-free reads.
+"""
+
+from types import MappingProxyType
+from typing import Iterable
+
+
+class ConfigEnvSnapshot:
+    """
+    Task
+    ----
+    This class holds the committed key-value pairs of one 'CraftsEnvConfig' instance as a read-only mapping
+        and its version. A commit copies the mapping, applies the changes to the copy and replaces the
+        (version, mapping) pair in one assignment, so a reader that takes the mapping once sees every key of
+        one commit and never a half-applied one, without taking a lock. Commits must be serialized by the caller.
+
+    Parameters
+    ----------
+    None.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self):
+        self.__state = (0, MappingProxyType({}))
+
+    @property
+    def version(self) -> int:
+        """
+        This function returns the version of the snapshot, which is the number of commits.
+
+        Returns
+        -------
+        version: int
+            This returns the version.
+        """
+        return self.__state[0]
+
+    @property
+    def mapping(self) -> MappingProxyType:
+        """
+        This function returns the read-only mapping of the snapshot.
+
+        Returns
+        -------
+        mapping: MappingProxyType
+            This returns the environment variable key-value pairs.
+        """
+        return self.__state[1]
+
+    @property
+    def state(self) -> tuple:
+        """
+        This function returns the version and the mapping of the same snapshot.
+
+        Returns
+        -------
+        state: tuple
+            This returns the (version, mapping) pair.
+        """
+        return self.__state
+
+    def publish(self, config_env_dict: dict, removed_key_list: Iterable = ()) -> int:
+        """
+        This function replaces the snapshot with a copy that has the committed and removed keys.
+
+        Parameters
+        ----------
+        config_env_dict : dict
+            This parameter retrieves the committed environment variable key-value pairs.
+        removed_key_list : Iterable, optional
+            This parameter retrieves the removed environment variable keys. The default is ().
+
+        Returns
+        -------
+        version: int
+            This returns the version of the new snapshot.
+        """
+        version, mapping = self.__state
+        snapshot_dict = mapping.copy()
+        snapshot_dict.update(config_env_dict)
+        for env_key in removed_key_list:
+            snapshot_dict.pop(env_key, None)
+
+        self.__state = (version + 1, MappingProxyType(snapshot_dict))
+        return version + 1
@@ -0,0 +1,518 @@
+"""
+This file flattens parsed config files into environment variable key-value pairs.
+"""
+
+import time
+from copy import deepcopy
+from typing import Any, Callable
+
+from craftsperson_env.utils.assert_controller import Checker
+from craftsperson_env.utils.config_cache import ParsedConfigCache
+from craftsperson_env.utils.contraster import PARSER_BACKEND_DICT
+from craftsperson_env.utils.convert_naming_case_type import get_naming_case_converter
+from craftsperson_env.utils.literal_classifier import classify_literal
+from craftsperson_env.utils.load_config_file import LoadConfigFile
+from craftsperson_env.utils.load_stats import LoadStats
+from craftsperson_env.utils.parser_backend import get_parser_backend
+from craftsperson_env.utils.xml_streamer import iter_xml_config_file
+
+
+def stringify_config_value(value: Any) -> str:
+    """
+    This function converts a flattened config value to its 'os.environ' string.
+
+    Parameters
+    ----------
+    value : Any
+        This parameter retrieves the flattened config value.
+
+    Returns
+    -------
+    value: str
+        This returns the string value. Dict values are wrapped in double quotes.
+    """
+    if isinstance(value, dict):
+        return f'"{value}"'
+    return f"{value}"
+
+
+class ConfigFlattener:
+    """
+    Task
+    ----
+    This class flattens nested config values into environment variable key-value pairs.
+
+    Parameters
+    ----------
+    naming_case_type : str, optional
+        This parameter specifies the naming case type of the keys. The default is 'upper-flat'.
+    naming_case_join_type : str, optional
+        This parameter specifies the join type, allowing values such as "", "-", or "_". The default is "".
+    is_remove_xml_first_level : bool, optional
+        This parameter determines whether to remove the first level. The default value is False.
+    is_native_value : bool, optional
+        This parameter determines whether the parsed values are kept instead of their strings.
+            The default value is False.
+    list_index_type : str, optional
+        This parameter specifies how lists of dicts are flattened, allowing values such as "none" or "index".
+            "none" keeps the whole list as one value. "index" flattens each item under its index,
+            such as 'SERVERS.0.HOST'. The default is "none".
+    stats : LoadStats, optional
+        This parameter retrieves the statistics that receive the key conversion duration and the key depth.
+            The default is None.
+    key_path_dict : dict, optional
+        This parameter retrieves a dict that receives the key path tuple of each environment variable key.
+            The default is None.
+    native_value_dict : dict, optional
+        This parameter retrieves a dict that receives the parsed value of each key whose value is not a string,
+            when the strings are kept. The default is None.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(
+        self,
+        naming_case_type: str = "upper-flat",
+        naming_case_join_type: str = "",
+        is_remove_xml_first_level: bool = False,
+        is_native_value: bool = False,
+        list_index_type: str = "none",
+        stats: LoadStats = None,
+        key_path_dict: dict = None,
+        native_value_dict: dict = None,
+    ):
+        self.__naming_case_converter = get_naming_case_converter(
+            naming_case_type=naming_case_type,
+            naming_case_join_type=naming_case_join_type,
+        )
+        if stats is not None:
+            self.__naming_case_converter = self.__get_timed_converter(self.__naming_case_converter, stats)
+        self.__is_remove_xml_first_level = is_remove_xml_first_level
+        self.__is_native_value = is_native_value
+        self.__is_index_list = list_index_type == "index"
+        self.__key_path_dict = key_path_dict
+        self.__native_value_dict = native_value_dict
+
+    @staticmethod
+    def __get_timed_converter(naming_case_converter: Callable, stats: LoadStats) -> Callable:
+        """
+        This function wraps a naming case converter to add its duration and the key depth to the statistics.
+
+        Parameters
+        ----------
+        naming_case_converter : Callable
+            This parameter retrieves the naming case converter.
+        stats : LoadStats
+            This parameter retrieves the statistics that are updated.
+
+        Returns
+        -------
+        timed_converter: Callable
+            This returns the wrapped converter.
+        """
+        def timed_converter(key_tuple: tuple) -> str:
+            start_time = time.perf_counter()
+            env_key = naming_case_converter(key_tuple)
+            stats.convert_seconds += time.perf_counter() - start_time
+            if len(key_tuple) > stats.max_depth:
+                stats.max_depth = len(key_tuple)
+            return env_key
+
+        return timed_converter
+
+    def add_config_env(self, data: Any, config_env_dict: dict, keys: tuple = ()):
+        """
+        This function flattens config file key-value pairs into the staging dict.
+            It walks the nested values with an explicit stack, so any nesting depth is supported.
+            The keys of the open dicts are kept in one shared path list, and a key path tuple is built
+            only for each leaf.
+
+        Parameters
+        ----------
+        data : Any
+            This parameter retrieves environment variable values.
+        config_env_dict : dict
+            This parameter retrieves the staging dict of environment variable key-value pairs.
+        keys : tuple, optional
+            This parameter retrieves the key path of the data. The default value is ().
+
+        Returns
+        -------
+        None.
+        """
+        stack = [iter(data.items())]
+        # The key path of the innermost open dict, which grows and shrinks with the stack
+        key_list = list(keys)
+
+        while stack:
+            for key, value in stack[-1]:
+                if isinstance(value, str):
+                    value, is_dict_value = classify_literal(value)
+                elif isinstance(value, dict):
+                    stack.append(iter(value.items()))
+                    key_list.append(key)
+                    break
+                elif self.__is_index_list and self.__is_dict_list(value):
+                    stack.append(self.__iter_list_items(value))
+                    key_list.append(key)
+                    break
+                else:
+                    is_dict_value = False
+
+                self.__add_config_leaf((*key_list, key), value, is_dict_value, config_env_dict)
+
+            else:
+                stack.pop()
+                if stack:
+                    key_list.pop()
+
+    def add_config_leaves(self, leaf_iterator, config_env_dict: dict):
+        """
+        This function flattens streamed leaves into the staging dict.
+
+        Parameters
+        ----------
+        leaf_iterator : Iterator
+            This parameter retrieves the key path tuple and the value of each leaf.
+        config_env_dict : dict
+            This parameter retrieves the staging dict of environment variable key-value pairs.
+
+        Returns
+        -------
+        None.
+        """
+        for key_tuple, value in leaf_iterator:
+            if isinstance(value, str):
+                value, is_dict_value = classify_literal(value)
+            elif isinstance(value, dict) or (self.__is_index_list and self.__is_dict_list(value)):
+                self.add_config_env({key_tuple[-1]: value}, config_env_dict, key_tuple[:-1])
+                continue
+            else:
+                is_dict_value = False
+
+            self.__add_config_leaf(key_tuple, value, is_dict_value, config_env_dict)
+
+    @staticmethod
+    def __is_dict_list(value: Any) -> bool:
+        """
+        This function checks whether a parsed value is a list that holds dicts.
+
+        Parameters
+        ----------
+        value : Any
+            This parameter retrieves the parsed value.
+
+        Returns
+        -------
+        is_dict_list: bool
+            This returns whether the value is a list of dicts.
+        """
+        return isinstance(value, list) and any(isinstance(item, dict) for item in value)
+
+    @staticmethod
+    def __iter_list_items(value: list):
+        """
+        This function returns the index-item pairs of a list, with the indexes as keys.
+
+        Parameters
+        ----------
+        value : list
+            This parameter retrieves the list.
+
+        Returns
+        -------
+        item_iterator: Iterator
+            This returns the index-item pairs.
+        """
+        return ((str(index), item) for index, item in enumerate(value))
+
+    def __add_config_leaf(self, key_tuple: tuple, value: Any, is_dict_value: bool, config_env_dict: dict):
+        """
+        This function converts the key path of a leaf and stages its value.
+
+        Parameters
+        ----------
+        key_tuple : tuple
+            This parameter retrieves the key path of the leaf.
+        value : Any
+            This parameter retrieves the leaf value.
+        is_dict_value : bool
+            This parameter determines whether the value is a classified literal.
+        config_env_dict : dict
+            This parameter retrieves the staging dict of environment variable key-value pairs.
+
+        Returns
+        -------
+        None.
+        """
+        if self.__is_remove_xml_first_level:
+            key_tuple = key_tuple[1:]
+        env_key = self.__naming_case_converter(key_tuple)
+        if self.__key_path_dict is not None:
+            self.__key_path_dict[env_key] = key_tuple
+        if not self.__is_native_value:
+            config_env_dict[env_key] = stringify_config_value(value)
+            if self.__native_value_dict is not None:
+                if isinstance(value, str) or value is None:
+                    # A later leaf of the same key replaces the parsed value of an earlier leaf
+                    self.__native_value_dict.pop(env_key, None)
+                elif is_dict_value and isinstance(value, (dict, list, set)):
+                    self.__native_value_dict[env_key] = deepcopy(value)
+                else:
+                    self.__native_value_dict[env_key] = value
+        elif is_dict_value and isinstance(value, (dict, list, set)):
+            # Classified literals are memoized, so they are copied before they are handed out
+            config_env_dict[env_key] = deepcopy(value)
+        else:
+            config_env_dict[env_key] = value
+
+
+def flatten_config_file(
+    file_path: str,
+    naming_case_type: str = "upper-flat",
+    naming_case_join_type: str = "",
+    config_env_replace_first_value: str = None,
+    extra_config_file_params: dict = {},
+    config_cache: ParsedConfigCache = None,
+    is_native_value: bool = False,
+    is_remove_xml_first_level: bool = False,
+    is_stream_xml: bool = False,
+    list_index_type: str = "none",
+    stats: LoadStats = None,
+    key_path_dict: dict = None,
+    native_value_dict: dict = None,
+) -> dict:
+    """
+    This function reads, parses and flattens a config file without touching the 'os.environ' system.
+
+    Parameters
+    ----------
+    file_path : str
+        This parameter specifies the full file location path.
+    naming_case_type : str, optional
+        This parameter specifies naming case types for env, yaml, json, xml, or toml. The default is 'upper-flat'.
+    naming_case_join_type : str, optional.
+        This parameter specifies the join type, allowing values such as "", "-", or "_". The default is "".
+    config_env_replace_first_value: str, optional.
+        This parameter specifies the replacement value for the first occurrence. The default is None.
+    extra_config_file_params : dict, optional
+        This parameter retrieves additional XML or TOML configuration parameters. The default value is {}.
+    config_cache : ParsedConfigCache, optional
+        This parameter specifies the cache of flattened config files. The default is None.
+    is_native_value : bool, optional
+        This parameter determines whether the parsed values are kept instead of their strings.
+            The default value is False.
+    is_remove_xml_first_level : bool, optional
+        This parameter determines whether to remove the first level of xml files. The default value is False.
+    is_stream_xml : bool, optional
+        This parameter determines whether xml files are streamed into the staging dict instead of being parsed
+            into a tree first. The file is read and parsed twice, first to find the repeated elements.
+            It is used without 'extra_config_file_params' only. The default value is False.
+    list_index_type : str, optional
+        This parameter specifies how lists of dicts are flattened, allowing values such as "none" or "index".
+            The default is "none".
+    stats : LoadStats, optional
+        This parameter retrieves the statistics that receive the read, parse, flatten and convert durations.
+            Streamed xml files are parsed while they are flattened, so their parse duration is part of the
+            flatten duration. The default is None.
+    key_path_dict : dict, optional
+        This parameter retrieves a dict that receives the key path tuple of each environment variable key.
+            The default is None.
+    native_value_dict : dict, optional
+        This parameter retrieves a dict that receives the parsed value of each key whose value is not a string,
+            when 'is_native_value' is False. Cached files do not fill it. The default is None.
+
+    Returns
+    -------
+    config_env_dict: dict
+        This returns the flattened environment variable key-value pairs of the config file.
+    """
+    is_xml_file = file_path.endswith("xml")
+    is_stream_xml = is_stream_xml and is_xml_file and not extra_config_file_params
+
+    if config_cache is not None:
+        file_type = file_path.rsplit(".", 1)[-1]
+        cache_path = config_cache.get_cache_path(
+            file_path=file_path,
+            flatten_params={
+                "parser_backend": get_parser_backend(file_type) if file_type in PARSER_BACKEND_DICT else None,
+                "naming_case_type": naming_case_type,
+                "naming_case_join_type": naming_case_join_type,
+                "config_env_replace_first_value": config_env_replace_first_value,
+                "extra_config_file_params": repr(extra_config_file_params),
+                "is_native_value": is_native_value,
+                "is_remove_xml_first_level": is_remove_xml_first_level and is_xml_file,
+                "is_stream_xml": is_stream_xml,
+                "list_index_type": list_index_type,
+            },
+        )
+        config_env_dict = config_cache.load(cache_path=cache_path, key_path_dict=key_path_dict)
+        if config_env_dict is not None:
+            if stats is not None:
+                stats.is_cache_hit = True
+                stats.key_count = len(config_env_dict)
+            return config_env_dict
+
+    if stats is not None:
+        start_time = time.perf_counter()
+        start_read_seconds = stats.read_seconds
+
+    load_config_file = LoadConfigFile()
+
+    if file_path.endswith("env"):
+        config_dict = load_config_file.load_diff_type_env_config_file(
+            file_path=file_path,
+            config_env_replace_first_value=config_env_replace_first_value,
+            naming_case_join_type=naming_case_join_type,
+            stats=stats,
+        )
+
+    elif file_path.endswith("yaml"):
+        config_dict = load_config_file.load_yaml_config_file(file_path=file_path, stats=stats)
+
+    elif file_path.endswith("json"):
+        config_dict = load_config_file.load_json_config_file(file_path=file_path, stats=stats)
+
+    elif is_stream_xml:
+        config_dict = None
+
+    elif is_xml_file:
+        config_dict = load_config_file.load_xml_config_file(
+            file_path=file_path, extra_config_file_params=extra_config_file_params, stats=stats
+        )
+
+    elif file_path.endswith("toml"):
+        config_dict = load_config_file.load_toml_config_file(
+            file_path=file_path, extra_config_file_params=extra_config_file_params, stats=stats
+        )
+
+    else:
+        config_dict = {}
+
+    if stats is not None:
+        flatten_start_time = time.perf_counter()
+        stats.parse_seconds += flatten_start_time - start_time - (stats.read_seconds - start_read_seconds)
+        start_convert_seconds = stats.convert_seconds
+
+    # Cache files keep the key paths of the file, so they are collected whenever the file is cached
+    file_key_path_dict = {} if config_cache is not None else key_path_dict
+
+    config_env_dict = {}
+    config_flattener = ConfigFlattener(
+        naming_case_type=naming_case_type,
+        naming_case_join_type=naming_case_join_type,
+        is_remove_xml_first_level=is_remove_xml_first_level and is_xml_file,
+        is_native_value=is_native_value,
+        list_index_type=list_index_type,
+        stats=stats,
+        key_path_dict=file_key_path_dict,
+        native_value_dict=native_value_dict,
+    )
+    if is_stream_xml:
+        config_flattener.add_config_leaves(iter_xml_config_file(file_path=file_path, stats=stats), config_env_dict)
+    else:
+        config_flattener.add_config_env(config_dict, config_env_dict)
+
+    if stats is not None:
+        stats.flatten_seconds += (time.perf_counter() - flatten_start_time
+                                  - (stats.convert_seconds - start_convert_seconds))
+        stats.key_count = len(config_env_dict)
+
+    if config_cache is not None:
+        config_cache.save(cache_path=cache_path, config_env_dict=config_env_dict, key_path_dict=file_key_path_dict)
+        if key_path_dict is not None:
+            key_path_dict.update(file_key_path_dict)
+
+    return config_env_dict
+
+
+def flatten_config_source(
+    source: Any,
+    config_type: str = None,
+    naming_case_type: str = "upper-flat",
+    naming_case_join_type: str = "",
+    config_env_replace_first_value: str = None,
+    extra_config_file_params: dict = {},
+    is_native_value: bool = False,
+    is_remove_xml_first_level: bool = False,
+    list_index_type: str = "none",
+    key_path_dict: dict = None,
+    native_value_dict: dict = None,
+) -> dict:
+    """
+    This function parses and flattens config content held in memory or read from a stream, without a file path.
+
+    Parameters
+    ----------
+    source : Any
+        This parameter retrieves the content as str, bytes, bytearray or memoryview, or a binary or text
+            file-like object.
+    config_type : str, optional
+        This parameter specifies the config type, allowing values such as "env", "yaml", "json", "xml" or "toml".
+            The default is None, which detects the type from the content.
+    The other parameters are the same as the parameters of 'flatten_config_file'.
+
+    Returns
+    -------
+    config_env_dict: dict
+        This returns the flattened environment variable key-value pairs of the content.
+    """
+    from craftsperson_env.utils.config_buffer import parse_config_buffer, parse_config_stream
+
+    parse_function = parse_config_stream if hasattr(source, "read") else parse_config_buffer
+    config_dict, config_type = parse_function(
+        source,
+        config_type=config_type,
+        config_env_replace_first_value=config_env_replace_first_value,
+        naming_case_join_type=naming_case_join_type,
+        extra_config_file_params=extra_config_file_params,
+    )
+    Checker().check_config_content(config_dict=config_dict, config_type=config_type)
+
+    config_env_dict = {}
+    ConfigFlattener(
+        naming_case_type=naming_case_type,
+        naming_case_join_type=naming_case_join_type,
+        is_remove_xml_first_level=is_remove_xml_first_level and config_type == "xml",
+        is_native_value=is_native_value,
+        list_index_type=list_index_type,
+        key_path_dict=key_path_dict,
+        native_value_dict=native_value_dict,
+    ).add_config_env(config_dict or {}, config_env_dict)
+
+    return config_env_dict
+
+
+def timed_flatten_config_file(config_file_params: dict, is_collect_stats: bool = False) -> tuple:
+    """
+    This function runs 'flatten_config_file' and measures its duration. It is used by multi-file loaders.
+
+    Parameters
+    ----------
+    config_file_params : dict
+        This parameter retrieves the keyword arguments of 'flatten_config_file'.
+    is_collect_stats : bool, optional
+        This parameter determines whether per-phase statistics are collected. The default value is False.
+
+    Returns
+    -------
+    config_env_dict: dict
+        This returns the flattened environment variable key-value pairs of the config file.
+    seconds: float
+        This returns the read, parse and flatten duration in seconds.
+    stats: LoadStats
+        This returns the per-phase statistics, or None if they are not collected.
+    key_path_dict: dict
+        This returns the key path tuple of each environment variable key.
+    native_value_dict: dict
+        This returns the parsed value of each key whose value is not a string, if the strings are kept.
+    """
+    stats = LoadStats(file_path=config_file_params["file_path"]) if is_collect_stats else None
+    key_path_dict = {}
+    native_value_dict = {}
+    start_time = time.perf_counter()
+    config_env_dict = flatten_config_file(**config_file_params, stats=stats, key_path_dict=key_path_dict,
+                                          native_value_dict=native_value_dict)
+    return config_env_dict, time.perf_counter() - start_time, stats, key_path_dict, native_value_dict
@@ -0,0 +1,97 @@
+"""
+This file resolves '${KEY}' references between flattened config values.
+"""
+
+import re
+from typing import Callable
+
+from craftsperson_env.utils.assert_controller import Checker
+from craftsperson_env.utils.config_flattener import stringify_config_value
+
+# '${KEY}' or '${KEY:-default}'
+INTERPOLATION_PATTERN = re.compile(r"\$\{([^}:]+)(?::-([^}]*))?\}")
+
+
+def interpolate_config_env(config_env_dict: dict, get_value_function: Callable) -> dict:
+    """
+    This function replaces the '${KEY}' and '${KEY:-default}' references of flattened config values. A reference
+        reads the value of the key in the config, or else the existing value of the key, or else the default.
+        References without a value are kept as they are, and a key that references itself reads its existing
+        value, such as 'PATH: ${PATH}:/opt/bin'. Values are resolved after the values they reference, each value
+        once, and values without '${' are not parsed.
+
+    Parameters
+    ----------
+    config_env_dict: dict
+        This parameter retrieves the flattened environment variable key-value pairs.
+    get_value_function: Callable
+        This parameter retrieves a function that returns the existing value of a key, or None.
+
+    Returns
+    -------
+    config_env_dict: dict
+        This returns the key-value pairs with resolved references, or the same dict if no value has a reference.
+    """
+    try:
+        template_key_list = [env_key for env_key, value in config_env_dict.items() if "${" in value]
+    except TypeError:
+        # Native values of the "munch" client may not support 'in'
+        template_key_list = [env_key for env_key, value in config_env_dict.items()
+                             if isinstance(value, str) and "${" in value]
+    if not template_key_list:
+        return config_env_dict
+
+    # Each template is split into [text, key, default, text, key, default, ..., text]
+    part_list_dict = {env_key: INTERPOLATION_PATTERN.split(config_env_dict[env_key])
+                      for env_key in template_key_list if isinstance(config_env_dict[env_key], str)}
+    resolved_dict = {}
+
+    for root_key in part_list_dict:
+        if root_key in resolved_dict:
+            continue
+
+        # Depth-first walk over the unresolved references, so a value is resolved after its references
+        path_list = [root_key]
+        path_set = {root_key}
+        while path_list:
+            env_key = path_list[-1]
+            part_list = part_list_dict[env_key]
+            for reference_key in part_list[1::3]:
+                if reference_key == env_key or reference_key in resolved_dict or reference_key not in part_list_dict:
+                    continue
+
+                if reference_key in path_set:
+                    cycle_key_list = path_list[path_list.index(reference_key):] + [reference_key]
+                    Checker().check_interpolation_cycle(cycle_key_list=cycle_key_list)
+
+                path_list.append(reference_key)
+                path_set.add(reference_key)
+                break
+            else:
+                value_list = part_list[:]
+                for index in range(1, len(part_list), 3):
+                    reference_key = part_list[index]
+                    value = None
+                    if reference_key != env_key:
+                        value = resolved_dict.get(reference_key)
+                        if value is None:
+                            value = config_env_dict.get(reference_key)
+                    if value is None:
+                        value = get_value_function(reference_key)
+
+                    if value is None:
+                        default = part_list[index + 1]
+                        value = "${" + reference_key + "}" if default is None else default
+                    elif not isinstance(value, str):
+                        value = stringify_config_value(value)
+
+                    value_list[index] = value
+                    value_list[index + 1] = ""
+
+                resolved_dict[env_key] = "".join(value_list)
+                path_list.pop()
+                path_set.discard(env_key)
+
+    config_env_dict = dict(config_env_dict)
+    config_env_dict.update(resolved_dict)
+    return config_env_dict
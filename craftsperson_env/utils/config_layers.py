@@ -0,0 +1,313 @@
+"""
+This file stacks flattened config sources as named layers and resolves each key from the highest enabled layer.
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Iterable
+
+from craftsperson_env.utils.assert_controller import Checker
+
+LAYER_MISSING = object()
+
+
+class ConfigLayers:
+    """
+    Task
+    ----
+    This class keeps flattened config sources as named layers, from the lowest to the highest precedence,
+        and an index of the layer that supplies each key. Adding, replacing, removing, enabling, disabling or
+        moving a layer changes the winner only for the keys of that layer, so only those keys are resolved
+        again and no file is parsed again. The changed keys are passed to the apply function as a config env diff.
+        A key that no enabled layer supplies falls back to its base value, or is removed.
+
+    Parameters
+    ----------
+    apply_function : Callable
+        This parameter retrieves the function that applies a config env diff.
+    base_config_env_dict : dict, optional
+        This parameter retrieves the key-value pairs below all layers, such as the environment before the layers
+            were written. The default is None, which means no base values.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self, apply_function: Callable, base_config_env_dict: dict = None):
+        self.__apply_function = apply_function
+        self.__base_config_env_dict = base_config_env_dict or {}
+        self.__layer_name_list = []
+        self.__layer_dict = {}
+        self.__disabled_layer_name_set = set()
+        self.__index_dict = {}
+        self.__lock = threading.RLock()
+        self.checker = Checker()
+
+    @property
+    def layer_name_list(self) -> list:
+        """
+        This function returns the layer names from the lowest to the highest precedence.
+
+        Returns
+        -------
+        layer_name_list: list
+            This returns the layer names, including the disabled ones.
+        """
+        return list(self.__layer_name_list)
+
+    def is_layer_enabled(self, layer_name: str) -> bool:
+        """
+        This function returns whether a layer is enabled.
+
+        Parameters
+        ----------
+        layer_name: str
+            This parameter specifies the layer name.
+
+        Returns
+        -------
+        is_layer_enabled: bool
+            This returns whether the layer supplies keys.
+        """
+        self.checker.check_config_layer(layer_name=layer_name, layer_name_list=self.__layer_name_list)
+        return layer_name not in self.__disabled_layer_name_set
+
+    def get_layer(self, layer_name: str) -> MappingProxyType:
+        """
+        This function returns the key-value pairs of a layer.
+
+        Parameters
+        ----------
+        layer_name: str
+            This parameter specifies the layer name.
+
+        Returns
+        -------
+        layer: MappingProxyType
+            This returns the read-only key-value pairs of the layer.
+        """
+        self.checker.check_config_layer(layer_name=layer_name, layer_name_list=self.__layer_name_list)
+        return MappingProxyType(self.__layer_dict[layer_name])
+
+    def get_layer_of_key(self, env_key: str) -> str:
+        """
+        This function returns the layer that supplies a key.
+
+        Parameters
+        ----------
+        env_key: str
+            This parameter specifies the environment variable key.
+
+        Returns
+        -------
+        layer_name: str
+            This returns the name of the highest enabled layer with the key, or None.
+        """
+        return self.__index_dict.get(env_key)
+
+    def get(self, env_key: str, default: Any = None) -> Any:
+        """
+        This function returns the value of a key from the highest enabled layer with the key, or else its base value.
+
+        Parameters
+        ----------
+        env_key: str
+            This parameter specifies the environment variable key.
+        default: Any, optional
+            This parameter specifies the value returned if no enabled layer or base value has the key.
+                The default is None.
+
+        Returns
+        -------
+        value: Any
+            This returns the value or the default.
+        """
+        layer_name = self.__index_dict.get(env_key)
+        if layer_name is None:
+            return self.__base_config_env_dict.get(env_key, default)
+        return self.__layer_dict[layer_name][env_key]
+
+    def __contains__(self, env_key: str) -> bool:
+        return env_key in self.__index_dict
+
+    def __len__(self) -> int:
+        return len(self.__index_dict)
+
+    def to_dict(self) -> dict:
+        """
+        This function returns the merged key-value pairs of the enabled layers, without the base values.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the key-value pairs.
+        """
+        layer_dict = self.__layer_dict
+        return {env_key: layer_dict[layer_name][env_key] for env_key, layer_name in self.__index_dict.items()}
+
+    def set_layer(self, layer_name: str, config_env_dict: dict, position: int = None) -> dict:
+        """
+        This function adds a layer, or replaces the key-value pairs of a layer in its position.
+
+        Parameters
+        ----------
+        layer_name: str
+            This parameter specifies the layer name.
+        config_env_dict: dict
+            This parameter retrieves the flattened key-value pairs of the layer.
+        position: int, optional
+            This parameter specifies the position of a new layer in the 'list.insert' style. The default is None,
+                which adds it as the highest layer.
+
+        Returns
+        -------
+        config_env_diff: dict
+            This returns the applied config env diff.
+        """
+        old_config_env_dict = self.__layer_dict.get(layer_name, {})
+
+        def set_layer():
+            if layer_name not in self.__layer_dict:
+                if position is None:
+                    self.__layer_name_list.append(layer_name)
+                else:
+                    self.__layer_name_list.insert(position, layer_name)
+            self.__layer_dict[layer_name] = dict(config_env_dict)
+
+        return self.__change_layers(env_key_set=old_config_env_dict.keys() | config_env_dict.keys(),
+                                    change_function=set_layer)
+
+    def remove_layer(self, layer_name: str) -> dict:
+        """
+        This function removes a layer.
+
+        Parameters
+        ----------
+        layer_name: str
+            This parameter specifies the layer name.
+
+        Returns
+        -------
+        config_env_diff: dict
+            This returns the applied config env diff.
+        """
+        self.checker.check_config_layer(layer_name=layer_name, layer_name_list=self.__layer_name_list)
+
+        def remove_layer():
+            self.__layer_name_list.remove(layer_name)
+            self.__disabled_layer_name_set.discard(layer_name)
+            del self.__layer_dict[layer_name]
+
+        return self.__change_layers(env_key_set=self.__layer_dict[layer_name].keys(), change_function=remove_layer)
+
+    def enable_layer(self, layer_name: str) -> dict:
+        """
+        This function enables a layer.
+
+        Parameters
+        ----------
+        layer_name: str
+            This parameter specifies the layer name.
+
+        Returns
+        -------
+        config_env_diff: dict
+            This returns the applied config env diff.
+        """
+        self.checker.check_config_layer(layer_name=layer_name, layer_name_list=self.__layer_name_list)
+        return self.__change_layers(env_key_set=self.__layer_dict[layer_name].keys(),
+                                    change_function=lambda: self.__disabled_layer_name_set.discard(layer_name))
+
+    def disable_layer(self, layer_name: str) -> dict:
+        """
+        This function disables a layer, so its keys are supplied by the lower layers.
+
+        Parameters
+        ----------
+        layer_name: str
+            This parameter specifies the layer name.
+
+        Returns
+        -------
+        config_env_diff: dict
+            This returns the applied config env diff.
+        """
+        self.checker.check_config_layer(layer_name=layer_name, layer_name_list=self.__layer_name_list)
+        return self.__change_layers(env_key_set=self.__layer_dict[layer_name].keys(),
+                                    change_function=lambda: self.__disabled_layer_name_set.add(layer_name))
+
+    def move_layer(self, layer_name: str, position: int) -> dict:
+        """
+        This function moves a layer to another position.
+
+        Parameters
+        ----------
+        layer_name: str
+            This parameter specifies the layer name.
+        position: int
+            This parameter specifies the new position in the 'list.insert' style, such as 0 for the lowest layer.
+
+        Returns
+        -------
+        config_env_diff: dict
+            This returns the applied config env diff.
+        """
+        self.checker.check_config_layer(layer_name=layer_name, layer_name_list=self.__layer_name_list)
+
+        def move_layer():
+            self.__layer_name_list.remove(layer_name)
+            self.__layer_name_list.insert(position, layer_name)
+
+        return self.__change_layers(env_key_set=self.__layer_dict[layer_name].keys(), change_function=move_layer)
+
+    def __change_layers(self, env_key_set: Iterable, change_function: Callable) -> dict:
+        """
+        This function changes the layers, resolves the given keys again and applies the changed keys.
+
+        Parameters
+        ----------
+        env_key_set: Iterable
+            This parameter retrieves the keys whose layer can change.
+        change_function: Callable
+            This parameter retrieves the function that changes the layers.
+
+        Returns
+        -------
+        config_env_diff: dict
+            This returns the applied config env diff.
+        """
+        with self.__lock:
+            env_key_list = list(env_key_set)
+            old_value_list = [self.get(env_key, LAYER_MISSING) for env_key in env_key_list]
+            change_function()
+
+            # Enabled layers from the highest to the lowest precedence
+            layer_list = [(layer_name, self.__layer_dict[layer_name])
+                          for layer_name in reversed(self.__layer_name_list)
+                          if layer_name not in self.__disabled_layer_name_set]
+            index_dict = self.__index_dict
+
+            config_env_diff = {"added": {}, "updated": {}, "removed": {}}
+            for env_key, old_value in zip(env_key_list, old_value_list):
+                for layer_name, config_env_dict in layer_list:
+                    if env_key in config_env_dict:
+                        index_dict[env_key] = layer_name
+                        value = config_env_dict[env_key]
+                        break
+                else:
+                    index_dict.pop(env_key, None)
+                    value = self.__base_config_env_dict.get(env_key, LAYER_MISSING)
+
+                if value is LAYER_MISSING:
+                    if old_value is not LAYER_MISSING:
+                        config_env_diff["removed"][env_key] = old_value
+                elif old_value is LAYER_MISSING:
+                    config_env_diff["added"][env_key] = value
+                elif old_value != value:
+                    config_env_diff["updated"][env_key] = (old_value, value)
+
+            if any(config_env_diff.values()):
+                self.__apply_function(config_env_diff)
+
+            return config_env_diff
@@ -0,0 +1,237 @@
+"""
+This file compiles typed config classes into loaders that fill a slotted config object in one pass.
+"""
+
+import os
+import types
+import typing
+from functools import lru_cache
+from typing import Any, Mapping
+
+from craftsperson_env.utils.assert_controller import Checker
+from craftsperson_env.utils.config_flattener import stringify_config_value
+from craftsperson_env.utils.value_cache import CONVERSION_FAILED, copy_cached_value
+from craftsperson_env.utils.value_converter import get_value_converter, is_value_of_type
+
+SCHEMA_MISSING = object()
+
+# 'int | None' annotations have the 'types.UnionType' origin, which exists on Python 3.10 and later only
+UNION_ORIGIN_TUPLE = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+
+class SlotsConfig:
+    """
+    Task
+    ----
+    This class is the base of the slotted config objects filled by a compiled config schema.
+
+    Parameters
+    ----------
+    None.
+
+    Returns
+    -------
+    None.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        """
+        This function returns the fields of the config object.
+
+        Returns
+        -------
+        config_dict: dict
+            This returns the field name-value pairs.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        field_text = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({field_text})"
+
+
+def get_schema_field_type(annotation: Any) -> tuple:
+    """
+    This function resolves the value type of a field annotation.
+
+    Parameters
+    ----------
+    annotation: Any
+        This parameter retrieves the field annotation, such as int, list[str] or Optional[int].
+
+    Returns
+    -------
+    value_type: Any
+        This returns the value type, such as int or list.
+    is_optional: bool
+        This returns whether the annotation allows None.
+    """
+    origin = typing.get_origin(annotation)
+    if origin in UNION_ORIGIN_TUPLE:
+        argument_list = [argument for argument in typing.get_args(annotation) if argument is not type(None)]
+        is_optional = len(argument_list) < len(typing.get_args(annotation))
+        if len(argument_list) == 1:
+            return get_schema_field_type(argument_list[0])[0], is_optional
+        return str, is_optional
+
+    return (origin if origin is not None else annotation), False
+
+
+class CompiledConfigSchema:
+    """
+    Task
+    ----
+    This class loads the fields of a typed config class from environment variables. The fields, their
+        environment variable keys, defaults and value converters are resolved once when the schema is compiled,
+        so a load is a single pass over the fields without type dispatch. Values parsed by the last load are
+        reused while their raw string is unchanged, so dict and list values are shared between loads and
+        should not be mutated. All missing and invalid fields are reported together.
+
+    Parameters
+    ----------
+    schema_class : type
+        This parameter retrieves a dataclass or a class with annotated fields. The environment variable key of
+            a field is the 'env_key' of its dataclass field metadata, or else the prefix and the upper field name.
+    prefix : str, optional
+        This parameter specifies the prefix of the environment variable keys. The default is "".
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self, schema_class: type, prefix: str = ""):
+        import dataclasses
+
+        self.schema_class = schema_class
+        annotation_dict = typing.get_type_hints(schema_class)
+
+        field_list = []
+        if dataclasses.is_dataclass(schema_class):
+            for field in dataclasses.fields(schema_class):
+                if field.default is not dataclasses.MISSING:
+                    default, default_factory = field.default, None
+                elif field.default_factory is not dataclasses.MISSING:
+                    default, default_factory = SCHEMA_MISSING, field.default_factory
+                else:
+                    default, default_factory = SCHEMA_MISSING, None
+                env_key = field.metadata.get("env_key", prefix + field.name.upper())
+                field_list.append((field.name, env_key, annotation_dict[field.name], default, default_factory))
+        else:
+            for name, annotation in annotation_dict.items():
+                if typing.get_origin(annotation) is typing.ClassVar:
+                    continue
+                default = getattr(schema_class, name, SCHEMA_MISSING)
+                field_list.append((name, prefix + name.upper(), annotation, default, None))
+
+        # Each field is (name, env key, value type, converter, default, default factory)
+        self.__field_list = []
+        for name, env_key, annotation, default, default_factory in field_list:
+            value_type, is_optional = get_schema_field_type(annotation)
+            if is_optional and default is SCHEMA_MISSING and default_factory is None:
+                default = None
+            self.__field_list.append(
+                (name, env_key, value_type, get_value_converter(value_type), default, default_factory)
+            )
+
+        self.__last_value_dict = {}
+        self.config_class = type(
+            f"{schema_class.__name__}Config",
+            (SlotsConfig,),
+            {"__slots__": tuple(name for name, *_ in self.__field_list), "__module__": schema_class.__module__},
+        )
+
+    @property
+    def env_key_dict(self) -> dict:
+        """
+        This function returns the environment variable key of each field.
+
+        Returns
+        -------
+        env_key_dict: dict
+            This returns the field name-environment variable key pairs.
+        """
+        return {name: env_key for name, env_key, *_ in self.__field_list}
+
+    def load(self, environ: Mapping = None) -> SlotsConfig:
+        """
+        This function fills a config object from environment variables.
+
+        Parameters
+        ----------
+        environ : Mapping, optional
+            This parameter retrieves the environment variable key-value pairs. Native values, such as those of
+                the "munch" client store, are used as they are if they already have the field type.
+                The default is None, which reads the 'os.environ' system.
+
+        Returns
+        -------
+        config: SlotsConfig
+            This returns the config object with one slot per field.
+        """
+        if environ is None:
+            environ = os.environ
+
+        config = self.config_class.__new__(self.config_class)
+        last_value_dict = self.__last_value_dict
+        error_list = []
+        for name, env_key, value_type, converter, default, default_factory in self.__field_list:
+            value = environ.get(env_key, None)
+
+            if value is None:
+                if default is not SCHEMA_MISSING:
+                    value = default
+                elif default_factory is not None:
+                    value = default_factory()
+                else:
+                    error_list.append(f"{name} ({env_key}): missing")
+                    continue
+
+            elif isinstance(value, str):
+                # Values parsed by the last load are reused while their raw string is unchanged
+                last_raw_value, last_value = last_value_dict.get(name, (None, None))
+                if value == last_raw_value:
+                    value = last_value
+                else:
+                    raw_value, value = value, converter(value)
+                    last_value_dict[name] = (raw_value, value)
+                # The schema and its parsed values are shared by every load, so mutable values are copied
+                value = copy_cached_value(value)
+            elif not is_value_of_type(value, value_type):
+                value = converter(stringify_config_value(value))
+
+            if value is CONVERSION_FAILED:
+                error_list.append(f"{name} ({env_key}): not a valid {getattr(value_type, '__name__', value_type)}")
+                continue
+
+            setattr(config, name, value)
+
+        if error_list:
+            Checker().check_config_schema_error(error_list=error_list, schema_name=self.schema_class.__name__)
+
+        return config
+
+
+@lru_cache(maxsize=None)
+def compile_config_schema(schema_class: type, prefix: str = "") -> CompiledConfigSchema:
+    """
+    This function compiles a typed config class once per class and prefix.
+
+    Parameters
+    ----------
+    schema_class : type
+        This parameter retrieves a dataclass or a class with annotated fields.
+    prefix : str, optional
+        This parameter specifies the prefix of the environment variable keys. The default is "".
+
+    Returns
+    -------
+    compiled_config_schema: CompiledConfigSchema
+        This returns the compiled schema.
+    """
+    return CompiledConfigSchema(schema_class=schema_class, prefix=prefix)
@@ -0,0 +1,319 @@
+"""
+This file compiles flattened config files into a binary snapshot file that is read through a memory map.
+
+A snapshot file is a header, an index of (key offset, key length, value length) entries sorted by key,
+a hash table of index entries, the keys and values as UTF-8 text, and the marshalled key paths of the keys:
+
+    magic | format version | checksum | key count | hash slot count | data offset | key path offset | file size
+    index entries ... | hash slots ... | key, value, key, value ... | key paths
+
+The checksum is the CRC32 of everything after the header. The hash table uses the CRC32 of a key with linear probing,
+so it is the same in every process. A lookup reads only a few pages of the file, and every process that maps
+the file shares them in the page cache.
+"""
+
+import marshal
+import os
+import struct
+import zlib
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+from craftsperson_env.utils.assert_controller import Checker
+from craftsperson_env.utils.config_flattener import stringify_config_value
+from craftsperson_env.utils.contraster import CONFIG_SNAPSHOT_FORMAT_VERSION, CONFIG_SNAPSHOT_MAGIC
+from craftsperson_env.utils.path_modifier import set_shared_file_mode
+
+SNAPSHOT_HEADER_STRUCT = struct.Struct("<8sIIQQQQQ")
+
+SNAPSHOT_INDEX_STRUCT = struct.Struct("<QII")
+
+# A hash slot holds the index entry number plus one, and 0 if the slot is empty
+SNAPSHOT_HASH_SLOT_STRUCT = struct.Struct("<I")
+
+# Environment variables may hold undecodable bytes, which 'os.environ' keeps as surrogates
+SNAPSHOT_TEXT_ERRORS = "surrogateescape"
+
+
+def write_config_snapshot(snapshot_path: str, config_env_dict: dict, key_path_group_list: list = ()) -> int:
+    """
+    This function writes flattened key-value pairs to a snapshot file atomically. Processes that mapped the
+        previous file keep reading it until they open the new one.
+
+    Parameters
+    ----------
+    snapshot_path : str
+        This parameter specifies the snapshot file path.
+    config_env_dict : dict
+        This parameter retrieves the flattened key-value pairs. Native values are stored as strings.
+    key_path_group_list : list, optional
+        This parameter retrieves (naming_case_type, naming_case_join_type, key_path_dict) tuples with the key path
+            tuple of each key, so subtree queries can index the keys of the snapshot. The default is ().
+
+    Returns
+    -------
+    checksum: int
+        This returns the checksum of the snapshot file.
+    """
+    import tempfile
+
+    item_list = sorted(
+        (env_key.encode("utf-8", SNAPSHOT_TEXT_ERRORS),
+         (value if isinstance(value, str) else stringify_config_value(value)).encode("utf-8", SNAPSHOT_TEXT_ERRORS))
+        for env_key, value in config_env_dict.items()
+    )
+
+    # Key paths are stored in the key order of the index with the index of their naming case group,
+    # so the keys are not stored twice
+    naming_case_group_list = []
+    key_path_item_dict = {}
+    for group_index, (naming_case_type, naming_case_join_type, key_path_dict) in enumerate(key_path_group_list):
+        naming_case_group_list.append((naming_case_type, naming_case_join_type))
+        key_path_item_dict.update((env_key, (group_index, key_tuple)) for env_key, key_tuple in key_path_dict.items())
+
+    try:
+        key_path_bytes = marshal.dumps((
+            naming_case_group_list,
+            [key_path_item_dict.get(key_bytes.decode("utf-8", SNAPSHOT_TEXT_ERRORS)) for key_bytes, _ in item_list],
+        ))
+    except ValueError:
+        # Key paths with keys that cannot be marshalled are left out, so the keys are not indexed
+        key_path_bytes = marshal.dumps(([], []))
+
+    # The hash table is at most half full, so a lookup probes one or two slots on average
+    hash_slot_count = 1
+    while hash_slot_count < 2 * len(item_list):
+        hash_slot_count *= 2
+    hash_slot_list = [0] * hash_slot_count
+    for index, (key_bytes, _) in enumerate(item_list, start=1):
+        slot = zlib.crc32(key_bytes) & (hash_slot_count - 1)
+        while hash_slot_list[slot]:
+            slot = (slot + 1) & (hash_slot_count - 1)
+        hash_slot_list[slot] = index
+    hash_bytes = struct.pack(f"<{hash_slot_count}I", *hash_slot_list)
+
+    data_offset = (SNAPSHOT_HEADER_STRUCT.size + SNAPSHOT_INDEX_STRUCT.size * len(item_list)
+                   + SNAPSHOT_HASH_SLOT_STRUCT.size * hash_slot_count)
+    index_bytes = bytearray()
+    data_bytes = bytearray()
+    for key_bytes, value_bytes in item_list:
+        index_bytes += SNAPSHOT_INDEX_STRUCT.pack(data_offset + len(data_bytes), len(key_bytes), len(value_bytes))
+        data_bytes += key_bytes
+        data_bytes += value_bytes
+
+    key_path_offset = data_offset + len(data_bytes)
+    checksum = zlib.crc32(index_bytes)
+    for section_bytes in (hash_bytes, data_bytes, key_path_bytes):
+        checksum = zlib.crc32(section_bytes, checksum)
+    header_bytes = SNAPSHOT_HEADER_STRUCT.pack(
+        CONFIG_SNAPSHOT_MAGIC, CONFIG_SNAPSHOT_FORMAT_VERSION, checksum, len(item_list), hash_slot_count,
+        data_offset, key_path_offset, key_path_offset + len(key_path_bytes),
+    )
+
+    snapshot_dir = os.path.dirname(os.path.abspath(snapshot_path))
+    file_descriptor, temp_path = tempfile.mkstemp(dir=snapshot_dir)
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            # Worker processes may run as another user than the process that builds the snapshot
+            set_shared_file_mode(file.fileno())
+            file.write(header_bytes)
+            file.write(index_bytes)
+            file.write(hash_bytes)
+            file.write(data_bytes)
+            file.write(key_path_bytes)
+        os.replace(temp_path, snapshot_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    return checksum
+
+
+class ConfigSnapshot(Mapping):
+    """
+    Task
+    ----
+    This class maps a snapshot file read-only and serves its key-value pairs as a read-only mapping.
+        Opening a snapshot checks its header and optionally its checksum, a lookup probes the hash table
+        and decodes only the found value, and iteration follows the sorted key order.
+
+    Parameters
+    ----------
+    snapshot_path : str
+        This parameter specifies the snapshot file path.
+    is_verify_checksum : bool, optional
+        This parameter determines whether the checksum is verified, which reads the whole file once.
+            The default value is True.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self, snapshot_path: str, is_verify_checksum: bool = True):
+        import mmap
+
+        self.snapshot_path = snapshot_path
+        checker = Checker()
+
+        with open(snapshot_path, "rb") as file:
+            file_size = os.fstat(file.fileno()).st_size
+            checker.check_config_snapshot_error(
+                error=None if file_size >= SNAPSHOT_HEADER_STRUCT.size else "the file is shorter than the header",
+                snapshot_path=snapshot_path,
+            )
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            (magic, self.format_version, self.checksum, self.__key_count, self.__hash_slot_count,
+             self.__data_offset, self.__key_path_offset, expected_file_size) = SNAPSHOT_HEADER_STRUCT.unpack_from(
+                self.__mmap, 0
+            )
+            self.__hash_offset = SNAPSHOT_HEADER_STRUCT.size + SNAPSHOT_INDEX_STRUCT.size * self.__key_count
+
+            error = None
+            if magic != CONFIG_SNAPSHOT_MAGIC:
+                error = "the file is not a config snapshot"
+            elif self.format_version != CONFIG_SNAPSHOT_FORMAT_VERSION:
+                error = (f"the format version is {self.format_version}, "
+                         f"rebuild it with format version {CONFIG_SNAPSHOT_FORMAT_VERSION}")
+            elif file_size != expected_file_size:
+                error = f"the file has {file_size} bytes instead of {expected_file_size}"
+            elif is_verify_checksum and self.__get_checksum() != self.checksum:
+                error = "the checksum does not match"
+            checker.check_config_snapshot_error(error=error, snapshot_path=snapshot_path)
+        except BaseException:
+            self.__mmap.close()
+            raise
+
+    def __get_checksum(self) -> int:
+        """
+        This function computes the checksum of everything after the header.
+
+        Returns
+        -------
+        checksum: int
+            This returns the CRC32 checksum.
+        """
+        with memoryview(self.__mmap) as snapshot_view:
+            return zlib.crc32(snapshot_view[SNAPSHOT_HEADER_STRUCT.size:])
+
+    def __find(self, key: str) -> tuple:
+        """
+        This function finds a key by probing the hash table.
+
+        Parameters
+        ----------
+        key : str
+            This parameter specifies the environment variable key.
+
+        Returns
+        -------
+        value_offset: int
+            This returns the offset of the value, or None if the key is not found.
+        value_length: int
+            This returns the length of the value in bytes.
+        """
+        snapshot_mmap = self.__mmap
+        key_bytes = key.encode("utf-8", SNAPSHOT_TEXT_ERRORS)
+        hash_mask = self.__hash_slot_count - 1
+
+        slot = zlib.crc32(key_bytes) & hash_mask
+        while True:
+            (index,) = SNAPSHOT_HASH_SLOT_STRUCT.unpack_from(
+                snapshot_mmap, self.__hash_offset + slot * SNAPSHOT_HASH_SLOT_STRUCT.size
+            )
+            if not index:
+                return None, 0
+
+            key_offset, key_length, value_length = SNAPSHOT_INDEX_STRUCT.unpack_from(
+                snapshot_mmap, SNAPSHOT_HEADER_STRUCT.size + (index - 1) * SNAPSHOT_INDEX_STRUCT.size
+            )
+            if key_length == len(key_bytes) and snapshot_mmap[key_offset:key_offset + key_length] == key_bytes:
+                return key_offset + key_length, value_length
+            slot = (slot + 1) & hash_mask
+
+    def __iter_items(self) -> Iterator:
+        """
+        This function iterates the index in key order.
+
+        Returns
+        -------
+        item_iterator: Iterator
+            This returns an iterator of (key offset, key length, value length) tuples.
+        """
+        return SNAPSHOT_INDEX_STRUCT.iter_unpack(
+            self.__mmap[SNAPSHOT_HEADER_STRUCT.size:self.__hash_offset]
+        )
+
+    def __getitem__(self, key: str) -> str:
+        value_offset, value_length = self.__find(key)
+        if value_offset is None:
+            raise KeyError(key)
+        return self.__mmap[value_offset:value_offset + value_length].decode("utf-8", SNAPSHOT_TEXT_ERRORS)
+
+    def __contains__(self, key: Any) -> bool:
+        return isinstance(key, str) and self.__find(key)[0] is not None
+
+    def __iter__(self) -> Iterator:
+        snapshot_mmap = self.__mmap
+        for key_offset, key_length, _ in self.__iter_items():
+            yield snapshot_mmap[key_offset:key_offset + key_length].decode("utf-8", SNAPSHOT_TEXT_ERRORS)
+
+    def __len__(self) -> int:
+        return self.__key_count
+
+    def to_dict(self) -> dict:
+        """
+        This function decodes every key-value pair in one pass over the file.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the environment variable key-value pairs.
+        """
+        snapshot_mmap = self.__mmap
+        config_env_dict = {}
+        for key_offset, key_length, value_length in self.__iter_items():
+            value_offset = key_offset + key_length
+            config_env_dict[snapshot_mmap[key_offset:value_offset].decode("utf-8", SNAPSHOT_TEXT_ERRORS)] = \
+                snapshot_mmap[value_offset:value_offset + value_length].decode("utf-8", SNAPSHOT_TEXT_ERRORS)
+        return config_env_dict
+
+    @property
+    def key_path_group_list(self) -> list:
+        """
+        This function returns the key paths stored in the snapshot file.
+
+        Returns
+        -------
+        key_path_group_list: list
+            This returns (naming_case_type, naming_case_join_type, key_path_dict) tuples.
+        """
+        naming_case_group_list, key_path_item_list = marshal.loads(self.__mmap[self.__key_path_offset:])
+        key_path_group_list = [(naming_case_type, naming_case_join_type, {})
+                               for naming_case_type, naming_case_join_type in naming_case_group_list]
+        for env_key, key_path_item in zip(self, key_path_item_list):
+            if key_path_item is not None:
+                key_path_group_list[key_path_item[0]][2][env_key] = key_path_item[1]
+        return key_path_group_list
+
+    def close(self) -> None:
+        """
+        This function unmaps the snapshot file.
+
+        Returns
+        -------
+        None.
+        """
+        self.__mmap.close()
+
+    def __enter__(self) -> "ConfigSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f"ConfigSnapshot(snapshot_path={self.snapshot_path!r}, key_count={self.__key_count}, "
+                f"checksum={self.checksum:#010x})")
@@ -0,0 +1,484 @@
+"""
+This file watches config files and applies only the keys that changed.
+"""
+
+import os
+import select
+import sys
+import threading
+from typing import AsyncIterator, Callable
+
+from craftsperson_env.utils.config_flattener import flatten_config_file
+
+# Linux inotify event masks that can change the content of a watched file
+INOTIFY_WATCH_MASK = 0x00000002 | 0x00000008 | 0x00000080 | 0x00000100 | 0x00000200  # MODIFY, CLOSE_WRITE, MOVED_TO, CREATE, DELETE
+INOTIFY_INIT_FLAGS = 0o4000 | 0o2000000  # IN_NONBLOCK, IN_CLOEXEC
+
+WATCHER_STOPPED = object()
+
+DIFF_MISSING = object()
+
+
+def get_config_env_diff(old_config_env_dict: dict, new_config_env_dict: dict) -> dict:
+    """
+    This function compares two flattened configs.
+
+    Parameters
+    ----------
+    old_config_env_dict: dict
+        This parameter retrieves the last applied key-value pairs.
+    new_config_env_dict: dict
+        This parameter retrieves the new key-value pairs.
+
+    Returns
+    -------
+    config_env_diff: dict
+        This returns the 'added' key-value pairs, the 'updated' keys with (old value, new value) tuples
+            and the 'removed' key-value pairs.
+    """
+    config_env_diff = {"added": {}, "updated": {}, "removed": {}}
+
+    for key, value in new_config_env_dict.items():
+        # Keys may hold None as their value, so a missing key is found with a sentinel
+        old_value = old_config_env_dict.get(key, DIFF_MISSING)
+        if old_value is DIFF_MISSING:
+            config_env_diff["added"][key] = value
+        elif old_value != value:
+            config_env_diff["updated"][key] = (old_value, value)
+
+    for key, old_value in old_config_env_dict.items():
+        if key not in new_config_env_dict:
+            config_env_diff["removed"][key] = old_value
+
+    return config_env_diff
+
+
+class ConfigWatcher:
+    """
+    Task
+    ----
+    This class watches config files on a background thread. It waits for inotify events where available and
+    falls back to polling the modification time, size and inode of each file. After a burst of writes has settled,
+    it re-parses only the changed files, applies only the keys that changed, and notifies the callbacks.
+    Parse errors and errors raised by callbacks are stored in 'last_error', and the thread keeps watching.
+
+    Parameters
+    ----------
+    config_file_params_list : list
+        This parameter retrieves the 'flatten_config_file' keyword arguments of each file in override order.
+    apply_function : Callable
+        This parameter retrieves the function that applies a config env diff.
+    poll_interval : float, optional
+        This parameter specifies the seconds between two checks of the files. The default is 1.0.
+    debounce_seconds : float, optional
+        This parameter specifies the seconds without changes before a reload. The default is 0.1.
+    is_use_inotify : bool, optional
+        This parameter determines whether inotify is used where available. The default value is True.
+    interpolate_function : Callable, optional
+        This parameter retrieves a function that resolves the references of the merged key-value pairs.
+            The default is None.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(
+        self,
+        config_file_params_list: list,
+        apply_function: Callable,
+        poll_interval: float = 1.0,
+        debounce_seconds: float = 0.1,
+        is_use_inotify: bool = True,
+        interpolate_function: Callable = None,
+    ):
+        self.config_file_params_list = config_file_params_list
+        self.poll_interval = poll_interval
+        self.debounce_seconds = debounce_seconds
+        self.last_error = None
+        self.__apply_function = apply_function
+        self.__is_use_inotify = is_use_inotify
+        self.__interpolate_function = interpolate_function
+        self.__callback_list = []
+        self.__event_queue_list = []
+        self.__signature_list = [self.__get_signature(params["file_path"]) for params in config_file_params_list]
+        self.__file_config_env_dict_list = [flatten_config_file(**params) for params in config_file_params_list]
+        self.__config_env_dict = self.__merge_config_env(self.__file_config_env_dict_list)
+        self.__inotify_fd = None
+        self.__wake_fd_tuple = None
+        self.__stop_event = threading.Event()
+        self.__thread = None
+        # Guards the file signatures and the reload state shared by 'check', 'reload' and the watcher thread
+        self.__reload_lock = threading.RLock()
+
+    @property
+    def config_env_dict(self) -> dict:
+        """
+        This function returns the last applied key-value pairs.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the last applied key-value pairs.
+        """
+        return self.__config_env_dict
+
+    @property
+    def is_inotify(self) -> bool:
+        """
+        This function returns whether the watcher waits for inotify events instead of polling.
+
+        Returns
+        -------
+        is_inotify: bool
+            This returns whether inotify is used.
+        """
+        return self.__inotify_fd is not None
+
+    def add_callback(self, callback: Callable) -> None:
+        """
+        This function registers a callback that receives the config env diff of each reload.
+
+        Parameters
+        ----------
+        callback: Callable
+            This parameter retrieves the callback.
+
+        Returns
+        -------
+        None.
+        """
+        self.__callback_list.append(callback)
+
+    def remove_callback(self, callback: Callable) -> None:
+        """
+        This function unregisters a callback.
+
+        Parameters
+        ----------
+        callback: Callable
+            This parameter retrieves the callback.
+
+        Returns
+        -------
+        None.
+        """
+        self.__callback_list.remove(callback)
+
+    def aiter_config_env_diff(self) -> AsyncIterator:
+        """
+        This function returns an async iterator of the config env diffs of the reloads after the iteration starts.
+            The diffs are passed from the watcher thread to the event loop, and the iteration ends when
+            the watcher stops. 'async for config_env_diff in watcher' is the same.
+
+        Returns
+        -------
+        config_env_diff_iterator: AsyncIterator
+            This returns an async iterator of config env diffs.
+        """
+        import asyncio
+
+        async def iter_config_env_diff():
+            loop = asyncio.get_running_loop()
+            event_queue = asyncio.Queue()
+            event_queue_item = (loop, event_queue)
+            self.__event_queue_list.append(event_queue_item)
+            try:
+                while True:
+                    config_env_diff = await event_queue.get()
+                    if config_env_diff is WATCHER_STOPPED:
+                        return
+                    yield config_env_diff
+            finally:
+                self.__event_queue_list.remove(event_queue_item)
+
+        return iter_config_env_diff()
+
+    def __aiter__(self) -> AsyncIterator:
+        return self.aiter_config_env_diff()
+
+    def __put_event(self, event: object) -> None:
+        """
+        This function passes an event to the event loop of each async iterator.
+
+        Parameters
+        ----------
+        event: object
+            This parameter retrieves a config env diff, or WATCHER_STOPPED.
+
+        Returns
+        -------
+        None.
+        """
+        for loop, event_queue in list(self.__event_queue_list):
+            try:
+                loop.call_soon_threadsafe(event_queue.put_nowait, event)
+            except RuntimeError:
+                # The event loop of the iterator is closed
+                pass
+
+    def start(self) -> "ConfigWatcher":
+        """
+        This function starts the background thread.
+
+        Returns
+        -------
+        watcher: ConfigWatcher
+            This returns the watcher itself.
+        """
+        if self.__thread is not None:
+            return self
+
+        if self.__is_use_inotify:
+            self.__inotify_fd = self.__open_inotify()
+            if self.__inotify_fd is not None:
+                self.__wake_fd_tuple = os.pipe()
+
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__run, name="craftsperson-env-watcher", daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        This function stops the background thread.
+
+        Returns
+        -------
+        None.
+        """
+        self.__stop_event.set()
+        if self.__wake_fd_tuple is not None:
+            os.write(self.__wake_fd_tuple[1], b"\0")
+
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+        if self.__inotify_fd is not None:
+            os.close(self.__inotify_fd)
+            self.__inotify_fd = None
+
+        if self.__wake_fd_tuple is not None:
+            for wake_fd in self.__wake_fd_tuple:
+                os.close(wake_fd)
+            self.__wake_fd_tuple = None
+
+        self.__put_event(WATCHER_STOPPED)
+
+    def check(self) -> dict:
+        """
+        This function checks the files once and reloads the changed ones without debouncing. It may be called
+            while the watcher thread runs, since a change is detected and applied by only one of them.
+
+        Returns
+        -------
+        config_env_diff: dict
+            This returns the applied config env diff, or None if no file changed.
+        """
+        with self.__reload_lock:
+            changed_index_set = self.__get_changed_index_set()
+            if not changed_index_set:
+                return None
+
+            return self.reload(changed_index_set=changed_index_set)
+
+    def reload(self, changed_index_set: set = None) -> dict:
+        """
+        This function re-parses the changed files, applies the changed keys and notifies the callbacks.
+            If a file cannot be parsed, nothing is applied and the error is stored in 'last_error'.
+            An error raised by a callback is stored in 'last_error' too, and the other callbacks are still notified.
+            An error raised by the apply function is raised, and the previous state is kept, so the next reload
+            applies the change again.
+            Reloads of 'check', 'reload' and the watcher thread are serialized by a lock, so a change is diffed and
+            applied once.
+
+        Parameters
+        ----------
+        changed_index_set: set, optional
+            This parameter retrieves the indexes of the changed files. The default is None, which reloads every file.
+
+        Returns
+        -------
+        config_env_diff: dict
+            This returns the applied config env diff, or None if a file cannot be parsed.
+        """
+        with self.__reload_lock:
+            if changed_index_set is None:
+                changed_index_set = set(range(len(self.config_file_params_list)))
+
+            file_config_env_dict_list = list(self.__file_config_env_dict_list)
+            try:
+                for index in changed_index_set:
+                    file_config_env_dict_list[index] = flatten_config_file(**self.config_file_params_list[index])
+                config_env_dict = self.__merge_config_env(file_config_env_dict_list)
+            except Exception as error:
+                self.last_error = error
+                return None
+
+            self.last_error = None
+            config_env_diff = get_config_env_diff(self.__config_env_dict, config_env_dict)
+            if any(config_env_diff.values()):
+                # The new state is stored only once it is applied, so the next reload applies it again after an error
+                self.__apply_function(config_env_diff)
+            self.__file_config_env_dict_list = file_config_env_dict_list
+            self.__config_env_dict = config_env_dict
+
+            if not any(config_env_diff.values()):
+                return config_env_diff
+
+            for callback in list(self.__callback_list):
+                try:
+                    callback(config_env_diff)
+                except Exception as error:
+                    # A failing callback must not stop the other callbacks or the watcher thread
+                    self.last_error = error
+            self.__put_event(config_env_diff)
+
+            return config_env_diff
+
+    def __merge_config_env(self, file_config_env_dict_list: list) -> dict:
+        """
+        This function merges the flattened files in override order and resolves their references.
+
+        Parameters
+        ----------
+        file_config_env_dict_list: list
+            This parameter retrieves the flattened key-value pairs of each file.
+
+        Returns
+        -------
+        config_env_dict: dict
+            This returns the merged key-value pairs.
+        """
+        config_env_dict = {}
+        for file_config_env_dict in file_config_env_dict_list:
+            config_env_dict.update(file_config_env_dict)
+        if self.__interpolate_function is not None:
+            config_env_dict = self.__interpolate_function(config_env_dict)
+        return config_env_dict
+
+    @staticmethod
+    def __get_signature(file_path: str) -> tuple:
+        """
+        This function returns the modification time, size and inode of a file, or None if it does not exist.
+
+        Parameters
+        ----------
+        file_path: str
+            This parameter specifies the file location path.
+
+        Returns
+        -------
+        signature: tuple
+            This returns the file signature.
+        """
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino
+
+    def __get_changed_index_set(self) -> set:
+        """
+        This function compares the file signatures with the last seen ones and stores the new ones.
+
+        Returns
+        -------
+        changed_index_set: set
+            This returns the indexes of the changed files.
+        """
+        changed_index_set = set()
+        with self.__reload_lock:
+            for index, params in enumerate(self.config_file_params_list):
+                signature = self.__get_signature(params["file_path"])
+                if signature != self.__signature_list[index]:
+                    self.__signature_list[index] = signature
+                    changed_index_set.add(index)
+        return changed_index_set
+
+    def __open_inotify(self) -> int:
+        """
+        This function opens an inotify descriptor watching the directories of the files on Linux.
+
+        Returns
+        -------
+        inotify_fd: int
+            This returns the inotify file descriptor, or None if inotify is not available.
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+
+        try:
+            import ctypes
+
+            libc = ctypes.CDLL(None, use_errno=True)
+            inotify_fd = libc.inotify_init1(INOTIFY_INIT_FLAGS)
+        except (OSError, AttributeError):
+            return None
+
+        if inotify_fd < 0:
+            return None
+
+        # Watch the directories, since editors often replace a file instead of writing it
+        directory_set = {os.path.dirname(os.path.abspath(params["file_path"]))
+                         for params in self.config_file_params_list}
+        for directory in directory_set:
+            if libc.inotify_add_watch(inotify_fd, os.fsencode(directory), INOTIFY_WATCH_MASK) < 0:
+                os.close(inotify_fd)
+                return None
+
+        return inotify_fd
+
+    def __wait(self, timeout: float) -> None:
+        """
+        This function waits for inotify events, the timeout or the stop event.
+
+        Parameters
+        ----------
+        timeout: float
+            This parameter specifies the maximum seconds to wait.
+
+        Returns
+        -------
+        None.
+        """
+        if self.__inotify_fd is None:
+            self.__stop_event.wait(timeout)
+            return
+
+        readable_list, _, _ = select.select([self.__inotify_fd, self.__wake_fd_tuple[0]], [], [], timeout)
+        if self.__inotify_fd in readable_list:
+            try:
+                while os.read(self.__inotify_fd, 65536):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def __run(self) -> None:
+        """
+        This function runs the watch loop of the background thread.
+
+        Returns
+        -------
+        None.
+        """
+        while not self.__stop_event.is_set():
+            self.__wait(self.poll_interval)
+            changed_index_set = self.__get_changed_index_set()
+            if not changed_index_set or self.__stop_event.is_set():
+                continue
+
+            # Debounce a burst of writes until the files stop changing
+            while not self.__stop_event.wait(self.debounce_seconds):
+                new_changed_index_set = self.__get_changed_index_set()
+                if not new_changed_index_set:
+                    break
+                changed_index_set |= new_changed_index_set
+
+            if not self.__stop_event.is_set():
+                try:
+                    self.reload(changed_index_set=changed_index_set)
+                except Exception as error:
+                    # The thread keeps watching, so a later change is applied after an error of the apply function
+                    self.last_error = error
@@ -7,3 +7,38 @@ NAMING_CASE_LIST = ["pascal", "camel", "snake", "kebab", "flat",
                     "screaming-snake", "cobol"]
 
 OTHER_CONFIG_NAME_TYPE_LIST = ["upper", "lower"]
+
+LITERAL_FIRST_CHARACTER_LIST = ["{", "[", "(", '"', "'"]
+
+LITERAL_MAX_LENGTH = 100000
+
+LITERAL_CACHE_SIZE = 4096
+
+LITERAL_CACHE_MAX_LENGTH = 1024
+
+NAMING_CASE_CACHE_SIZE = 131072
+
+VALUE_CACHE_SIZE = 65536
+
+EXECUTOR_TYPE_LIST = ["thread", "process"]
+
+LIST_INDEX_TYPE_LIST = ["none", "index"]
+
+CONFIG_CACHE_MAGIC = b"CRFTCACH"
+
+CONFIG_CACHE_FORMAT_VERSION = 3
+
+CONFIG_CACHE_FILE_SUFFIX = ".cache"
+
+CONFIG_SNAPSHOT_MAGIC = b"CRFTSNAP"
+
+CONFIG_SNAPSHOT_FORMAT_VERSION = 1
+
+CONFIG_SNIFF_SIZE = 4096
+
+# Parser backends of each file type, from the fastest to the most portable
+PARSER_BACKEND_DICT = {
+    "yaml": ["libyaml", "pyyaml"],
+    "json": ["orjson", "json"],
+    "toml": ["tomllib", "toml"],
+}
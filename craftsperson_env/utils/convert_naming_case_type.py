@@ -1,4 +1,64 @@
-from craftsperson_env.utils.contraster import OTHER_CONFIG_NAME_TYPE_LIST, NAMING_CASE_LIST
+from functools import lru_cache
+from typing import Callable
+
+from craftsperson_env.utils.contraster import NAMING_CASE_CACHE_SIZE
+
+# Each naming case type is (first key function, other key function, join value).
+NAMING_CASE_CONVERTER_DICT = {
+    "pascal": (str.capitalize, str.capitalize, ""),
+    "camel": (str.lower, str.capitalize, ""),
+    "snake": (str.lower, str.lower, "_"),
+    "kebab": (str.lower, str.lower, "-"),
+    "flat": (str.lower, str.lower, ""),
+    "upper-flat": (str.upper, str.upper, ""),
+    "pascal-snake": (str.capitalize, str.capitalize, "_"),
+    "camel-snake": (str.lower, str.capitalize, "_"),
+    "screaming-snake": (str.upper, str.upper, "_"),
+    "cobol": (str.upper, str.upper, "-"),
+}
+
+# Other config name types use the naming case join type as join value.
+OTHER_CONFIG_NAME_CONVERTER_DICT = {
+    "upper": (str.upper, str.upper),
+    "lower": (str.lower, str.lower),
+}
+
+
+@lru_cache(maxsize=None)
+def get_naming_case_converter(naming_case_type: str = "upper-flat",
+                              naming_case_join_type: str = "") -> Callable:
+    """
+    This function resolves a naming case type to a compiled key converter.
+    The converter takes a tuple of keys and memoizes its results, since config key paths share many prefixes.
+
+    Parameters
+    ----------
+    naming_case_type: str
+        This parameter gets naming case type. The default value is 'upper-flat'.
+    naming_case_join_type: str
+        This parameter gets join type of naming case type. The default value is ''.
+
+    Returns
+    -------
+    converter: Callable
+        This returns the key converter, or None if the naming case type is not valid.
+    """
+    if naming_case_type in NAMING_CASE_CONVERTER_DICT:
+        first_key_function, other_key_function, join_value = NAMING_CASE_CONVERTER_DICT[naming_case_type]
+    elif naming_case_type in OTHER_CONFIG_NAME_CONVERTER_DICT:
+        first_key_function, other_key_function = OTHER_CONFIG_NAME_CONVERTER_DICT[naming_case_type]
+        join_value = naming_case_join_type
+    else:
+        return None
+
+    @lru_cache(maxsize=NAMING_CASE_CACHE_SIZE)
+    def converter(key_tuple: tuple) -> str:
+        if not key_tuple:
+            return ""
+        return join_value.join([first_key_function(key_tuple[0])]
+                               + [other_key_function(key) for key in key_tuple[1:]])
+
+    return converter
 
 
 def convert_naming_case_type(key_list: list,
@@ -21,41 +81,9 @@ def convert_naming_case_type(key_list: list,
     return variable: str
         The return value is arranged by naming case type.
     """
+    converter = get_naming_case_converter(naming_case_type=naming_case_type,
+                                          naming_case_join_type=naming_case_join_type)
+    if converter is None:
+        return None
 
-    if naming_case_type not in OTHER_CONFIG_NAME_TYPE_LIST and naming_case_type in NAMING_CASE_LIST:
-        if naming_case_type == "pascal":
-            return "".join([key.capitalize() for key in key_list])
-
-        elif naming_case_type == "camel":
-            return "".join([key.lower() if key_list.index(key) == 0 else key.capitalize() for key in key_list])
-
-        elif naming_case_type == "snake":
-            return "_".join(key_list).lower()
-
-        elif naming_case_type == "kebab":
-            return "-".join(key_list).lower()
-
-        elif naming_case_type == "flat":
-            return "".join(key_list).lower()
-
-        elif naming_case_type == "upper-flat":
-            return "".join(key_list).upper()
-
-        elif naming_case_type == "pascal-snake":
-            return "_".join([key.capitalize() for key in key_list])
-
-        elif naming_case_type == "camel-snake":
-            return "_".join([key.lower() if key_list.index(key) == 0 else key.capitalize() for key in key_list])
-
-        elif naming_case_type == "screaming-snake":
-            return "_".join(key_list).upper()
-
-        elif naming_case_type == "cobol":
-            return "-".join(key_list).upper()
-
-    else:
-        if naming_case_type == "upper":
-            return naming_case_join_type.join(key_list).upper()
-
-        elif naming_case_type == "lower":
-            return naming_case_join_type.join(key_list).lower()
\ No newline at end of file
+    return converter(tuple(key_list))
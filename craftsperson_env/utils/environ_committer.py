@@ -0,0 +1,32 @@
+import os
+
+
+def commit_config_env(config_env_dict: dict, is_atomic_commit: bool = False) -> None:
+    """
+    This function writes staged config key-value pairs to the 'os.environ' system in one bulk step.
+
+    Parameters
+    ----------
+    config_env_dict: dict
+        This parameter retrieves the staged environment variable key-value pairs.
+    is_atomic_commit: bool
+        This parameter determines whether the previous values are restored if any write fails.
+            The default value is False.
+
+    Returns
+    -------
+    None.
+    """
+    previous_env_dict = (
+        {key: os.environ.get(key) for key in config_env_dict} if is_atomic_commit else {}
+    )
+
+    try:
+        os.environ.update(config_env_dict)
+    except Exception:
+        for key, value in previous_env_dict.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        raise
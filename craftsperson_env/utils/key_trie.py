@@ -0,0 +1,188 @@
+"""
+This file indexes the key paths of loaded config files for subtree queries.
+"""
+
+from typing import Callable
+
+from craftsperson_env.utils.convert_naming_case_type import get_naming_case_converter
+
+
+class KeyTrieNode:
+    """
+    Task
+    ----
+    This class is a node of the key trie. It holds its children by original key name, and the environment
+        variable key of the node if a value was loaded at its key path.
+
+    Parameters
+    ----------
+    None.
+
+    Returns
+    -------
+    None.
+    """
+
+    __slots__ = ("child_dict", "env_key")
+
+    def __init__(self):
+        self.child_dict = {}
+        self.env_key = None
+
+
+class KeyTrie:
+    """
+    Task
+    ----
+    This class indexes the key paths of loaded keys in a trie, and every key path prefix by its environment
+        variable key in the naming case of the trie. A subtree query looks the prefix up in O(1) and then walks
+        only the subtree. Key paths are collected during loading and inserted into the trie on the first query,
+        so loads that are never queried pay only for collecting them.
+
+    Parameters
+    ----------
+    naming_case_type : str
+        This parameter specifies the naming case type of the keys.
+    naming_case_join_type : str
+        This parameter specifies the join type of the keys.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self, naming_case_type: str, naming_case_join_type: str):
+        self.__naming_case_converter = get_naming_case_converter(
+            naming_case_type=naming_case_type,
+            naming_case_join_type=naming_case_join_type,
+        )
+        self.__root = KeyTrieNode()
+        self.__node_dict = {}
+        self.key_path_dict = {}
+
+    def remove(self, env_key: str) -> None:
+        """
+        This function removes an environment variable key from the index.
+
+        Parameters
+        ----------
+        env_key: str
+            This parameter specifies the environment variable key.
+
+        Returns
+        -------
+        None.
+        """
+        self.key_path_dict.pop(env_key, None)
+        node = self.__node_dict.get(env_key)
+        if node is not None and node.env_key == env_key:
+            node.env_key = None
+
+    def keys_under(self, prefix: str, is_key_function: Callable = None) -> list:
+        """
+        This function returns the environment variable keys under a key path prefix.
+
+        Parameters
+        ----------
+        prefix: str
+            This parameter specifies the key path prefix in the naming case of the trie, such as 'APPLICATION.OPTIONS'.
+                An empty prefix selects every key.
+        is_key_function: Callable, optional
+            This parameter retrieves a function that checks whether a key is still loaded. The default is None.
+
+        Returns
+        -------
+        env_key_list: list
+            This returns the environment variable keys in load order of their subtrees.
+        """
+        self.__insert_key_paths()
+        prefix_node = self.__node_dict.get(prefix) if prefix else self.__root
+        if prefix_node is None:
+            return []
+
+        env_key_list = []
+        stack = [iter(prefix_node.child_dict.values())]
+        while stack:
+            for node in stack[-1]:
+                if node.env_key is not None and (is_key_function is None or is_key_function(node.env_key)):
+                    env_key_list.append(node.env_key)
+                if node.child_dict:
+                    stack.append(iter(node.child_dict.values()))
+                    break
+            else:
+                stack.pop()
+
+        return env_key_list
+
+    def get_prefix(self, prefix: str, get_value_function: Callable, missing_value: object = None) -> dict:
+        """
+        This function rebuilds the nested dict under a key path prefix.
+
+        Parameters
+        ----------
+        prefix: str
+            This parameter specifies the key path prefix in the naming case of the trie, such as 'APPLICATION.OPTIONS'.
+                An empty prefix selects every key.
+        get_value_function: Callable
+            This parameter retrieves a function that returns the current value of an environment variable key.
+        missing_value: object, optional
+            This parameter specifies the value returned for keys that are no longer loaded. The default is None.
+
+        Returns
+        -------
+        config_dict: dict
+            This returns the nested dict with the original key names and the current values.
+        """
+        self.__insert_key_paths()
+        prefix_node = self.__node_dict.get(prefix) if prefix else self.__root
+        if prefix_node is None:
+            return {}
+
+        config_dict = {}
+        # Each frame is (child iterator, dict, parent dict, key in the parent dict)
+        stack = [(iter(prefix_node.child_dict.items()), config_dict, None, None)]
+        while stack:
+            item_iterator, node_config_dict = stack[-1][:2]
+            for key, node in item_iterator:
+                if node.child_dict:
+                    child_config_dict = node_config_dict[key] = {}
+                    stack.append((iter(node.child_dict.items()), child_config_dict, node_config_dict, key))
+                    break
+
+                if node.env_key is not None:
+                    value = get_value_function(node.env_key)
+                    if value is not missing_value:
+                        node_config_dict[key] = value
+            else:
+                _, node_config_dict, parent_config_dict, key = stack.pop()
+                # Subtrees whose keys are no longer loaded are left out
+                if not node_config_dict and parent_config_dict is not None:
+                    del parent_config_dict[key]
+
+        return config_dict
+
+    def __insert_key_paths(self) -> None:
+        """
+        This function inserts the collected key paths into the trie.
+
+        Returns
+        -------
+        None.
+        """
+        naming_case_converter = self.__naming_case_converter
+        node_dict = self.__node_dict
+        key_path_dict = self.key_path_dict
+
+        # Key paths may be collected by a watcher thread meanwhile, so the keys are copied before they are popped
+        for env_key in list(key_path_dict):
+            key_tuple = key_path_dict.pop(env_key)
+            node = self.__root
+            for depth, key in enumerate(key_tuple, start=1):
+                child = node.child_dict.get(key)
+                if child is None:
+                    child = node.child_dict[key] = KeyTrieNode()
+                    node_dict[naming_case_converter(key_tuple[:depth])] = child
+                node = child
+
+            node.env_key = env_key
+            node_dict[env_key] = node
@@ -0,0 +1,69 @@
+from ast import literal_eval
+from functools import lru_cache
+from typing import Any, Tuple
+
+from craftsperson_env.utils.contraster import (
+    LITERAL_CACHE_MAX_LENGTH,
+    LITERAL_CACHE_SIZE,
+    LITERAL_FIRST_CHARACTER_LIST,
+    LITERAL_MAX_LENGTH,
+)
+
+
+def classify_literal(value: str) -> Tuple[Any, bool]:
+    """
+    This function classifies a config value that may contain a Python literal such as a dict, list or quoted string.
+    Only values starting with one of LITERAL_FIRST_CHARACTER_LIST and shorter than LITERAL_MAX_LENGTH are parsed.
+        Results of values up to LITERAL_CACHE_MAX_LENGTH are memoized per distinct string, so returned dict and list
+        values must not be mutated.
+
+    Parameters
+    ----------
+    value: str
+        This parameter retrieves the config value.
+
+    Returns
+    -------
+    literal_value: Any
+        This returns the parsed literal, or the given value if it is not a literal.
+    is_literal: bool
+        This returns whether the value was parsed as a literal.
+    """
+    stripped_value = value.strip()
+
+    if (stripped_value[:1] not in LITERAL_FIRST_CHARACTER_LIST
+            or len(stripped_value) > LITERAL_MAX_LENGTH):
+        return value, False
+
+    # Long values are parsed each time, so the cache does not keep their large results alive
+    if len(stripped_value) > LITERAL_CACHE_MAX_LENGTH:
+        literal_value, is_literal = parse_literal(stripped_value)
+    else:
+        literal_value, is_literal = parse_cached_literal(stripped_value)
+
+    return (literal_value, True) if is_literal else (value, False)
+
+
+def parse_literal(stripped_value: str) -> Tuple[Any, bool]:
+    """
+    This function parses a stripped config value as a Python literal.
+
+    Parameters
+    ----------
+    stripped_value: str
+        This parameter retrieves the config value without surrounding whitespace.
+
+    Returns
+    -------
+    literal_value: Any
+        This returns the parsed literal, or None if it is not a literal.
+    is_literal: bool
+        This returns whether the value was parsed as a literal.
+    """
+    try:
+        return literal_eval(stripped_value), True
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None, False
+
+
+parse_cached_literal = lru_cache(maxsize=LITERAL_CACHE_SIZE)(parse_literal)
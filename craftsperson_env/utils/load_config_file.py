@@ -1,15 +1,114 @@
-import json
+import re
 
-import toml
-import xmltodict
-import yaml
+from craftsperson_env.utils.contraster import LITERAL_FIRST_CHARACTER_LIST
+from craftsperson_env.utils.load_stats import LoadStats, open_config_file
+from craftsperson_env.utils.parser_backend import get_parser_backend
+
+ENV_QUOTE_CHARACTERS = ("\"", "'")
+ENV_ESCAPE_PATTERN = re.compile(r'\\(["\\nt])')
+ENV_ESCAPE_DICT = {'"': '"', "\\": "\\", "n": "\n", "t": "\t"}
+# orjson parses integers beyond 64 bits as floats, so documents with a run of 19 digits are parsed by the json module.
+# Digits are mapped to '0' and other bytes to ' ' in one pass, which is faster than a regular expression search.
+JSON_DIGIT_TRANSLATE_TABLE = bytes(ord("0") if ord("0") <= index <= ord("9") else ord(" ") for index in range(256))
+JSON_LONG_NUMBER_BYTES = b"0" * 19
+# '"value"' or "'value'", optionally followed by an inline comment
+ENV_QUOTED_VALUE_PATTERN = re.compile(r"\"((?:[^\"\\]|\\.)*)\"\s*(?:#.*)?|'([^']*)'\s*(?:#.*)?")
 
 
 class LoadConfigFile:
 
+    @staticmethod
+    def iter_env_config_file(file_path: str, stats: LoadStats = None):
+        """
+        This function streams the key-value pairs of an env file line by line.
+        Blank lines and comments are skipped, 'export' prefixes are removed, each line is split at the first '=',
+            and quoted values are unquoted.
+
+        Parameters
+        ----------
+        file_path: str
+            This parameter specifies the file location path.
+
+        Returns
+        -------
+        key_value: tuple
+            This yields the key and the value of each variable.
+        """
+        with open_config_file(file_path, "r", stats) as f:
+            yield from LoadConfigFile.iter_env_lines(f)
+
+    @staticmethod
+    def iter_env_lines(line_iterable):
+        """
+        This function streams the key-value pairs of env lines, such as the lines of a file, a buffer or a stream.
+            A quoted value is a string, so an unquoted value that starts like a Python literal, such as the
+            "{'test': 1}" of JSON_FORMAT="{'test': 1}", is yielded as a string literal. It is then flattened to
+            the string {'test': 1} instead of a dict.
+
+        Parameters
+        ----------
+        line_iterable: Iterable
+            This parameter retrieves the lines as strings.
+
+        Returns
+        -------
+        key_value: tuple
+            This yields the key and the value of each variable.
+        """
+        for line in line_iterable:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            if line.startswith("export "):
+                line = line[7:].lstrip()
+
+            key, separator, value = line.partition("=")
+            if not separator:
+                continue
+
+            value = value.strip()
+            unquoted_value = LoadConfigFile.unquote_env_value(value)
+            if value[:1] in ENV_QUOTE_CHARACTERS and unquoted_value.lstrip()[:1] in LITERAL_FIRST_CHARACTER_LIST:
+                unquoted_value = repr(unquoted_value)
+
+            yield key.rstrip(), unquoted_value
+
+    @staticmethod
+    def unquote_env_value(value: str) -> str:
+        """
+        This function unquotes an env file value and removes inline comments, which may follow the closing quote
+            of a quoted value.
+
+        Parameters
+        ----------
+        value: str
+            This parameter retrieves the stripped value of an env file line.
+
+        Returns
+        -------
+        value: str
+            This returns the unquoted value.
+        """
+        if value[:1] in ("\"", "'"):
+            match = ENV_QUOTED_VALUE_PATTERN.fullmatch(value)
+            if match is not None:
+                if match.group(1) is None:
+                    return match.group(2)
+                return ENV_ESCAPE_PATTERN.sub(lambda escape_match: ENV_ESCAPE_DICT[escape_match.group(1)],
+                                              match.group(1))
+
+        if len(value) > 1 and value[0] in "\"'" and value[-1] == value[0]:
+            if value[0] == "'":
+                return value[1:-1]
+            return ENV_ESCAPE_PATTERN.sub(lambda match: ENV_ESCAPE_DICT[match.group(1)], value[1:-1])
+
+        comment_index = value.find(" #")
+        return value[:comment_index].rstrip() if comment_index != -1 else value
+
     @staticmethod
     def load_diff_type_env_config_file(
-        file_path: str, config_env_replace_first_value: str, naming_case_join_type: str
+        file_path: str, config_env_replace_first_value: str, naming_case_join_type: str, stats: LoadStats = None
     ):
         """
         This function loads env file to system.
@@ -28,28 +127,43 @@ class LoadConfigFile:
         config_dict: dict
             This parameter return changing naming case on variables of config file.
         """
-        with open(file_path, "r") as f:
-            config_env = f.read().strip().split("\n")
+        return LoadConfigFile.get_env_config_dict(
+            key_value_iterator=LoadConfigFile.iter_env_config_file(file_path=file_path, stats=stats),
+            config_env_replace_first_value=config_env_replace_first_value,
+            naming_case_join_type=naming_case_join_type,
+        )
 
+    @staticmethod
+    def get_env_config_dict(key_value_iterator, config_env_replace_first_value: str, naming_case_join_type: str):
+        """
+        This function collects env key-value pairs, replacing the first value of the keys.
+
+        Parameters
+        ----------
+        key_value_iterator: Iterator
+            This parameter retrieves the key and the value of each variable.
+        config_env_replace_first_value: str
+            This parameter gets replacing first value on config_env variables.
+        naming_case_join_type: str
+            This parameter gets join type of naming case type.
+
+        Returns
+        -------
+        config_dict: dict
+            This parameter return changing naming case on variables of config file.
+        """
         config_dict = {}
-        for c in config_env:
-            split_list = c.split("=")
-            key = (
-                split_list[0].replace(
-                    config_env_replace_first_value, naming_case_join_type
-                )
-                if config_env_replace_first_value is not None
-                else split_list[0]
-            )
-            value = split_list[1]
+        for key, value in key_value_iterator:
+            if config_env_replace_first_value is not None:
+                key = key.replace(config_env_replace_first_value, naming_case_join_type)
             config_dict[key] = value
 
         return config_dict
 
     @staticmethod
-    def load_yaml_config_file(file_path: str):
+    def load_yaml_config_file(file_path: str, stats: LoadStats = None):
         """
-        This function loads yaml file to system.
+        This function loads yaml file to system. It uses the libyaml loader if it is installed.
 
         Parameters
         ----------
@@ -61,15 +175,18 @@ class LoadConfigFile:
         config_dict: dict
             This parameter return variables of config file.
         """
-        with open(file_path, "r") as file:
-            config_dict = yaml.safe_load(file)
+        import yaml
+
+        loader = yaml.CSafeLoader if get_parser_backend("yaml") == "libyaml" else yaml.SafeLoader
+        with open_config_file(file_path, "r", stats) as file:
+            config_dict = yaml.load(file, Loader=loader)
 
         return config_dict
 
     @staticmethod
-    def load_json_config_file(file_path: str):
+    def load_json_config_file(file_path: str, stats: LoadStats = None):
         """
-        This function loads json file to system.
+        This function loads json file to system. It uses orjson if it is installed.
 
         Parameters
         ----------
@@ -81,13 +198,54 @@ class LoadConfigFile:
         config_dict: dict
             This parameter return variables of config file.
         """
-        with open(file_path, "r") as file:
+        if get_parser_backend("json") == "orjson":
+            with open_config_file(file_path, "rb", stats) as file:
+                content = file.read()
+            # The bytes already read are parsed by the json module if orjson cannot parse them exactly
+            return LoadConfigFile.load_json_content(content)
+
+        import json
+
+        with open_config_file(file_path, "r", stats) as file:
             config_dict = json.load(file)
 
         return config_dict
 
     @staticmethod
-    def load_xml_config_file(file_path: str, extra_config_file_params: dict = {}):
+    def load_json_content(content):
+        """
+        This function parses json content with the selected backend. orjson is skipped for content with
+            a run of 19 or more digits, which may be an integer beyond 64 bits that orjson parses as a float,
+            and content that orjson rejects, such as NaN, is parsed by the json module.
+
+        Parameters
+        ----------
+        content: Any
+            This parameter retrieves the content as str, bytes, bytearray or memoryview.
+
+        Returns
+        -------
+        config_dict: dict
+            This parameter return variables of config file.
+        """
+        import json
+
+        if get_parser_backend("json") == "orjson":
+            import orjson
+
+            content_bytes = content.encode("utf-8", "surrogatepass") if isinstance(content, str) else bytes(content)
+            if JSON_LONG_NUMBER_BYTES not in content_bytes.translate(JSON_DIGIT_TRANSLATE_TABLE):
+                try:
+                    return orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    pass
+
+        if not isinstance(content, (str, bytes)):
+            content = str(content, "utf-8-sig")
+        return json.loads(content)
+
+    @staticmethod
+    def load_xml_config_file(file_path: str, extra_config_file_params: dict = {}, stats: LoadStats = None):
         """
         This function loads xml file to system.
 
@@ -103,13 +261,15 @@ class LoadConfigFile:
         config_dict: dict
             This parameter return variables of config file.
         """
-        with open(file_path, "r") as file:
+        import xmltodict
+
+        with open_config_file(file_path, "r", stats) as file:
             config_dict = xmltodict.parse(file.read(), **extra_config_file_params)
 
         return config_dict
 
     @staticmethod
-    def load_toml_config_file(file_path: str, extra_config_file_params: dict = {}):
+    def load_toml_config_file(file_path: str, extra_config_file_params: dict = {}, stats: LoadStats = None):
         """
         This function loads toml file to system.
 
@@ -118,19 +278,29 @@ class LoadConfigFile:
         file_path: str
             This parameter specifies the file location path.
         extra_config_file_params: dict
-            This parameter gets xml file extra dict type config.
+            This parameter gets xml file extra dict type config. The 'tomllib' backend is only used without it.
         Returns
         -------
         None.
         config_dict: dict
             This parameter return variables of config file.
         """
-        with open(file_path, "r") as file:
+        if not extra_config_file_params and get_parser_backend("toml") == "tomllib":
+            import tomllib
+
+            with open_config_file(file_path, "rb", stats) as file:
+                config_dict = tomllib.load(file)
+
+            return config_dict
+
+        import toml
+
+        with open_config_file(file_path, "r", stats) as file:
             config_dict = toml.load(file, **extra_config_file_params)
 
         return config_dict
 
-    def load_xml_config_file(self, file_path: str, extra_config_file_params: dict = {}):
+    def load_xml_config_file(self, file_path: str, extra_config_file_params: dict = {}, stats: LoadStats = None):
         """
         This function loads xml file to system.
 
@@ -143,7 +313,9 @@ class LoadConfigFile:
         -------
         None.
         """
-        with open(file_path, "r") as file:
+        import xmltodict
+
+        with open_config_file(file_path, "r", stats) as file:
             config_dict = xmltodict.parse(file.read(), **extra_config_file_params)
 
         return config_dict
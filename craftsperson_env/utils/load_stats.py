@@ -0,0 +1,158 @@
+"""
+This file collects per-phase statistics of config file loads.
+"""
+
+import os
+import time
+from typing import Callable
+
+
+class LoadStats:
+    """
+    Task
+    ----
+    This class stores the per-phase durations and sizes of one config file load.
+    The parse duration excludes the time spent reading the file, and the flatten duration excludes
+    the time spent converting key names.
+
+    Parameters
+    ----------
+    file_path : str
+        This parameter specifies the file location path.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.read_seconds = 0.0
+        self.parse_seconds = 0.0
+        self.flatten_seconds = 0.0
+        self.convert_seconds = 0.0
+        self.commit_seconds = 0.0
+        self.key_count = 0
+        self.max_depth = 0
+        self.bytes_read = 0
+        self.is_cache_hit = False
+        self.profile = None
+
+    @property
+    def total_seconds(self) -> float:
+        """
+        This function returns the sum of the phase durations.
+
+        Returns
+        -------
+        total_seconds: float
+            This returns the total duration in seconds.
+        """
+        return (self.read_seconds + self.parse_seconds + self.flatten_seconds
+                + self.convert_seconds + self.commit_seconds)
+
+    def to_dict(self) -> dict:
+        """
+        This function returns the statistics as a dict, without the profile.
+
+        Returns
+        -------
+        stats_dict: dict
+            This returns the statistics.
+        """
+        return {
+            "file_path": self.file_path,
+            "read_seconds": self.read_seconds,
+            "parse_seconds": self.parse_seconds,
+            "flatten_seconds": self.flatten_seconds,
+            "convert_seconds": self.convert_seconds,
+            "commit_seconds": self.commit_seconds,
+            "total_seconds": self.total_seconds,
+            "key_count": self.key_count,
+            "max_depth": self.max_depth,
+            "bytes_read": self.bytes_read,
+            "is_cache_hit": self.is_cache_hit,
+        }
+
+    def __repr__(self) -> str:
+        return f"LoadStats({self.to_dict()})"
+
+
+class TimedFile:
+    """
+    Task
+    ----
+    This class wraps an open file and adds the time spent in its read calls to a LoadStats object.
+
+    Parameters
+    ----------
+    file : IO
+        This parameter retrieves the open file.
+    stats : LoadStats
+        This parameter retrieves the statistics that are updated.
+    is_count_bytes : bool, optional
+        This parameter determines whether the file size is added to the bytes read. It is False when
+            the same file is read again. The default value is True.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self, file, stats: LoadStats, is_count_bytes: bool = True):
+        self.__file = file
+        self.__stats = stats
+        if is_count_bytes:
+            stats.bytes_read += os.fstat(file.fileno()).st_size
+
+    def __timed(self, function: Callable, *args):
+        start_time = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.__stats.read_seconds += time.perf_counter() - start_time
+
+    def read(self, *args):
+        return self.__timed(self.__file.read, *args)
+
+    def readline(self, *args):
+        return self.__timed(self.__file.readline, *args)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.__timed(self.__file.__next__)
+
+    def __getattr__(self, name: str):
+        return getattr(self.__file, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.__file.close()
+
+
+def open_config_file(file_path: str, mode: str = "r", stats: LoadStats = None, is_count_bytes: bool = True):
+    """
+    This function opens a config file, timing its reads when statistics are collected.
+
+    Parameters
+    ----------
+    file_path: str
+        This parameter specifies the file location path.
+    mode: str, optional
+        This parameter specifies the file mode. The default is 'r'.
+    stats: LoadStats, optional
+        This parameter retrieves the statistics that are updated. The default is None.
+    is_count_bytes: bool, optional
+        This parameter determines whether the file size is added to the bytes read. The default value is True.
+
+    Returns
+    -------
+    file: IO
+        This returns the open file, wrapped in TimedFile when statistics are collected.
+    """
+    file = open(file_path, mode)
+    return file if stats is None else TimedFile(file=file, stats=stats, is_count_bytes=is_count_bytes)
@@ -0,0 +1,201 @@
+"""
+This file keeps config values in process memory for the 'munch' client.
+"""
+
+from typing import Any
+
+MUNCH_MISSING = object()
+
+
+class Munch(dict):
+    """
+    Task
+    ----
+    This class is a dict whose keys can also be read and written as attributes.
+
+    Parameters
+    ----------
+    None.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        self[key] = value
+
+    def __delattr__(self, key: str) -> None:
+        try:
+            del self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+
+class MunchStore:
+    """
+    Task
+    ----
+    This class stores native config values of one 'CraftsEnvConfig' instance without the 'os.environ' system.
+    Values are indexed by their environment variable key for O(1) lookups, and also kept in a nested Munch
+    tree split at '.', so dotted keys and attribute access return values or whole subtrees.
+
+    Parameters
+    ----------
+    None.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self):
+        self.__value_dict = {}
+        self.tree = Munch()
+
+    def __getattr__(self, key: str) -> Any:
+        if key == "tree":
+            raise AttributeError(key)
+        return getattr(self.tree, key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not MUNCH_MISSING
+
+    def __len__(self) -> int:
+        return len(self.__value_dict)
+
+    def keys(self):
+        """
+        This function returns the environment variable keys of the store.
+
+        Returns
+        -------
+        keys: KeysView
+            This returns the keys.
+        """
+        return self.__value_dict.keys()
+
+    def items(self):
+        """
+        This function returns the environment variable key-value pairs of the store.
+
+        Returns
+        -------
+        items: ItemsView
+            This returns the key-value pairs.
+        """
+        return self.__value_dict.items()
+
+    def get(self, key: str, default: Any = MUNCH_MISSING) -> Any:
+        """
+        This function returns the value of an environment variable key, or the subtree of a dotted key prefix.
+
+        Parameters
+        ----------
+        key: str
+            This parameter specifies the environment variable key or dotted key.
+        default: Any, optional
+            This parameter specifies the value returned if the key is not found. The default is MUNCH_MISSING.
+
+        Returns
+        -------
+        value: Any
+            This returns the value, the subtree or the default.
+        """
+        value = self.__value_dict.get(key, MUNCH_MISSING)
+        if value is not MUNCH_MISSING:
+            return value
+
+        node = self.tree
+        for key_part in key.split("."):
+            if not isinstance(node, Munch) or key_part not in node:
+                return default
+            node = node[key_part]
+
+        return node
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        This function sets the value of an environment variable key.
+
+        Parameters
+        ----------
+        key: str
+            This parameter specifies the environment variable key.
+        value: Any
+            This parameter specifies the native value.
+
+        Returns
+        -------
+        None.
+        """
+        self.__value_dict[key] = value
+
+        # Keys that clash with an existing leaf or subtree are only kept in the flat index
+        node = self.tree
+        *parent_key_list, leaf_key = key.split(".")
+        for key_part in parent_key_list:
+            child = node.get(key_part, MUNCH_MISSING)
+            if child is MUNCH_MISSING:
+                child = node[key_part] = Munch()
+            elif not isinstance(child, Munch):
+                return
+            node = child
+
+        if not isinstance(node.get(leaf_key), Munch):
+            node[leaf_key] = value
+
+    def update(self, config_env_dict: dict) -> None:
+        """
+        This function sets the values of several environment variable keys.
+
+        Parameters
+        ----------
+        config_env_dict: dict
+            This parameter retrieves the environment variable key-value pairs.
+
+        Returns
+        -------
+        None.
+        """
+        for key, value in config_env_dict.items():
+            self.set(key, value)
+
+    def pop(self, key: str) -> None:
+        """
+        This function removes an environment variable key.
+
+        Parameters
+        ----------
+        key: str
+            This parameter specifies the environment variable key.
+
+        Returns
+        -------
+        None.
+        """
+        if self.__value_dict.pop(key, MUNCH_MISSING) is MUNCH_MISSING:
+            return
+
+        node_list = [self.tree]
+        key_part_list = key.split(".")
+        for key_part in key_part_list[:-1]:
+            node = node_list[-1].get(key_part)
+            if not isinstance(node, Munch):
+                return
+            node_list.append(node)
+
+        if not isinstance(node_list[-1].get(key_part_list[-1], MUNCH_MISSING), Munch):
+            node_list[-1].pop(key_part_list[-1], None)
+
+        # Remove subtrees left empty
+        for key_part, node in zip(reversed(key_part_list[:-1]), reversed(node_list[:-1])):
+            if node[key_part]:
+                break
+            del node[key_part]
@@ -0,0 +1,110 @@
+"""
+This file selects the fastest installed parser backend of each file type.
+"""
+
+import sys
+from functools import lru_cache
+
+from craftsperson_env.utils.assert_controller import Checker
+from craftsperson_env.utils.contraster import PARSER_BACKEND_DICT
+
+FORCED_PARSER_BACKEND_DICT = {}
+
+
+def is_parser_backend_available(parser_backend: str) -> bool:
+    """
+    This function checks whether a parser backend is installed without importing more than needed.
+
+    Parameters
+    ----------
+    parser_backend: str
+        This parameter specifies the parser backend.
+
+    Returns
+    -------
+    is_available: bool
+        This returns whether the parser backend can be used.
+    """
+    if parser_backend == "libyaml":
+        try:
+            import yaml
+        except ImportError:
+            return False
+        return hasattr(yaml, "CSafeLoader")
+
+    if parser_backend == "tomllib":
+        return sys.version_info >= (3, 11)
+
+    from importlib.util import find_spec
+
+    module_name = "yaml" if parser_backend == "pyyaml" else parser_backend
+    return find_spec(module_name) is not None
+
+
+@lru_cache(maxsize=None)
+def get_available_parser_backend_list(file_type: str) -> list:
+    """
+    This function returns the installed parser backends of a file type, from the fastest to the most portable.
+
+    Parameters
+    ----------
+    file_type: str
+        This parameter specifies the file type, allowing values such as "yaml", "json" or "toml".
+
+    Returns
+    -------
+    available_parser_backend_list: list
+        This returns the installed parser backends.
+    """
+    return [parser_backend for parser_backend in PARSER_BACKEND_DICT.get(file_type, [])
+            if is_parser_backend_available(parser_backend)]
+
+
+def get_parser_backend(file_type: str) -> str:
+    """
+    This function returns the parser backend used for a file type: the forced one, or else the fastest installed one.
+
+    Parameters
+    ----------
+    file_type: str
+        This parameter specifies the file type, allowing values such as "yaml", "json" or "toml".
+
+    Returns
+    -------
+    parser_backend: str
+        This returns the parser backend.
+    """
+    parser_backend = FORCED_PARSER_BACKEND_DICT.get(file_type)
+    if parser_backend is not None:
+        return parser_backend
+
+    available_parser_backend_list = get_available_parser_backend_list(file_type)
+    # The last backend is the format's original one, which reports its own import error if missing
+    return available_parser_backend_list[0] if available_parser_backend_list else PARSER_BACKEND_DICT[file_type][-1]
+
+
+def set_parser_backend(file_type: str, parser_backend: str = None) -> None:
+    """
+    This function forces the parser backend of a file type.
+
+    Parameters
+    ----------
+    file_type: str
+        This parameter specifies the file type, allowing values such as "yaml", "json" or "toml".
+    parser_backend: str, optional
+        This parameter specifies the parser backend. The default is None, which selects the fastest installed one.
+
+    Returns
+    -------
+    None.
+    """
+    if parser_backend is None:
+        FORCED_PARSER_BACKEND_DICT.pop(file_type, None)
+        return
+
+    Checker().check_parser_backend(
+        file_type=file_type,
+        parser_backend=parser_backend,
+        available_parser_backend_list=get_available_parser_backend_list(file_type),
+    )
+    FORCED_PARSER_BACKEND_DICT[file_type] = parser_backend
@@ -1,3 +1,5 @@
+import os
+
 
 def add_base_path(file_path: str, root_full_path: str) -> str:
     """
@@ -26,3 +28,45 @@ def add_base_path(file_path: str, root_full_path: str) -> str:
         file_path = f"{root_full_path}/{file_path}"
 
     return file_path
+
+
+def get_umask() -> int:
+    """
+    This function returns the umask of the process. It is read from '/proc/self/status' where it is available,
+        since reading it with 'os.umask' sets it for a moment, which can change the mode of files that other
+        threads create at the same time.
+
+    Returns
+    -------
+    umask: int
+        This returns the umask.
+    """
+    try:
+        with open("/proc/self/status", "r") as file:
+            for line in file:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def set_shared_file_mode(file_descriptor: int) -> None:
+    """
+    This function sets the mode of a file created by 'tempfile.mkstemp', which is readable by its owner only,
+        to 0o644 without the bits of the umask, so other users can read it after it replaces the shared file.
+
+    Parameters
+    ----------
+    file_descriptor: int
+        This parameter retrieves the file descriptor of the open file.
+
+    Returns
+    -------
+    None.
+    """
+    if hasattr(os, "fchmod"):
+        os.fchmod(file_descriptor, 0o644 & ~get_umask())
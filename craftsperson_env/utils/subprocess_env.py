@@ -0,0 +1,110 @@
+"""
+This file keeps a rendered environment for child processes, without changing the 'os.environ' system.
+"""
+
+import os
+from collections.abc import Mapping
+from typing import Iterator
+
+from craftsperson_env.utils.config_flattener import stringify_config_value
+
+
+class SubprocessEnv(Mapping):
+    """
+    Task
+    ----
+    This class serves as an immutable mapping of environment variable keys to string values, such as the flattened
+        config of one or more files over a base environment. It can be passed as 'env' to 'subprocess' or
+        'os.posix_spawn', and the same instance can be reused for every child process. The byte form of the pairs,
+        which is what 'subprocess' and 'os.posix_spawn' encode the keys and values to, is built once and cached.
+
+    Parameters
+    ----------
+    config_env_dict : dict
+        This parameter retrieves the environment variable key-value pairs. Values that are not strings are
+            stringified like the values of the 'os.environ' system.
+    base_env : Mapping, optional
+        This parameter retrieves the environment below the key-value pairs, such as 'os.environ'.
+            The default is None, which means only the key-value pairs.
+
+    Returns
+    -------
+    None.
+    """
+
+    __slots__ = ("__env_dict", "__environb")
+
+    def __init__(self, config_env_dict: dict, base_env: Mapping = None):
+        env_dict = {} if base_env is None else dict(base_env)
+        for env_key, value in config_env_dict.items():
+            env_dict[env_key] = value if isinstance(value, str) else stringify_config_value(value)
+        self.__env_dict = env_dict
+        self.__environb = None
+
+    def __getitem__(self, env_key: str) -> str:
+        return self.__env_dict[env_key]
+
+    def __contains__(self, env_key: object) -> bool:
+        return env_key in self.__env_dict
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__env_dict)
+
+    def __len__(self) -> int:
+        return len(self.__env_dict)
+
+    def __repr__(self) -> str:
+        return f"SubprocessEnv({len(self.__env_dict)} keys)"
+
+    @property
+    def environb(self) -> dict:
+        """
+        This function returns the key-value pairs encoded like 'os.environb', built on the first call.
+            Passing it as 'env' to 'subprocess' or 'os.posix_spawn' on POSIX systems skips encoding
+            the keys and values again for each child process.
+
+        Returns
+        -------
+        environb: dict
+            This returns the encoded key-value pairs. The dict should not be changed.
+        """
+        if self.__environb is None:
+            fsencode = os.fsencode
+            self.__environb = {fsencode(env_key): fsencode(value) for env_key, value in self.__env_dict.items()}
+        return self.__environb
+
+    def to_dict(self) -> dict:
+        """
+        This function returns a copy of the key-value pairs.
+
+        Returns
+        -------
+        env_dict: dict
+            This returns the environment variable key-value pairs.
+        """
+        return dict(self.__env_dict)
+
+    def merge(self, config_env_dict: dict) -> "SubprocessEnv":
+        """
+        This function returns a new environment with other key-value pairs over this environment,
+            such as the variables of one child process. Only the new pairs are encoded if the byte form
+            of this environment is already built.
+
+        Parameters
+        ----------
+        config_env_dict : dict
+            This parameter retrieves the environment variable key-value pairs.
+
+        Returns
+        -------
+        subprocess_env: SubprocessEnv
+            This returns the new environment.
+        """
+        subprocess_env = SubprocessEnv(config_env_dict=config_env_dict, base_env=self.__env_dict)
+        if self.__environb is not None:
+            fsencode = os.fsencode
+            environb = dict(self.__environb)
+            for env_key in config_env_dict:
+                environb[fsencode(env_key)] = fsencode(subprocess_env[env_key])
+            subprocess_env.__environb = environb
+        return subprocess_env
@@ -0,0 +1,183 @@
+"""
+This file caches typed values parsed from the 'os.environ' system.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from craftsperson_env.utils.contraster import VALUE_CACHE_SIZE
+
+CACHE_MISS = object()
+CONVERSION_FAILED = object()
+
+IMMUTABLE_VALUE_TYPE_TUPLE = (str, int, float, bool, bytes, type(None))
+
+
+def copy_cached_value(value: Any) -> Any:
+    """
+    This function copies the mutable parts of a cached value, so a caller that changes the returned value
+        does not change the cached one. Dict and list values are copied recursively without 'copy.deepcopy',
+        and immutable values are returned as they are.
+
+    Parameters
+    ----------
+    value: Any
+        This parameter retrieves the cached value.
+
+    Returns
+    -------
+    value: Any
+        This returns the value or its copy.
+    """
+    if isinstance(value, IMMUTABLE_VALUE_TYPE_TUPLE) or value is CONVERSION_FAILED:
+        return value
+    if type(value) is dict:
+        return {key: copy_cached_value(item) for key, item in value.items()}
+    if type(value) is list:
+        return [copy_cached_value(item) for item in value]
+
+    from copy import deepcopy
+
+    return deepcopy(value)
+
+
+class TypedValueCache:
+    """
+    Task
+    ----
+    This class stores parsed environment values keyed by (key, value_type).
+    Each entry remembers the raw string it was parsed from, so a value changed
+    outside of the library is detected by comparing raw strings.
+    The least recently used keys are removed when the number of entries exceeds the max size,
+    and mutable values are copied when they are stored and returned.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        This parameter specifies the maximum number of (key, value_type) entries. The default is VALUE_CACHE_SIZE.
+
+    Returns
+    -------
+    None.
+    """
+
+    def __init__(self, max_size: int = VALUE_CACHE_SIZE):
+        self.__value_dict = OrderedDict()
+        self.__entry_count = 0
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, value_type: Any, raw_value: str) -> Any:
+        """
+        This function returns the cached value of the key if it was parsed from the same raw string.
+
+        Parameters
+        ----------
+        key: str
+            This parameter specifies the environment variable key.
+        value_type: Any
+            This parameter specifies the requested value type.
+        raw_value: str
+            This parameter specifies the current raw string of the key.
+
+        Returns
+        -------
+        value: Any
+            This returns a copy of the cached value, or CACHE_MISS if there is no valid entry.
+        """
+        with self.__lock:
+            type_dict = self.__value_dict.get(key)
+            entry = None if type_dict is None else type_dict.get(value_type)
+
+            if entry is None or entry[0] != raw_value:
+                self.misses += 1
+                return CACHE_MISS
+
+            self.hits += 1
+            self.__value_dict.move_to_end(key)
+
+        return copy_cached_value(entry[1])
+
+    def set(self, key: str, value_type: Any, raw_value: str, value: Any) -> None:
+        """
+        This function stores the parsed value of the key.
+
+        Parameters
+        ----------
+        key: str
+            This parameter specifies the environment variable key.
+        value_type: Any
+            This parameter specifies the requested value type.
+        raw_value: str
+            This parameter specifies the raw string the value was parsed from.
+        value: Any
+            This parameter specifies the parsed value or CONVERSION_FAILED.
+
+        Returns
+        -------
+        None.
+        """
+        entry = (raw_value, copy_cached_value(value))
+
+        with self.__lock:
+            type_dict = self.__value_dict.get(key)
+            if type_dict is None:
+                type_dict = self.__value_dict[key] = {}
+            else:
+                self.__value_dict.move_to_end(key)
+
+            if value_type not in type_dict:
+                self.__entry_count += 1
+            type_dict[value_type] = entry
+
+            while self.__entry_count > self.__max_size:
+                _, removed_type_dict = self.__value_dict.popitem(last=False)
+                self.__entry_count -= len(removed_type_dict)
+
+    def invalidate(self, key: str) -> None:
+        """
+        This function removes every cached value type of the key.
+
+        Parameters
+        ----------
+        key: str
+            This parameter specifies the environment variable key.
+
+        Returns
+        -------
+        None.
+        """
+        with self.__lock:
+            type_dict = self.__value_dict.pop(key, None)
+            if type_dict is not None:
+                self.__entry_count -= len(type_dict)
+
+    def clear(self) -> None:
+        """
+        This function removes all cached values and resets the counters.
+
+        Returns
+        -------
+        None.
+        """
+        with self.__lock:
+            self.__value_dict.clear()
+            self.__entry_count = 0
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> dict:
+        """
+        This function returns the cache counters.
+
+        Returns
+        -------
+        cache_info: dict
+            This returns the hits, misses, number of cached (key, value_type) entries and the max size.
+        """
+        with self.__lock:
+            return {"hits": self.hits, "misses": self.misses, "size": self.__entry_count,
+                    "max_size": self.__max_size}
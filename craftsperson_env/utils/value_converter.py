@@ -0,0 +1,189 @@
+"""
+This file converts raw environment variable values to typed values.
+"""
+
+from typing import Any, Callable
+
+from craftsperson_env.utils.value_cache import CONVERSION_FAILED
+
+
+def convert_json_value(value: str) -> Any:
+    """
+    This function converts a raw value holding a JSON or Python dict literal.
+
+    Parameters
+    ----------
+    value: str
+        This parameter retrieves the raw value.
+
+    Returns
+    -------
+    value: Any
+        This returns the parsed value, or CONVERSION_FAILED if the value cannot be parsed.
+    """
+    import json
+
+    try:
+        # Handle both single and double quotes in JSON strings
+        json_value = value.strip().strip('"').strip("'")
+        return json.loads(json_value.replace("'", '"'))
+    except (json.JSONDecodeError, AttributeError):
+        return CONVERSION_FAILED
+
+
+def convert_list_value(value: str) -> Any:
+    """
+    This function converts a raw value holding a list literal, or else a comma separated list.
+
+    Parameters
+    ----------
+    value: str
+        This parameter retrieves the raw value.
+
+    Returns
+    -------
+    value: list
+        This returns the parsed list.
+    """
+    list_value = convert_json_value(value)
+    if list_value is CONVERSION_FAILED:
+        # Fallback: split by comma
+        return [item.strip() for item in value.split(",")]
+    return list_value
+
+
+def convert_float_value(value: str) -> Any:
+    """
+    This function converts a raw value holding a float.
+
+    Parameters
+    ----------
+    value: str
+        This parameter retrieves the raw value.
+
+    Returns
+    -------
+    value: float
+        This returns the parsed float, or CONVERSION_FAILED if the value cannot be parsed.
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return CONVERSION_FAILED
+
+
+def convert_int_value(value: str) -> Any:
+    """
+    This function converts a raw value holding an integer, truncating decimal values.
+
+    Parameters
+    ----------
+    value: str
+        This parameter retrieves the raw value.
+
+    Returns
+    -------
+    value: int
+        This returns the parsed integer, or CONVERSION_FAILED if the value cannot be parsed.
+    """
+    try:
+        return int(float(value))  # Handle "2.0" -> 2
+    except (ValueError, TypeError):
+        return CONVERSION_FAILED
+
+
+def convert_bool_value(value: str) -> bool:
+    """
+    This function converts a raw value holding a bool. 'true', '1' and 'yes' are True in any case.
+
+    Parameters
+    ----------
+    value: str
+        This parameter retrieves the raw value.
+
+    Returns
+    -------
+    value: bool
+        This returns the parsed bool.
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ("true", "1", "yes")
+
+
+VALUE_CONVERTER_DICT = {
+    dict: convert_json_value,
+    float: convert_float_value,
+    int: convert_int_value,
+    bool: convert_bool_value,
+    list: convert_list_value,
+    str: str,
+}
+
+
+def get_value_converter(value_type: Any) -> Callable:
+    """
+    This function returns the converter of a value type, so the type dispatch is done once per type.
+
+    Parameters
+    ----------
+    value_type: Any
+        This parameter accepts value types such as int, str, float, list, dict, bool and others.
+
+    Returns
+    -------
+    value_converter: Callable
+        This returns a function that converts a raw value, returning CONVERSION_FAILED on failure.
+            Other types are called with the raw value.
+    """
+    value_converter = VALUE_CONVERTER_DICT.get(value_type)
+    if value_converter is not None:
+        return value_converter
+
+    def convert_other_value(value: str) -> Any:
+        try:
+            return value_type(value)
+        except (ValueError, TypeError):
+            return CONVERSION_FAILED
+
+    return convert_other_value
+
+
+def convert_value(value: str, value_type: Any) -> Any:
+    """
+    This function converts a raw environment variable value to the given type.
+
+    Parameters
+    ----------
+    value: str
+        This parameter retrieves the raw value from the 'os.environ' system.
+    value_type: Any
+        This parameter accepts value types such as int, str, float, list, dict, bool and others.
+
+    Returns
+    -------
+    value: Any
+        This returns the converted value, or CONVERSION_FAILED if the value cannot be converted.
+    """
+    return get_value_converter(value_type)(value)
+
+
+def is_value_of_type(value: Any, value_type: Any) -> bool:
+    """
+    This function checks whether a native value already has the given type.
+
+    Parameters
+    ----------
+    value: Any
+        This parameter retrieves the native value.
+    value_type: Any
+        This parameter accepts value types such as int, str, float, list, dict, bool and others.
+
+    Returns
+    -------
+    is_value_of_type: bool
+        This returns whether the value can be used without conversion.
+    """
+    # bool is a subclass of int, so it only matches a bool value type
+    return (isinstance(value_type, type) and isinstance(value, value_type)
+            and (value_type is bool or not isinstance(value, bool)))
@@ -0,0 +1,156 @@
+"""
+This file streams the leaves of xml config files without building the whole xmltodict tree.
+"""
+
+from xml.parsers import expat
+
+from craftsperson_env.utils.load_stats import LoadStats, open_config_file
+
+XML_ATTRIBUTE_PREFIX = "@"
+XML_TEXT_KEY = "#text"
+
+
+def get_repeated_element_dict(file_path: str, stats: LoadStats = None) -> dict:
+    """
+    This function reads an xml file once and counts the child elements that share a name with a sibling.
+
+    Parameters
+    ----------
+    file_path: str
+        This parameter specifies the file location path.
+    stats: LoadStats, optional
+        This parameter retrieves the statistics that receive the read duration. The default is None.
+
+    Returns
+    -------
+    repeated_element_dict: dict
+        This returns the number of repeated elements per (parent element index, element name) pair.
+            Elements are indexed in document order.
+    """
+    repeated_element_dict = {}
+    # Each open element keeps its index and the counts of its child names
+    stack = []
+    element_count = 0
+
+    def start_element(name, attributes):
+        nonlocal element_count
+        if stack:
+            child_count_dict = stack[-1][1]
+            child_count_dict[name] = child_count_dict.get(name, 0) + 1
+        stack.append((element_count, {}))
+        element_count += 1
+
+    def end_element(name):
+        index, child_count_dict = stack.pop()
+        for child_name, count in child_count_dict.items():
+            if count > 1:
+                repeated_element_dict[(index, child_name)] = count
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    with open_config_file(file_path, "rb", stats) as file:
+        parser.ParseFile(file)
+
+    return repeated_element_dict
+
+
+def iter_xml_config_file(file_path: str, stats: LoadStats = None):
+    """
+    This function yields the leaves of an xml file in the layout of 'xmltodict.parse' with its default parameters.
+        Attributes become '@name' keys, the text of an element with attributes or children becomes a '#text' key,
+        and repeated elements are collapsed into a list of their values. The file is read twice: once to find the
+        repeated elements and once to yield the leaves, so memory stays proportional to the depth of the file
+        and the size of the repeated elements.
+
+    Parameters
+    ----------
+    file_path: str
+        This parameter specifies the file location path.
+    stats: LoadStats, optional
+        This parameter retrieves the statistics that receive the read duration. Both passes add to the read
+            duration, and the size of the file is counted once in the bytes read. The default is None.
+
+    Returns
+    -------
+    leaf: tuple
+        This yields the key path tuple and the value of each leaf. A list of repeated elements is yielded when
+            its last element ends, so it can follow siblings that come after its first element.
+    """
+    repeated_element_dict = get_repeated_element_dict(file_path=file_path, stats=stats)
+    leaf_list = []
+    # Each open element is [index, key path, text list, is parent, repeated list dict, value]
+    # Elements inside a repeated element are built as values instead of being yielded
+    stack = []
+    element_count = 0
+
+    def start_element(name, attributes):
+        nonlocal element_count
+        parent = stack[-1] if stack else None
+        index = element_count
+        element_count += 1
+
+        if parent is not None:
+            parent[3] = True
+            if parent[1] is None or (parent[0], name) in repeated_element_dict:
+                value = {XML_ATTRIBUTE_PREFIX + key: value for key, value in attributes.items()} or None
+                stack.append([index, None, [], False, None, value])
+                return
+
+        key_tuple = (parent[1] if parent is not None else ()) + (name,)
+        for key, value in attributes.items():
+            leaf_list.append((key_tuple + (XML_ATTRIBUTE_PREFIX + key,), value))
+        stack.append([index, key_tuple, [], bool(attributes), {}, None])
+
+    def end_element(name):
+        _, key_tuple, text_list, is_parent, _, value = stack.pop()
+        text = "".join(text_list).strip() or None
+
+        if key_tuple is not None:
+            if not is_parent:
+                leaf_list.append((key_tuple, text))
+            elif text is not None:
+                leaf_list.append((key_tuple + (XML_TEXT_KEY,), text))
+            return
+
+        if text is not None:
+            if value is None:
+                value = text
+            else:
+                value[XML_TEXT_KEY] = text
+
+        parent = stack[-1]
+        if parent[1] is not None:
+            repeated_list = parent[4].setdefault(name, [])
+            repeated_list.append(value)
+            if len(repeated_list) == repeated_element_dict[(parent[0], name)]:
+                leaf_list.append((parent[1] + (name,), parent[4].pop(name)))
+            return
+
+        if parent[5] is None:
+            parent[5] = {}
+        if name not in parent[5]:
+            parent[5][name] = value
+        elif isinstance(parent[5][name], list):
+            parent[5][name].append(value)
+        else:
+            parent[5][name] = [parent[5][name], value]
+
+    def character_data(data):
+        stack[-1][2].append(data)
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+
+    with open_config_file(file_path, "rb", stats, is_count_bytes=False) as file:
+        while True:
+            chunk = file.read(65536)
+            parser.Parse(chunk, not chunk)
+            yield from leaf_list
+            leaf_list.clear()
+            if not chunk:
+                break
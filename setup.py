@@ -21,6 +21,9 @@ setup(
     url="https://github.com/celalakcelikk/craftsperson-env",
     python_requires=">=3.8",
     install_requires=requirements_list,
+    entry_points={
+        "console_scripts": ["craftsperson-env=craftsperson_env.utils.command_line:main"],
+    },
     license="MIT",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
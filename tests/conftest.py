@@ -0,0 +1,23 @@
+"""
+This file holds the shared fixtures of the tests.
+"""
+
+import os
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+
+
+@pytest.fixture(autouse=True)
+def restore_environ():
+    """
+    This fixture restores the 'os.environ' system and clears the typed value cache after each test,
+        since the "os_env" client writes loaded keys to the process environment.
+    """
+    previous_env_dict = dict(os.environ)
+    CraftsEnvConfig.clear_cache()
+    yield
+    os.environ.clear()
+    os.environ.update(previous_env_dict)
+    CraftsEnvConfig.clear_cache()
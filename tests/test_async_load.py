@@ -0,0 +1,113 @@
+"""
+This file tests the async loads and the async iteration of watcher reloads.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import craftsperson_env.__main__ as craftsperson_env_main
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.config_watcher import ConfigWatcher
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "")
+CONFIG_FILE_PARAMS = {"root_full_path": EXAMPLES_PATH, "naming_case_type": "upper", "naming_case_join_type": "_"}
+
+
+def test_aload_config_file_equals_load_config_file():
+    expected_config_env_dict = CraftsEnvConfig().load_config_file(
+        file_path="yaml_config_file.yaml", dry_run=True, **CONFIG_FILE_PARAMS
+    )
+
+    config_env_dict = asyncio.run(CraftsEnvConfig().aload_config_file(
+        file_path="yaml_config_file.yaml", **CONFIG_FILE_PARAMS
+    ))
+
+    assert config_env_dict == expected_config_env_dict
+    assert all(os.environ[env_key] == value for env_key, value in config_env_dict.items())
+
+
+def test_aload_config_files_on_a_process_executor(tmp_path):
+    file_path_list = []
+    for index in range(4):
+        file_path = tmp_path / f"config_{index}.env"
+        file_path.write_text(f"TEST_ASYNC_SHARED={index}\nTEST_ASYNC_{index}={index}\n", encoding="utf-8")
+        file_path_list.append(str(file_path))
+
+    async def load():
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return await CraftsEnvConfig().aload_config_files(
+                file_path_list=file_path_list, executor=executor, root_full_path="", naming_case_type="upper",
+            )
+
+    load_result = asyncio.run(load())
+
+    assert load_result["config_env_dict"]["TEST_ASYNC_SHARED"] == "3"
+    assert [file_path for file_path, _ in load_result["file_timing_list"]] == file_path_list
+    assert os.environ["TEST_ASYNC_SHARED"] == "3"
+    assert os.environ["TEST_ASYNC_0"] == "0"
+
+
+def test_cancelled_aload_commits_nothing(tmp_path, monkeypatch):
+    file_path = tmp_path / "config.env"
+    file_path.write_text("TEST_ASYNC_CANCELLED=1\n", encoding="utf-8")
+    started_event = threading.Event()
+    release_event = threading.Event()
+    original_timed_flatten_config_file = craftsperson_env_main.timed_flatten_config_file
+
+    def blocked_timed_flatten_config_file(*args):
+        started_event.set()
+        release_event.wait(5)
+        return original_timed_flatten_config_file(*args)
+
+    monkeypatch.setattr(craftsperson_env_main, "timed_flatten_config_file", blocked_timed_flatten_config_file)
+
+    async def load_and_cancel():
+        load_task = asyncio.ensure_future(CraftsEnvConfig().aload_config_file(
+            file_path=str(file_path), root_full_path="", naming_case_type="upper",
+        ))
+        while not started_event.is_set():
+            await asyncio.sleep(0.01)
+        load_task.cancel()
+        release_event.set()
+        with pytest.raises(asyncio.CancelledError):
+            await load_task
+
+    asyncio.run(load_and_cancel())
+
+    assert "TEST_ASYNC_CANCELLED" not in os.environ
+
+
+def test_async_iteration_of_watcher_reloads(tmp_path):
+    file_path = tmp_path / "watch.env"
+    file_path.write_text("TEST_ASYNC_WATCH=1\n", encoding="utf-8")
+    watcher = ConfigWatcher(
+        config_file_params_list=[{"file_path": str(file_path), "naming_case_type": "upper"}],
+        apply_function=lambda config_env_diff: None,
+    )
+
+    async def iterate():
+        loop = asyncio.get_running_loop()
+        config_env_diff_list = []
+        config_env_diff_iterator = watcher.__aiter__()
+        next_task = asyncio.ensure_future(config_env_diff_iterator.__anext__())
+        # The iterator receives the reloads after it starts waiting
+        await asyncio.sleep(0.05)
+
+        file_path.write_text("TEST_ASYNC_WATCH=2\n", encoding="utf-8")
+        await loop.run_in_executor(None, watcher.reload)
+        config_env_diff_list.append(await asyncio.wait_for(next_task, timeout=5))
+
+        await loop.run_in_executor(None, watcher.stop)
+        async for config_env_diff in config_env_diff_iterator:
+            config_env_diff_list.append(config_env_diff)
+        return config_env_diff_list
+
+    config_env_diff_list = asyncio.run(iterate())
+
+    assert [config_env_diff["updated"] for config_env_diff in config_env_diff_list] == [
+        {"TEST_ASYNC_WATCH": ("1", "2")}
+    ]
@@ -0,0 +1,32 @@
+"""
+This file tests the "os_env" and "munch" clients and the class-level get and set calls.
+"""
+
+import os
+
+from craftsperson_env import CraftsEnvConfig
+
+
+def test_class_level_get_and_set_use_os_environ():
+    CraftsEnvConfig.set("TEST_CLIENT_VERSION", 2.5)
+
+    assert os.environ["TEST_CLIENT_VERSION"] == "2.5"
+    assert CraftsEnvConfig.get("TEST_CLIENT_VERSION", float) == 2.5
+    assert CraftsEnvConfig.get(key="TEST_CLIENT_MISSING", value_type=int, default=3) == 3
+
+
+def test_class_level_calls_see_instance_writes_of_os_env_client():
+    CraftsEnvConfig().set("TEST_CLIENT_NAME", "name")
+
+    assert CraftsEnvConfig.get("TEST_CLIENT_NAME") == "name"
+
+
+def test_munch_instances_are_isolated_from_class_level_calls():
+    munch_config = CraftsEnvConfig(client="munch")
+    other_munch_config = CraftsEnvConfig(client="munch")
+    munch_config.set("TEST_CLIENT_LIST", [1, 2])
+
+    assert munch_config.get("TEST_CLIENT_LIST", list) == [1, 2]
+    assert other_munch_config.get("TEST_CLIENT_LIST") is None
+    assert CraftsEnvConfig.get("TEST_CLIENT_LIST") is None
+    assert "TEST_CLIENT_LIST" not in os.environ
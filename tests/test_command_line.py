@@ -0,0 +1,50 @@
+"""
+This file tests the snapshot commands of the command line interface.
+"""
+
+import os
+
+from craftsperson_env.utils.command_line import main
+from craftsperson_env.utils.config_snapshot import ConfigSnapshot
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "")
+
+
+def build_snapshot(snapshot_path: str) -> int:
+    return main([
+        "build-snapshot", snapshot_path, "yaml_config_file.yaml",
+        "--root-full-path", EXAMPLES_PATH, "--naming-case-type", "upper", "--naming-case-join-type", "_",
+    ])
+
+
+def test_build_and_show_snapshot(tmp_path, capsys):
+    snapshot_path = str(tmp_path / "config.snapshot")
+
+    assert build_snapshot(snapshot_path) == 0
+    assert f"keys to {snapshot_path}" in capsys.readouterr().out
+
+    assert main(["show-snapshot", snapshot_path]) == 0
+    output = capsys.readouterr().out
+    assert "format_version: " in output
+    assert "key_count: " in output
+
+
+def test_show_snapshot_key(tmp_path, capsys):
+    snapshot_path = str(tmp_path / "config.snapshot")
+    build_snapshot(snapshot_path)
+    capsys.readouterr()
+    with ConfigSnapshot(snapshot_path=snapshot_path) as config_snapshot:
+        env_key, value = next(iter(config_snapshot.items()))
+
+    assert main(["show-snapshot", snapshot_path, "--key", env_key]) == 0
+    assert capsys.readouterr().out == f"{value}\n"
+    assert main(["show-snapshot", snapshot_path, "--key", "MISSING_KEY"]) == 1
+    assert "MISSING_KEY is not in the snapshot" in capsys.readouterr().err
+
+
+def test_show_snapshot_rejects_a_broken_file(tmp_path, capsys):
+    snapshot_path = tmp_path / "config.snapshot"
+    snapshot_path.write_bytes(b"broken")
+
+    assert main(["show-snapshot", str(snapshot_path)]) == 1
+    assert capsys.readouterr().err
@@ -0,0 +1,125 @@
+"""
+This file tests the format detection and the env parsing of config buffers and streams.
+"""
+
+import io
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.config_buffer import (
+    iter_text_lines,
+    parse_config_buffer,
+    parse_config_stream,
+    sniff_config_type,
+)
+
+
+@pytest.mark.parametrize(
+    "head, expected_config_type",
+    [
+        ('["a"]', "json"),
+        ("[1]", "json"),
+        ("[1, 2]", "json"),
+        ('[\n  "a"\n]', "json"),
+        ('["a"]\n', "json"),
+        ("[server]\nport = 80\n", "toml"),
+        ("[server.http] # comment\nport = 80\n", "toml"),
+        ('["server"]\nport = 80\n', "toml"),
+        ("[1]\nport = 80\n", "toml"),
+        ("[[servers]]\nport = 80\n", "toml"),
+        ("\ufeff<config/>", "xml"),
+        ('{"a": 1}', "json"),
+        ("KEY=value", "env"),
+        ("key = 1", "toml"),
+        ("key: value", "yaml"),
+        ("VERSION=2.0\nAPP=x\n", "env"),
+        ('KEY="x"\nOTHER=1\n', "env"),
+        ('title="x"', "toml"),
+        ('a=1\n[server]\nhost="x"\n', "toml"),
+        ("KEY = value\n[server]\n", "toml"),
+        ('title="x"\nname=plain\n', "env"),
+    ],
+)
+def test_sniff_config_type(head, expected_config_type):
+    assert sniff_config_type(head) == expected_config_type
+
+
+def test_parse_json_array_buffer():
+    assert parse_config_buffer(b'["a"]') == (["a"], "json")
+
+
+def test_iter_text_lines():
+    text = "\ufeffA=1\nB=2\r\nC=3\rD=4"
+
+    assert list(iter_text_lines(text)) == ["A=1", "B=2", "C=3", "D=4"]
+    assert list(iter_text_lines("\nA=1\r")) == ["", "A=1"]
+
+
+@pytest.mark.parametrize("content", [b"\xef\xbb\xbfFIRST_KEY=1\nSECOND_KEY=2\n", b"FIRST_KEY=1\r\nSECOND_KEY=2"])
+def test_env_buffer_and_stream_remove_byte_order_mark(content):
+    expected_config_dict = {"FIRST_KEY": "1", "SECOND_KEY": "2"}
+
+    assert parse_config_buffer(content, config_type="env")[0] == expected_config_dict
+    assert parse_config_buffer(content.decode("utf-8"), config_type="env")[0] == expected_config_dict
+    assert parse_config_stream(io.BytesIO(content), config_type="env")[0] == expected_config_dict
+    assert parse_config_stream(io.BytesIO(content))[0] == expected_config_dict
+
+
+class ShortReadStream(io.RawIOBase):
+    """
+    This class is a stream that cannot seek and returns a few bytes per read, like a socket file.
+    """
+
+    def __init__(self, content: bytes, read_size: int = 3):
+        self.__stream = io.BytesIO(content)
+        self.__read_size = read_size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self.__stream.read(min(len(buffer), self.__read_size))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def load_config_source(source) -> dict:
+    load_function = CraftsEnvConfig().load_config_stream if hasattr(source, "read") else \
+        CraftsEnvConfig().load_config_bytes
+    return load_function(source, naming_case_type="upper", naming_case_join_type="_", dry_run=True)
+
+
+@pytest.mark.parametrize(
+    "content, expected_config_env_dict",
+    [
+        (b"VERSION=2.0\nAPP=x\n", {"VERSION": "2.0", "APP": "x"}),
+        (b"app:\n  version: 2.0\n", {"APP_VERSION": "2.0"}),
+        (b'{"app": {"version": 2.0}}', {"APP_VERSION": "2.0"}),
+        (b"{app: {version: 2.0}}", {"APP_VERSION": "2.0"}),
+        (b'a=1\n[server]\nhost="x"\n', {"A": "1", "SERVER_HOST": "x"}),
+    ],
+)
+@pytest.mark.parametrize("source_type", ["bytes", "short read stream", "buffered short read stream", "text stream"])
+def test_detected_content_is_loaded(content, expected_config_env_dict, source_type):
+    if source_type == "bytes":
+        source = content
+    elif source_type == "short read stream":
+        source = ShortReadStream(content)
+    elif source_type == "buffered short read stream":
+        source = io.BufferedReader(ShortReadStream(content))
+    else:
+        source = io.TextIOWrapper(io.BufferedReader(ShortReadStream(content)), encoding="utf-8")
+
+    assert load_config_source(source) == expected_config_env_dict
+
+
+def test_invalid_json_of_a_given_type_is_not_parsed_as_yaml():
+    with pytest.raises(ValueError):
+        parse_config_buffer(b"{app: 1}", config_type="json")
+
+
+@pytest.mark.parametrize("content", [b"- a\n- b\n", b"plain text", b'["a"]'])
+def test_content_that_is_not_a_mapping_is_rejected(content):
+    with pytest.raises(AssertionError, match="top level is a mapping"):
+        load_config_source(content)
@@ -0,0 +1,151 @@
+"""
+This file tests the on-disk cache of flattened config files.
+"""
+
+import os
+import stat
+import struct
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.config_cache import CACHE_HEADER_FORMAT, ParsedConfigCache
+from craftsperson_env.utils.path_modifier import get_umask
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "")
+
+
+def load_cached_config(config_cache: ParsedConfigCache, file_name: str = "yaml_config_file.yaml") -> dict:
+    return CraftsEnvConfig().load_config_file(
+        file_path=file_name,
+        root_full_path=EXAMPLES_PATH,
+        naming_case_type="upper",
+        naming_case_join_type=".",
+        config_cache=config_cache,
+        dry_run=True,
+    )
+
+
+def get_cache_path_list(cache_dir: str) -> list:
+    return [os.path.join(cache_dir, file_name) for file_name in sorted(os.listdir(cache_dir))]
+
+
+def test_warm_load_equals_cold_load(tmp_path):
+    config_cache = ParsedConfigCache(cache_dir=str(tmp_path))
+    config_env_dict = load_cached_config(config_cache)
+
+    assert len(get_cache_path_list(str(tmp_path))) == 1
+    assert load_cached_config(config_cache) == config_env_dict
+
+
+@pytest.mark.parametrize("corrupt_position", ["magic", "payload", "truncated"])
+def test_corrupt_cache_file_is_removed_before_unmarshalling(tmp_path, corrupt_position):
+    config_cache = ParsedConfigCache(cache_dir=str(tmp_path))
+    config_env_dict = load_cached_config(config_cache)
+    cache_path, = get_cache_path_list(str(tmp_path))
+
+    with open(cache_path, "rb") as file:
+        cache_bytes = bytearray(file.read())
+    if corrupt_position == "magic":
+        cache_bytes[0] ^= 0xFF
+    elif corrupt_position == "payload":
+        cache_bytes[struct.calcsize(CACHE_HEADER_FORMAT) + 10] ^= 0xFF
+    else:
+        del cache_bytes[-5:]
+    with open(cache_path, "wb") as file:
+        file.write(cache_bytes)
+
+    assert ParsedConfigCache.load(cache_path=cache_path) is None
+    assert not os.path.exists(cache_path)
+    assert load_cached_config(config_cache) == config_env_dict
+
+
+def test_parser_backend_is_part_of_the_cache_key(tmp_path):
+    config_cache = ParsedConfigCache(cache_dir=str(tmp_path))
+    previous_parser_backend = CraftsEnvConfig.get_parser_backend("yaml")
+    try:
+        CraftsEnvConfig.set_parser_backend("yaml", "pyyaml")
+        load_cached_config(config_cache)
+        CraftsEnvConfig.set_parser_backend("yaml", previous_parser_backend)
+        load_cached_config(config_cache)
+    finally:
+        CraftsEnvConfig.set_parser_backend("yaml")
+
+    expected_count = 1 if previous_parser_backend == "pyyaml" else 2
+    assert len(get_cache_path_list(str(tmp_path))) == expected_count
+
+
+def test_flatten_parameters_are_part_of_the_cache_key(tmp_path):
+    config_cache = ParsedConfigCache(cache_dir=str(tmp_path))
+    for is_stream_xml in [False, True]:
+        for list_index_type in ["none", "index"]:
+            CraftsEnvConfig().load_config_file(
+                file_path="xml_config_file.xml",
+                root_full_path=EXAMPLES_PATH,
+                naming_case_type="upper",
+                naming_case_join_type=".",
+                is_stream_xml=is_stream_xml,
+                list_index_type=list_index_type,
+                config_cache=config_cache,
+                dry_run=True,
+            )
+
+    assert len(get_cache_path_list(str(tmp_path))) == 4
+
+
+def test_eviction_scans_only_over_the_limits(tmp_path, monkeypatch):
+    config_cache = ParsedConfigCache(cache_dir=str(tmp_path), max_entries=2)
+    scan_list = []
+    original_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: scan_list.append(path) or original_scandir(path))
+
+    for file_name in ["yaml_config_file.yaml", "json_config_file.json"]:
+        load_cached_config(config_cache, file_name=file_name)
+    assert len(scan_list) == 1
+
+    load_cached_config(config_cache, file_name="toml_config_file.toml")
+
+    assert len(scan_list) == 2
+    assert len(get_cache_path_list(str(tmp_path))) == 2
+
+
+@pytest.mark.parametrize("executor_type", ["thread", "process"])
+def test_load_config_files_with_cache(tmp_path, executor_type):
+    config_cache = ParsedConfigCache(cache_dir=str(tmp_path))
+    file_path_list = [os.path.join(EXAMPLES_PATH, file_name)
+                      for file_name in ["yaml_config_file.yaml", "json_config_file.json"]]
+
+    def load() -> dict:
+        return CraftsEnvConfig().load_config_files(
+            file_path_list=file_path_list,
+            executor_type=executor_type,
+            max_workers=2,
+            root_full_path="",
+            naming_case_type="upper",
+            naming_case_join_type=".",
+            config_cache=config_cache,
+            dry_run=True,
+        )["config_env_dict"]
+
+    config_env_dict = load()
+
+    assert len(get_cache_path_list(str(tmp_path))) == 2
+    assert load() == config_env_dict
+
+
+def test_pickled_cache_rebuilds_its_index(tmp_path):
+    import pickle
+
+    config_cache = ParsedConfigCache(cache_dir=str(tmp_path), max_entries=1)
+    load_cached_config(config_cache)
+    config_cache = pickle.loads(pickle.dumps(config_cache))
+    load_cached_config(config_cache, file_name="json_config_file.json")
+
+    assert len(get_cache_path_list(str(tmp_path))) == 1
+
+
+def test_cache_file_is_readable_by_other_users(tmp_path):
+    load_cached_config(ParsedConfigCache(cache_dir=str(tmp_path)))
+    cache_path, = get_cache_path_list(str(tmp_path))
+
+    assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o644 & ~get_umask()
@@ -0,0 +1,96 @@
+"""
+This file tests that readers of the config snapshot never see a half-applied commit.
+"""
+
+import json
+import sys
+import threading
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.config_env_snapshot import ConfigEnvSnapshot
+
+KEY_COUNT = 500
+READER_COUNT = 4
+PUBLISH_COUNT = 200
+RELOAD_COUNT = 20
+
+
+@pytest.fixture
+def short_switch_interval():
+    # Threads switch often, so readers run in the middle of a publish
+    previous_switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(previous_switch_interval)
+
+
+def run_readers(read_state, write, reader_count: int = READER_COUNT) -> list:
+    """
+    This function runs reader threads until the writer returns, and returns the errors the readers found.
+        Every value of one commit is the same, so a read with several values is half-applied.
+    """
+    stop_event = threading.Event()
+    error_list = []
+
+    def read():
+        last_version = -1
+        while not stop_event.is_set():
+            version, mapping = read_state()
+            # The values are read one by one, so a mapping changed during the read is seen as well
+            value_set = {mapping[env_key] for env_key in mapping}
+            if len(value_set) > 1:
+                error_list.append(f"half-applied read of version {version}: {sorted(value_set)}")
+            if version < last_version:
+                error_list.append(f"version {version} after version {last_version}")
+            last_version = version
+
+    thread_list = [threading.Thread(target=read) for _ in range(reader_count)]
+    for thread in thread_list:
+        thread.start()
+    try:
+        write()
+    finally:
+        stop_event.set()
+        for thread in thread_list:
+            thread.join()
+
+    return error_list
+
+
+def test_publish_is_never_half_applied(short_switch_interval):
+    config_env_snapshot = ConfigEnvSnapshot()
+    config_env_snapshot.publish({f"KEY_{index}": "0" for index in range(KEY_COUNT)})
+
+    def write():
+        for generation in range(1, PUBLISH_COUNT + 1):
+            config_env_snapshot.publish({f"KEY_{index}": str(generation) for index in range(KEY_COUNT)})
+
+    error_list = run_readers(read_state=lambda: config_env_snapshot.state, write=write)
+
+    assert error_list == []
+    assert config_env_snapshot.version == PUBLISH_COUNT + 1
+
+
+@pytest.mark.parametrize("client", ["os_env", "munch"])
+def test_reload_snapshot_is_never_half_applied(tmp_path, short_switch_interval, client):
+    file_path_list = []
+    for generation in ["first", "second"]:
+        file_path = tmp_path / f"{generation}.json"
+        file_path.write_text(json.dumps({"stress": {f"key_{index}": generation for index in range(KEY_COUNT)}}),
+                             encoding="utf-8")
+        file_path_list.append(str(file_path))
+
+    config = CraftsEnvConfig(client=client, is_snapshot_read=True)
+    config_file_params = {"root_full_path": "", "naming_case_type": "upper", "naming_case_join_type": "."}
+    config.load_config_file(file_path=file_path_list[0], **config_file_params)
+
+    def write():
+        for reload_index in range(1, RELOAD_COUNT + 1):
+            config.load_config_file(file_path=file_path_list[reload_index % 2], **config_file_params)
+
+    error_list = run_readers(read_state=lambda: (config.snapshot_version, config.snapshot), write=write)
+
+    assert error_list == []
+    assert config.snapshot_version == RELOAD_COUNT + 1
@@ -0,0 +1,36 @@
+"""
+This file tests the key paths built by ConfigFlattener.
+"""
+
+from craftsperson_env.utils.config_flattener import ConfigFlattener
+
+
+def flatten(data: dict, keys: tuple = (), list_index_type: str = "none") -> tuple:
+    config_env_dict = {}
+    key_path_dict = {}
+    ConfigFlattener(naming_case_type="upper", naming_case_join_type="_", list_index_type=list_index_type,
+                    key_path_dict=key_path_dict).add_config_env(data, config_env_dict, keys)
+    return config_env_dict, key_path_dict
+
+
+def test_sibling_keys_follow_nested_dicts():
+    data = {"a": {"b": {"c": 1}, "d": 2}, "e": {"f": [{"g": 3}]}, "h": 4}
+
+    config_env_dict, key_path_dict = flatten(data, keys=("root",), list_index_type="index")
+
+    assert config_env_dict == {"ROOT_A_B_C": "1", "ROOT_A_D": "2", "ROOT_E_F_0_G": "3", "ROOT_H": "4"}
+    assert key_path_dict["ROOT_E_F_0_G"] == ("root", "e", "f", "0", "g")
+
+
+def test_deep_nesting_builds_the_leaf_key():
+    depth = 5000
+    data = node = {}
+    for index in range(depth):
+        node[f"k{index}"] = node = {}
+    node["leaf"] = 1
+
+    config_env_dict, key_path_dict = flatten(data)
+
+    env_key, = config_env_dict
+    assert config_env_dict[env_key] == "1"
+    assert key_path_dict[env_key] == tuple(f"k{index}" for index in range(depth)) + ("leaf",)
@@ -0,0 +1,89 @@
+"""
+This file tests the typed values of keys loaded with interpolated references.
+"""
+
+import os
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+
+CONFIG_CONTENT = 'hosts: ["${TEST_INTERPOLATE_HOST}", b]\nports: [1, 2]\n'
+
+
+@pytest.mark.parametrize("load_method", ["file", "bytes", "files"])
+def test_get_returns_interpolated_native_values(tmp_path, load_method):
+    os.environ["TEST_INTERPOLATE_HOST"] = "example.com"
+    file_path = tmp_path / "interpolate.yaml"
+    file_path.write_text(CONFIG_CONTENT, encoding="utf-8")
+    config = CraftsEnvConfig()
+    config_file_params = {"naming_case_type": "upper", "naming_case_join_type": "_", "is_interpolate": True}
+
+    if load_method == "file":
+        config.load_config_file(file_path=str(file_path), root_full_path="", **config_file_params)
+    elif load_method == "bytes":
+        config.load_config_bytes(buffer=CONFIG_CONTENT.encode("utf-8"), config_type="yaml", **config_file_params)
+    else:
+        config.load_config_files(file_path_list=[str(file_path)], root_full_path="", **config_file_params)
+
+    assert os.environ["HOSTS"] == "['example.com', 'b']"
+    assert config.get("HOSTS", list) == ["example.com", "b"]
+    assert config.get("PORTS", list) == [1, 2]
+
+
+def interpolate(config_env_dict: dict, existing_env_dict: dict = {}) -> dict:
+    from craftsperson_env.utils.config_interpolator import interpolate_config_env
+
+    return interpolate_config_env(config_env_dict=config_env_dict, get_value_function=existing_env_dict.get)
+
+
+@pytest.mark.parametrize(
+    "config_env_dict, existing_env_dict, expected_config_env_dict",
+    [
+        ({"A": "x", "B": "${A}/y"}, {}, {"A": "x", "B": "x/y"}),
+        ({"C": "${B}-c", "B": "${A}-b", "A": "a"}, {}, {"C": "a-b-c", "B": "a-b", "A": "a"}),
+        ({"B": "${A}"}, {"A": "existing"}, {"B": "existing"}),
+        ({"A": "config", "B": "${A}"}, {"A": "existing"}, {"A": "config", "B": "config"}),
+        ({"B": "${A:-fallback}"}, {}, {"B": "fallback"}),
+        ({"B": "${A:-}"}, {}, {"B": ""}),
+        ({"B": "${A:-fallback}"}, {"A": "existing"}, {"B": "existing"}),
+        ({"B": "${A}"}, {}, {"B": "${A}"}),
+        ({"PATH": "${PATH}:/opt/bin"}, {"PATH": "/usr/bin"}, {"PATH": "/usr/bin:/opt/bin"}),
+        ({"A": "1", "B": "${A}${A}:${C:-3}"}, {}, {"A": "1", "B": "11:3"}),
+        ({"A": "$A {A} $${A}"}, {"A": "x"}, {"A": "$A {A} $x"}),
+    ],
+)
+def test_references_are_resolved(config_env_dict, existing_env_dict, expected_config_env_dict):
+    assert interpolate(config_env_dict, existing_env_dict) == expected_config_env_dict
+
+
+def test_values_without_references_are_returned_as_they_are():
+    config_env_dict = {"A": "1", "B": "$B"}
+
+    assert interpolate(config_env_dict) is config_env_dict
+
+
+@pytest.mark.parametrize(
+    "config_env_dict, cycle_message",
+    [
+        ({"A": "${B}", "B": "${A}"}, "A -> B -> A"),
+        ({"A": "${B}", "B": "${C}", "C": "${A}", "D": "d"}, "A -> B -> C -> A"),
+        ({"X": "${A}", "A": "${B}", "B": "${A:-default}"}, "A -> B -> A"),
+    ],
+)
+def test_circular_references_are_rejected(config_env_dict, cycle_message):
+    with pytest.raises(AssertionError, match=f"Circular references: {cycle_message}"):
+        interpolate(config_env_dict)
+
+
+def test_load_resolves_references_with_existing_values():
+    os.environ["TEST_INTERPOLATE_ROOT"] = "/srv"
+    config = CraftsEnvConfig()
+
+    config_env_dict = config.load_config_bytes(
+        buffer=b"DATA_PATH=${TEST_INTERPOLATE_ROOT}/data\nLOG_PATH=${DATA_PATH}/log\nMODE=${TEST_UNSET_MODE:-dev}\n",
+        config_type="env", naming_case_type="upper", is_interpolate=True,
+    )
+
+    assert config_env_dict == {"DATA_PATH": "/srv/data", "LOG_PATH": "/srv/data/log", "MODE": "dev"}
+    assert os.environ["LOG_PATH"] == "/srv/data/log"
@@ -0,0 +1,118 @@
+"""
+This file tests the enabling, disabling, moving and removing of config layers.
+"""
+
+import os
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+
+
+def load_layer(config: CraftsEnvConfig, layer_name: str, content: bytes) -> dict:
+    return config.load_config_bytes(buffer=content, config_type="env", naming_case_type="upper",
+                                    layer_name=layer_name)
+
+
+@pytest.fixture
+def layered_config() -> CraftsEnvConfig:
+    os.environ["TEST_LAYER_HOST"] = "environ-host"
+    os.environ.pop("TEST_LAYER_PORT", None)
+    os.environ.pop("TEST_LAYER_DEBUG", None)
+    config = CraftsEnvConfig()
+    load_layer(config, "defaults", b"TEST_LAYER_HOST=default-host\nTEST_LAYER_PORT=80\n")
+    load_layer(config, "host", b"TEST_LAYER_PORT=8080\nTEST_LAYER_DEBUG=1\n")
+    return config
+
+
+def test_highest_layer_supplies_a_key(layered_config):
+    layers = layered_config.layers
+
+    assert layers.layer_name_list == ["defaults", "host"]
+    assert os.environ["TEST_LAYER_HOST"] == "default-host"
+    assert os.environ["TEST_LAYER_PORT"] == "8080"
+    assert layers.get_layer_of_key("TEST_LAYER_PORT") == "host"
+    assert layers.get_layer_of_key("TEST_LAYER_HOST") == "defaults"
+
+
+def test_disable_and_enable_layer(layered_config):
+    layers = layered_config.layers
+
+    config_env_diff = layers.disable_layer("host")
+
+    assert config_env_diff == {"added": {}, "updated": {"TEST_LAYER_PORT": ("8080", "80")},
+                               "removed": {"TEST_LAYER_DEBUG": "1"}}
+    assert not layers.is_layer_enabled("host")
+    assert os.environ["TEST_LAYER_PORT"] == "80"
+    assert "TEST_LAYER_DEBUG" not in os.environ
+
+    config_env_diff = layers.enable_layer("host")
+
+    assert config_env_diff == {"added": {"TEST_LAYER_DEBUG": "1"}, "updated": {"TEST_LAYER_PORT": ("80", "8080")},
+                               "removed": {}}
+    assert os.environ["TEST_LAYER_PORT"] == "8080"
+
+
+def test_disabled_lowest_layer_restores_the_environ_value(layered_config):
+    layered_config.layers.disable_layer("defaults")
+
+    assert os.environ["TEST_LAYER_HOST"] == "environ-host"
+    assert os.environ["TEST_LAYER_PORT"] == "8080"
+
+
+def test_move_layer(layered_config):
+    layers = layered_config.layers
+
+    config_env_diff = layers.move_layer("host", 0)
+
+    assert layers.layer_name_list == ["host", "defaults"]
+    assert config_env_diff["updated"] == {"TEST_LAYER_PORT": ("8080", "80")}
+    assert os.environ["TEST_LAYER_PORT"] == "80"
+    assert os.environ["TEST_LAYER_DEBUG"] == "1"
+    assert layers.move_layer("host", 0) == {"added": {}, "updated": {}, "removed": {}}
+
+
+def test_remove_layer(layered_config):
+    layers = layered_config.layers
+
+    layers.remove_layer("defaults")
+
+    assert layers.layer_name_list == ["host"]
+    assert os.environ["TEST_LAYER_HOST"] == "environ-host"
+    assert os.environ["TEST_LAYER_PORT"] == "8080"
+
+
+def test_reloaded_layer_keeps_its_position(layered_config):
+    config_env_dict = load_layer(layered_config, "defaults", b"TEST_LAYER_PORT=81\n")
+
+    assert config_env_dict == {"TEST_LAYER_PORT": "81"}
+    assert layered_config.layers.layer_name_list == ["defaults", "host"]
+    assert os.environ["TEST_LAYER_PORT"] == "8080"
+    assert os.environ["TEST_LAYER_HOST"] == "environ-host"
+
+
+def test_environ_layer_overrides_the_config_files(layered_config):
+    layered_config.add_environ_layer()
+
+    assert layered_config.layers.layer_name_list == ["defaults", "host", "environ"]
+    assert os.environ["TEST_LAYER_HOST"] == "environ-host"
+    assert os.environ["TEST_LAYER_PORT"] == "8080"
+
+
+@pytest.mark.parametrize("method_name, args", [("enable_layer", ()), ("disable_layer", ()), ("move_layer", (0,)),
+                                               ("remove_layer", ())])
+def test_unknown_layer_is_rejected(layered_config, method_name, args):
+    with pytest.raises(AssertionError):
+        getattr(layered_config.layers, method_name)("missing", *args)
+
+
+def test_layers_of_the_munch_client():
+    config = CraftsEnvConfig(client="munch")
+    load_layer(config, "defaults", b"TEST_LAYER_PORT=80\n")
+    load_layer(config, "host", b"TEST_LAYER_PORT=8080\n")
+
+    config.layers.disable_layer("host")
+    assert config.get("TEST_LAYER_PORT") == "80"
+
+    config.layers.disable_layer("defaults")
+    assert config.get("TEST_LAYER_PORT") is None
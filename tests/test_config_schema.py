@@ -0,0 +1,63 @@
+"""
+This file tests the field types of compiled config schemas.
+"""
+
+import dataclasses
+import sys
+from typing import Dict, List, Optional, Union
+
+import pytest
+
+from craftsperson_env.utils.config_schema import compile_config_schema, get_schema_field_type
+
+
+@pytest.mark.parametrize(
+    "annotation, expected_field_type",
+    [
+        (int, (int, False)),
+        (List[str], (list, False)),
+        (Optional[int], (int, True)),
+        (Optional[Dict[str, int]], (dict, True)),
+        (Union[int, str], (str, False)),
+        (Union[int, str, None], (str, True)),
+    ],
+)
+def test_get_schema_field_type(annotation, expected_field_type):
+    assert get_schema_field_type(annotation) == expected_field_type
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="'int | None' annotations need Python 3.10")
+def test_get_schema_field_type_of_union_operator():
+    assert get_schema_field_type(eval("int | None")) == (int, True)
+
+
+def test_load_optional_fields():
+    @dataclasses.dataclass
+    class ServiceSchema:
+        port: int
+        hosts: List[str]
+        timeout: Optional[float]
+
+    config = compile_config_schema(ServiceSchema, prefix="SERVICE_").load(
+        environ={"SERVICE_PORT": "8080", "SERVICE_HOSTS": "['a', 'b']"}
+    )
+
+    assert config.to_dict() == {"port": 8080, "hosts": ["a", "b"], "timeout": None}
+
+
+def test_loads_do_not_share_mutable_values():
+    @dataclasses.dataclass
+    class ClusterSchema:
+        hosts: List[str]
+        labels: Dict[str, List[str]]
+
+    environ = {"CLUSTER_HOSTS": "['a', 'b']", "CLUSTER_LABELS": "{'zone': ['x']}"}
+    compiled_config_schema = compile_config_schema(ClusterSchema, prefix="CLUSTER_")
+    first_config = compiled_config_schema.load(environ=environ)
+    first_config.hosts.append("c")
+    first_config.labels["zone"].append("y")
+
+    second_config = compiled_config_schema.load(environ=environ)
+
+    assert second_config.to_dict() == {"hosts": ["a", "b"], "labels": {"zone": ["x"]}}
+    assert second_config.hosts is not compiled_config_schema.load(environ=environ).hosts
@@ -0,0 +1,60 @@
+"""
+This file tests the round trip of config snapshot files.
+"""
+
+import os
+import stat
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.config_snapshot import ConfigSnapshot
+from craftsperson_env.utils.path_modifier import get_umask
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "")
+FILE_PATH_LIST = ["yaml_config_file.yaml", "json_config_file.json"]
+
+
+def build_snapshot(snapshot_path: str) -> dict:
+    return CraftsEnvConfig().build_config_snapshot(
+        snapshot_path=snapshot_path,
+        file_path_list=FILE_PATH_LIST,
+        root_full_path=EXAMPLES_PATH,
+        naming_case_type="upper",
+        naming_case_join_type="_",
+    )
+
+
+def test_snapshot_round_trip(tmp_path):
+    snapshot_path = str(tmp_path / "config.snapshot")
+    config_env_dict = build_snapshot(snapshot_path)
+
+    with ConfigSnapshot(snapshot_path=snapshot_path) as config_snapshot:
+        assert config_snapshot.to_dict() == config_env_dict
+        assert list(config_snapshot) == sorted(config_env_dict)
+        assert config_snapshot.get("MISSING_KEY") is None
+
+    config_snapshot = CraftsEnvConfig().load_config_snapshot(snapshot_path=snapshot_path)
+    try:
+        for env_key, value in config_env_dict.items():
+            assert os.environ[env_key] == value
+    finally:
+        config_snapshot.close()
+
+
+def test_snapshot_file_is_readable_by_other_users(tmp_path):
+    snapshot_path = str(tmp_path / "config.snapshot")
+    build_snapshot(snapshot_path)
+
+    assert stat.S_IMODE(os.stat(snapshot_path).st_mode) == 0o644 & ~get_umask()
+
+
+def test_corrupt_snapshot_is_rejected(tmp_path):
+    snapshot_path = tmp_path / "config.snapshot"
+    build_snapshot(str(snapshot_path))
+    content = bytearray(snapshot_path.read_bytes())
+    content[-1] ^= 0xFF
+    snapshot_path.write_bytes(bytes(content))
+
+    with pytest.raises(AssertionError):
+        ConfigSnapshot(snapshot_path=str(snapshot_path))
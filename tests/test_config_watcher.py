@@ -0,0 +1,135 @@
+"""
+This file tests the hot-reload watcher.
+"""
+
+import os
+import time
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+
+
+def write_env_file(file_path: str, content: str, mtime_ns: int) -> None:
+    # The file is replaced in one step, so a reload never reads a half-written file
+    temp_path = file_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(content)
+    # The modification time is set explicitly, so two writes within one clock tick are still detected
+    os.utime(temp_path, ns=(mtime_ns, mtime_ns))
+    os.replace(temp_path, file_path)
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_failing_callback_does_not_stop_the_watcher(tmp_path):
+    file_path = str(tmp_path / "watch.env")
+    write_env_file(file_path, "WATCH_A=1\n", mtime_ns=1_000_000_000)
+    diff_list = []
+
+    def failing_callback(config_env_diff):
+        raise RuntimeError("callback failed")
+
+    config = CraftsEnvConfig()
+    watcher = config.watch_config_files(
+        file_path_list=[file_path], callback=failing_callback, poll_interval=0.01, debounce_seconds=0.01,
+        is_use_inotify=False, root_full_path="", naming_case_type="upper",
+    )
+    watcher.add_callback(diff_list.append)
+    try:
+        write_env_file(file_path, "WATCH_A=2\n", mtime_ns=2_000_000_000)
+        assert wait_for(lambda: os.environ.get("WATCH_A") == "2")
+        assert wait_for(lambda: len(diff_list) == 1)
+        assert isinstance(watcher.last_error, RuntimeError)
+
+        write_env_file(file_path, "WATCH_A=3\n", mtime_ns=3_000_000_000)
+        assert wait_for(lambda: os.environ.get("WATCH_A") == "3")
+        assert wait_for(lambda: len(diff_list) == 2)
+    finally:
+        watcher.stop()
+
+
+def test_config_env_diff_of_none_values():
+    from craftsperson_env.utils.config_watcher import get_config_env_diff
+
+    config_env_diff = get_config_env_diff(
+        old_config_env_dict={"NONE": None, "UPDATED": None, "REMOVED": None},
+        new_config_env_dict={"NONE": None, "UPDATED": "1", "ADDED": None},
+    )
+
+    assert config_env_diff == {"added": {"ADDED": None}, "updated": {"UPDATED": (None, "1")},
+                               "removed": {"REMOVED": None}}
+
+
+def test_concurrent_checks_apply_changes_in_order(tmp_path, monkeypatch):
+    import threading
+
+    from craftsperson_env.utils import config_watcher
+
+    file_path = str(tmp_path / "watch.env")
+    write_env_file(file_path, "WATCH_B=0\n", mtime_ns=1_000_000_000)
+    original_flatten_config_file = config_watcher.flatten_config_file
+
+    def slow_flatten_config_file(**params):
+        config_env_dict = original_flatten_config_file(**params)
+        # The first change takes longer to parse than the second one
+        time.sleep(0.3 if config_env_dict.get("WATCH_B") == "1" else 0.01)
+        return config_env_dict
+
+    monkeypatch.setattr(config_watcher, "flatten_config_file", slow_flatten_config_file)
+    diff_list = []
+    watcher = config_watcher.ConfigWatcher(
+        config_file_params_list=[{"file_path": file_path, "naming_case_type": "upper"}],
+        apply_function=lambda config_env_diff: os.environ.update(
+            {key: value for key, (_, value) in config_env_diff["updated"].items()}
+        ),
+    )
+    watcher.add_callback(diff_list.append)
+
+    write_env_file(file_path, "WATCH_B=1\n", mtime_ns=2_000_000_000)
+    check_thread = threading.Thread(target=watcher.check)
+    check_thread.start()
+    time.sleep(0.05)
+    write_env_file(file_path, "WATCH_B=2\n", mtime_ns=3_000_000_000)
+    watcher.check()
+    check_thread.join()
+
+    # The slow first reload must not overwrite the second change with a stale value
+    assert os.environ["WATCH_B"] == "2"
+    assert watcher.config_env_dict == {"WATCH_B": "2"}
+    assert [config_env_diff["updated"]["WATCH_B"] for config_env_diff in diff_list] == [("0", "1"), ("1", "2")]
+
+
+def test_failed_apply_is_applied_again_by_the_next_reload(tmp_path):
+    from craftsperson_env.utils.config_watcher import ConfigWatcher
+
+    file_path = str(tmp_path / "watch.env")
+    write_env_file(file_path, "WATCH_C=1\n", mtime_ns=1_000_000_000)
+    applied_diff_list = []
+
+    def apply_function(config_env_diff):
+        if not applied_diff_list:
+            applied_diff_list.append(None)
+            raise OSError("apply failed")
+        applied_diff_list.append(config_env_diff)
+
+    watcher = ConfigWatcher(
+        config_file_params_list=[{"file_path": file_path, "naming_case_type": "upper"}],
+        apply_function=apply_function,
+    )
+    write_env_file(file_path, "WATCH_C=2\n", mtime_ns=2_000_000_000)
+
+    with pytest.raises(OSError):
+        watcher.check()
+    assert watcher.config_env_dict == {"WATCH_C": "1"}
+
+    assert watcher.reload()["updated"] == {"WATCH_C": ("1", "2")}
+    assert applied_diff_list[-1]["updated"] == {"WATCH_C": ("1", "2")}
+    assert watcher.config_env_dict == {"WATCH_C": "2"}
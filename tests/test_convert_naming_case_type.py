@@ -0,0 +1,67 @@
+"""
+This file tests the memoized naming case converters, including key paths that repeat a segment.
+"""
+
+import pytest
+
+from craftsperson_env.utils.contraster import NAMING_CASE_LIST, OTHER_CONFIG_NAME_TYPE_LIST
+from craftsperson_env.utils.convert_naming_case_type import convert_naming_case_type, get_naming_case_converter
+
+REPEATED_SEGMENT_CASE_DICT = {
+    "pascal": "AppDbApp",
+    "camel": "appDbApp",
+    "snake": "app_db_app",
+    "kebab": "app-db-app",
+    "flat": "appdbapp",
+    "upper-flat": "APPDBAPP",
+    "pascal-snake": "App_Db_App",
+    "camel-snake": "app_Db_App",
+    "screaming-snake": "APP_DB_APP",
+    "cobol": "APP-DB-APP",
+    "upper": "APP.DB.APP",
+    "lower": "app.db.app",
+}
+
+
+def test_every_naming_case_type_is_covered():
+    assert set(REPEATED_SEGMENT_CASE_DICT) == set(NAMING_CASE_LIST + OTHER_CONFIG_NAME_TYPE_LIST)
+
+
+@pytest.mark.parametrize("naming_case_type, expected_key", REPEATED_SEGMENT_CASE_DICT.items())
+def test_repeated_segment(naming_case_type, expected_key):
+    key = convert_naming_case_type(key_list=["app", "db", "app"], naming_case_type=naming_case_type,
+                                   naming_case_join_type=".")
+
+    assert key == expected_key
+
+
+@pytest.mark.parametrize(
+    "naming_case_type, expected_key",
+    [("camel", "aBA"), ("camel-snake", "a_B_A"), ("pascal", "ABA"), ("snake", "a_b_a")],
+)
+def test_repeated_single_letter_segment(naming_case_type, expected_key):
+    # The first segment is converted by its position, so a repeat of it later in the path is not lowered
+    key = convert_naming_case_type(key_list=["a", "b", "a"], naming_case_type=naming_case_type)
+
+    assert key == expected_key
+
+
+@pytest.mark.parametrize("naming_case_type", REPEATED_SEGMENT_CASE_DICT)
+def test_repeated_segment_is_memoized(naming_case_type):
+    converter = get_naming_case_converter(naming_case_type=naming_case_type, naming_case_join_type=".")
+    converter.cache_clear()
+
+    first_key = convert_naming_case_type(key_list=["a", "b", "a"], naming_case_type=naming_case_type,
+                                         naming_case_join_type=".")
+    second_key = convert_naming_case_type(key_list=["a", "b", "a"], naming_case_type=naming_case_type,
+                                          naming_case_join_type=".")
+
+    assert first_key == second_key
+    assert converter.cache_info().hits == 1
+    assert converter.cache_info().misses == 1
+    assert get_naming_case_converter(naming_case_type=naming_case_type, naming_case_join_type=".") is converter
+
+
+def test_empty_key_path_and_unknown_naming_case_type():
+    assert convert_naming_case_type(key_list=[], naming_case_type="snake") == ""
+    assert convert_naming_case_type(key_list=["a"], naming_case_type="unknown") is None
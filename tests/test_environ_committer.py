@@ -0,0 +1,52 @@
+"""
+This file tests the atomic commits and the dry runs of loaded key-value pairs.
+"""
+
+import json
+import os
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.environ_committer import commit_config_env
+
+# A null byte cannot be written to the environment, so the commit fails after the first key is written
+FAILING_CONFIG_ENV_DICT = {"TEST_ATOMIC_SET": "new", "TEST_ATOMIC_ADDED": "new", "TEST_ATOMIC_BROKEN": "bad\x00"}
+
+
+@pytest.mark.parametrize("is_atomic_commit", [True, False])
+def test_failed_commit_restores_previous_values_only_if_atomic(is_atomic_commit):
+    os.environ["TEST_ATOMIC_SET"] = "old"
+
+    with pytest.raises(ValueError):
+        commit_config_env(config_env_dict=FAILING_CONFIG_ENV_DICT, is_atomic_commit=is_atomic_commit)
+
+    if is_atomic_commit:
+        assert os.environ["TEST_ATOMIC_SET"] == "old"
+        assert "TEST_ATOMIC_ADDED" not in os.environ
+    else:
+        assert os.environ["TEST_ATOMIC_SET"] == "new"
+        assert os.environ["TEST_ATOMIC_ADDED"] == "new"
+    assert "TEST_ATOMIC_BROKEN" not in os.environ
+
+
+def test_atomic_load_keeps_the_previous_environ_values():
+    os.environ["TEST_ATOMIC_SET"] = "old"
+    buffer = json.dumps({"test_atomic_set": "new", "test_atomic_added": "new", "test_atomic_broken": "bad\x00"})
+
+    with pytest.raises(ValueError):
+        CraftsEnvConfig().load_config_bytes(buffer=buffer.encode("utf-8"), config_type="json",
+                                            naming_case_type="upper", naming_case_join_type="_",
+                                            is_atomic_commit=True)
+
+    assert os.environ["TEST_ATOMIC_SET"] == "old"
+    assert "TEST_ATOMIC_ADDED" not in os.environ
+
+
+def test_dry_run_does_not_write_environ():
+    config_env_dict = CraftsEnvConfig().load_config_bytes(
+        buffer=b"TEST_DRY_RUN_KEY=1\n", config_type="env", naming_case_type="upper", dry_run=True,
+    )
+
+    assert config_env_dict == {"TEST_DRY_RUN_KEY": "1"}
+    assert "TEST_DRY_RUN_KEY" not in os.environ
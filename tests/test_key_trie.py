@@ -0,0 +1,65 @@
+"""
+This file tests the subtree queries of loaded keys.
+"""
+
+import os
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "")
+OPTIONS_KEY_LIST = ["APPLICATION.OPTIONS.USE_SSL", "APPLICATION.OPTIONS.SSL_CERT"]
+
+
+def load_yaml_config(client: str = "os_env", **params) -> CraftsEnvConfig:
+    config = CraftsEnvConfig(client=client, **params)
+    config.load_config_file(file_path="yaml_config_file.yaml", root_full_path=EXAMPLES_PATH,
+                            naming_case_type="upper", naming_case_join_type=".")
+    return config
+
+
+@pytest.mark.parametrize("client", ["os_env", "munch"])
+def test_keys_under_a_prefix(client):
+    config = load_yaml_config(client=client)
+
+    assert config.keys_under("APPLICATION.OPTIONS") == OPTIONS_KEY_LIST
+    assert config.keys_under("APPLICATION.OPT") == []
+    assert config.keys_under("MISSING") == []
+    assert set(OPTIONS_KEY_LIST) < set(config.keys_under(""))
+    assert "VERSION" in config.keys_under("")
+
+
+@pytest.mark.parametrize("client, use_ssl", [("os_env", "True"), ("munch", True)])
+def test_get_prefix_rebuilds_the_nested_dict(client, use_ssl):
+    config = load_yaml_config(client=client)
+
+    assert config.get_prefix("APPLICATION.OPTIONS") == {"use_ssl": use_ssl, "ssl_cert": "/path/to/cert"}
+    assert config.get_prefix("APPLICATION")["options"] == {"use_ssl": use_ssl, "ssl_cert": "/path/to/cert"}
+    assert config.get_prefix("MISSING") == {}
+
+
+def test_subtree_follows_the_current_values():
+    config = load_yaml_config()
+    os.environ["APPLICATION.OPTIONS.SSL_CERT"] = "/other/cert"
+    del os.environ["APPLICATION.OPTIONS.USE_SSL"]
+
+    assert config.keys_under("APPLICATION.OPTIONS") == ["APPLICATION.OPTIONS.SSL_CERT"]
+    assert config.get_prefix("APPLICATION.OPTIONS") == {"ssl_cert": "/other/cert"}
+
+
+def test_subtree_of_a_snapshot_read_config():
+    config = load_yaml_config(is_snapshot_read=True)
+
+    assert config.keys_under("APPLICATION.OPTIONS") == OPTIONS_KEY_LIST
+    assert config.get_prefix("APPLICATION.OPTIONS") == {"use_ssl": "True", "ssl_cert": "/path/to/cert"}
+
+
+def test_subtree_with_another_naming_case():
+    config = load_yaml_config()
+    config.load_config_file(file_path="yaml_config_file.yaml", root_full_path=EXAMPLES_PATH,
+                            naming_case_type="lower", naming_case_join_type="_")
+
+    assert config.keys_under("application_options") == ["application_options_use_ssl", "application_options_ssl_cert"]
+    assert config.keys_under("APPLICATION.OPTIONS", naming_case_type="upper",
+                             naming_case_join_type=".") == OPTIONS_KEY_LIST
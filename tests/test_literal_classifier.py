@@ -0,0 +1,54 @@
+"""
+This file tests the classification of config values that contain Python literals.
+"""
+
+import pytest
+
+from craftsperson_env.utils.contraster import LITERAL_MAX_LENGTH
+from craftsperson_env.utils.literal_classifier import classify_literal
+
+
+@pytest.mark.parametrize(
+    "value, expected_literal_value",
+    [
+        ("{'a': 1}", {"a": 1}),
+        ("[1, 'b']", [1, "b"]),
+        ("(1, 2)", (1, 2)),
+        ("'quoted'", "quoted"),
+        ('"quoted"', "quoted"),
+        ("  [1]\n", [1]),
+    ],
+)
+def test_literal_values_are_parsed(value, expected_literal_value):
+    assert classify_literal(value) == (expected_literal_value, True)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "plain",
+        "1",
+        "",
+        "[unknown_name]",
+        "{'a': }",
+        "(1 +)",
+        "'unterminated",
+        "[" * 1000 + "]" * 1000,
+        "[" + "1," * LITERAL_MAX_LENGTH + "]",
+    ],
+)
+def test_other_values_are_returned_unchanged(value):
+    assert classify_literal(value) == (value, False)
+
+
+def test_only_short_literals_are_memoized():
+    from craftsperson_env.utils.contraster import LITERAL_CACHE_MAX_LENGTH
+    from craftsperson_env.utils.literal_classifier import parse_cached_literal
+
+    parse_cached_literal.cache_clear()
+    short_value = "[1, 2]"
+    long_value = "[" + "1," * LITERAL_CACHE_MAX_LENGTH + "]"
+
+    assert classify_literal(short_value)[0] is classify_literal(short_value)[0]
+    assert classify_literal(long_value) == ([1] * LITERAL_CACHE_MAX_LENGTH, True)
+    assert parse_cached_literal.cache_info().currsize == 1
@@ -0,0 +1,64 @@
+"""
+This file tests the env line parser of LoadConfigFile.
+"""
+
+import os
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.load_config_file import LoadConfigFile
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "")
+
+
+@pytest.mark.parametrize(
+    "value, expected_value",
+    [
+        ('"x"', "x"),
+        ("'x'", "x"),
+        ('"x" # comment', "x"),
+        ("'x'   #comment", "x"),
+        ('"a # b"', "a # b"),
+        ('"a\\"b" # comment', 'a"b'),
+        ('"line\\nbreak"', "line\nbreak"),
+        ("x # comment", "x"),
+        ("a#b", "a#b"),
+        ('"x', '"x'),
+        ('"{\'test\': 1}"', "{'test': 1}"),
+    ],
+)
+def test_unquote_env_value(value, expected_value):
+    assert LoadConfigFile.unquote_env_value(value) == expected_value
+
+
+def test_iter_env_lines():
+    line_list = [
+        "# comment",
+        "",
+        "export A=1",
+        "B = a=b",
+        'C="quoted" # comment',
+        "no separator",
+    ]
+
+    assert list(LoadConfigFile.iter_env_lines(line_list)) == [("A", "1"), ("B", "a=b"), ("C", "quoted")]
+
+
+def test_quoted_literal_env_values_stay_strings():
+    line_list = ["JSON_FORMAT=\"{'test': 1}\"", "LIST='[1, 2]' # comment", "PLAIN={'test': 1}"]
+
+    assert list(LoadConfigFile.iter_env_lines(line_list)) == [
+        ("JSON_FORMAT", "\"{'test': 1}\""),
+        ("LIST", "'[1, 2]'"),
+        ("PLAIN", "{'test': 1}"),
+    ]
+
+
+def test_env_example_keeps_its_environ_values():
+    config = CraftsEnvConfig()
+    config.load_config_file(file_path="env_config_file.env", root_full_path=EXAMPLES_PATH, naming_case_type="upper")
+
+    assert os.environ["JSON_FORMAT"] == "{'test': 1}"
+    assert config.get("JSON_FORMAT") == "{'test': 1}"
+    assert config.get("JSON_FORMAT", dict) == {"test": 1}
@@ -0,0 +1,53 @@
+"""
+This file tests the override order of config files loaded concurrently.
+"""
+
+import os
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+
+FILE_COUNT = 8
+
+
+def write_config_files(tmp_path) -> list:
+    file_path_list = []
+    for index in range(FILE_COUNT):
+        file_path = tmp_path / f"config_{index}.yaml"
+        # The first files are the largest, so they tend to finish after the later ones
+        padding = "".join(f"padding_{index}_{line}: {line}\n" for line in range((FILE_COUNT - index) * 200))
+        file_path.write_text(f"shared: {index}\nfile_{index}: {index}\n{padding}", encoding="utf-8")
+        file_path_list.append(str(file_path))
+    return file_path_list
+
+
+@pytest.mark.parametrize("executor_type", ["thread", "process"])
+def test_later_files_override_earlier_files(tmp_path, executor_type):
+    file_path_list = write_config_files(tmp_path)
+
+    load_result = CraftsEnvConfig().load_config_files(
+        file_path_list=file_path_list, executor_type=executor_type, max_workers=4,
+        root_full_path="", naming_case_type="upper", naming_case_join_type="_",
+    )
+
+    config_env_dict = load_result["config_env_dict"]
+    assert config_env_dict["SHARED"] == str(FILE_COUNT - 1)
+    assert all(config_env_dict[f"FILE_{index}"] == str(index) for index in range(FILE_COUNT))
+    assert [file_path for file_path, _ in load_result["file_timing_list"]] == file_path_list
+    assert os.environ["SHARED"] == str(FILE_COUNT - 1)
+
+
+@pytest.mark.parametrize("executor_type", ["thread", "process"])
+def test_file_params_override_shared_params(tmp_path, executor_type):
+    file_path_list = write_config_files(tmp_path)[:2]
+    file_path_list[1] = {"file_path": file_path_list[1], "naming_case_type": "lower"}
+
+    config_env_dict = CraftsEnvConfig().load_config_files(
+        file_path_list=file_path_list, executor_type=executor_type,
+        root_full_path="", naming_case_type="upper", naming_case_join_type="_", dry_run=True,
+    )["config_env_dict"]
+
+    assert config_env_dict["SHARED"] == "0"
+    assert config_env_dict["shared"] == "1"
+    assert config_env_dict["file_1"] == "1"
@@ -0,0 +1,77 @@
+"""
+This file tests the per-phase statistics and the profile of config file loads.
+"""
+
+import os
+import pstats
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.config_cache import ParsedConfigCache
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "")
+FILE_NAME = "yaml_config_file.yaml"
+
+
+def load_with_stats(dry_run: bool = False, **params) -> tuple:
+    stats_list = []
+    config_env_dict = CraftsEnvConfig().load_config_file(
+        file_path=FILE_NAME, root_full_path=EXAMPLES_PATH, naming_case_type="upper", naming_case_join_type="_",
+        stats_callback=stats_list.append, dry_run=dry_run, **params,
+    )
+    return config_env_dict, stats_list
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_stats_of_each_phase(dry_run):
+    config_env_dict, stats_list = load_with_stats(dry_run=dry_run)
+    stats, = stats_list
+
+    assert stats.file_path.endswith(FILE_NAME)
+    assert stats.key_count == len(config_env_dict)
+    assert stats.max_depth == 3
+    assert stats.bytes_read == os.path.getsize(os.path.join(EXAMPLES_PATH, FILE_NAME))
+    assert stats.read_seconds > 0
+    assert stats.parse_seconds > 0
+    assert stats.flatten_seconds > 0
+    assert (stats.commit_seconds == 0) == dry_run
+    assert stats.total_seconds == pytest.approx(stats.read_seconds + stats.parse_seconds + stats.flatten_seconds
+                                                + stats.convert_seconds + stats.commit_seconds)
+    assert stats.to_dict()["key_count"] == stats.key_count
+    assert stats.profile is None
+    assert not stats.is_cache_hit
+
+
+def test_profile_is_stored_in_the_stats():
+    _, stats_list = load_with_stats(is_profile=True)
+    stats, = stats_list
+
+    assert isinstance(stats.profile, pstats.Stats)
+    assert stats.profile.total_calls > 0
+    assert "profile" not in stats.to_dict()
+
+
+def test_warm_cache_load_is_a_cache_hit(tmp_path):
+    config_cache = ParsedConfigCache(cache_dir=str(tmp_path))
+    cold_config_env_dict, cold_stats_list = load_with_stats(config_cache=config_cache)
+    warm_config_env_dict, warm_stats_list = load_with_stats(config_cache=config_cache)
+
+    assert warm_config_env_dict == cold_config_env_dict
+    assert not cold_stats_list[0].is_cache_hit
+    assert warm_stats_list[0].is_cache_hit
+    assert warm_stats_list[0].key_count == len(warm_config_env_dict)
+
+
+def test_stats_of_several_files_follow_the_declared_order():
+    file_path_list = [FILE_NAME, "json_config_file.json", "toml_config_file.toml"]
+    stats_list = []
+
+    load_result = CraftsEnvConfig().load_config_files(
+        file_path_list=file_path_list, root_full_path=EXAMPLES_PATH, naming_case_type="upper",
+        naming_case_join_type="_", stats_callback=stats_list.append,
+    )
+
+    assert load_result["stats_list"] == stats_list
+    assert [os.path.basename(stats.file_path) for stats in stats_list] == file_path_list
+    assert len({stats.commit_seconds for stats in stats_list}) == 1
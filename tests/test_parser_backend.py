@@ -0,0 +1,113 @@
+"""
+This file tests the parser backends of yaml, json and toml files.
+"""
+
+import os
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.config_buffer import parse_config_buffer
+from craftsperson_env.utils.config_flattener import flatten_config_file
+from craftsperson_env.utils.contraster import NAMING_CASE_LIST, OTHER_CONFIG_NAME_TYPE_LIST, PARSER_BACKEND_DICT
+from craftsperson_env.utils.parser_backend import get_available_parser_backend_list, set_parser_backend
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples")
+
+# Documents with values where parser backends are known to differ, such as integers beyond 64 bits
+EDGE_CASE_CONTENT_DICT = {
+    "json": (
+        '{"big": 123456789012345678901234567890, "negative": -9223372036854775809, "max": 9223372036854775807,'
+        ' "float": 0.1, "exponent": 1e-7, "text": "h\\u00e9llo \\"quoted\\"\\n", "null": null,'
+        ' "list": [{"a": 1}, {"a": [1, 2.5, null, true]}], "key": 1, "key": 2}'
+    ),
+    "yaml": (
+        "base: &base\n  host: localhost\n  port: 8080\nchild:\n  <<: *base\n  port: 9090\n"
+        "date: 2024-01-02\ntimestamp: 2024-01-02 03:04:05\ntext: |\n  line one\n  line two\n"
+        "list:\n  - {a: 1}\n  - b\nfloat: 1.5e3\nbig: 123456789012345678901234567890\nhex: 0x1F\n"
+    ),
+    "toml": (
+        'title = "t"\nmax = 9223372036854775807\nfloat = 1.5e3\ninfinity = inf\ndate = 1979-05-27\n'
+        "offset_datetime = 1979-05-27T07:32:00-08:00\nlocal_datetime = 1979-05-27T07:32:00\ntime = 07:32:00\n"
+        'multi_line = """\na\nb"""\n[server]\nhosts = ["a", "b"]\ninline = { x = 1, y = [1, 2] }\n'
+        '[[products]]\nname = "hammer"\n[[products]]\nname = "nail"\n'
+    ),
+}
+
+
+@pytest.fixture
+def orjson_backend():
+    pytest.importorskip("orjson")
+    CraftsEnvConfig.set_parser_backend("json", "orjson")
+    yield
+    CraftsEnvConfig.set_parser_backend("json")
+
+
+def test_orjson_fallback_reads_the_file_once(tmp_path, orjson_backend):
+    file_path = tmp_path / "nan.json"
+    # orjson rejects NaN, so the json module parses this file
+    file_path.write_text('{"not": {"number": NaN}}', encoding="utf-8")
+    stats_list = []
+
+    config_env_dict = CraftsEnvConfig().load_config_file(
+        file_path=str(file_path), root_full_path="", naming_case_type="upper", naming_case_join_type="_",
+        stats_callback=stats_list.append, dry_run=True,
+    )
+
+    assert config_env_dict == {"NOT_NUMBER": "nan"}
+    assert stats_list[0].bytes_read == os.path.getsize(file_path)
+
+
+def get_conformance_file_path_list(temp_dir) -> list:
+    file_path_list = [os.path.join(EXAMPLES_PATH, f"{file_type}_config_file.{file_type}")
+                      for file_type in PARSER_BACKEND_DICT]
+    for file_type, content in EDGE_CASE_CONTENT_DICT.items():
+        file_path = temp_dir / f"edge_case.{file_type}"
+        file_path.write_text(content, encoding="utf-8")
+        file_path_list.append(str(file_path))
+    return file_path_list
+
+
+def flatten_with_backend(file_path: str, parser_backend: str, **flatten_params) -> dict:
+    file_type = os.path.splitext(file_path)[1][1:]
+    set_parser_backend(file_type=file_type, parser_backend=parser_backend)
+    try:
+        return flatten_config_file(file_path=file_path, **flatten_params)
+    finally:
+        set_parser_backend(file_type=file_type)
+
+
+@pytest.mark.parametrize("naming_case_type", NAMING_CASE_LIST + OTHER_CONFIG_NAME_TYPE_LIST)
+@pytest.mark.parametrize("is_native_value", [False, True])
+def test_parser_backends_give_the_same_flattened_config(tmp_path, naming_case_type, is_native_value):
+    flatten_params = {"naming_case_type": naming_case_type, "naming_case_join_type": "_",
+                      "is_native_value": is_native_value}
+
+    for file_path in get_conformance_file_path_list(tmp_path):
+        file_type = os.path.splitext(file_path)[1][1:]
+        reference_dict = flatten_with_backend(file_path, PARSER_BACKEND_DICT[file_type][-1], **flatten_params)
+
+        for parser_backend in get_available_parser_backend_list(file_type):
+            config_env_dict = flatten_with_backend(file_path, parser_backend, **flatten_params)
+
+            assert config_env_dict == reference_dict, (file_path, parser_backend)
+            assert list(config_env_dict) == list(reference_dict), (file_path, parser_backend)
+
+
+@pytest.mark.parametrize("file_type", list(EDGE_CASE_CONTENT_DICT))
+def test_parser_backends_give_the_same_buffer_config(file_type):
+    content = EDGE_CASE_CONTENT_DICT[file_type].encode("utf-8")
+    reference_backend = PARSER_BACKEND_DICT[file_type][-1]
+    set_parser_backend(file_type=file_type, parser_backend=reference_backend)
+    try:
+        reference_dict, _ = parse_config_buffer(buffer=content, config_type=file_type)
+    finally:
+        set_parser_backend(file_type=file_type)
+
+    for parser_backend in get_available_parser_backend_list(file_type):
+        set_parser_backend(file_type=file_type, parser_backend=parser_backend)
+        try:
+            for buffer in [content, memoryview(content), content.decode("utf-8")]:
+                assert parse_config_buffer(buffer=buffer, config_type=file_type)[0] == reference_dict
+        finally:
+            set_parser_backend(file_type=file_type)
@@ -0,0 +1,74 @@
+"""
+This file tests the immutable environments built for child processes.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.subprocess_env import SubprocessEnv
+
+
+def test_values_are_stringified_over_the_base_env():
+    subprocess_env = SubprocessEnv(config_env_dict={"PORT": 80, "FLAG": True, "HOST": "x"},
+                                   base_env={"HOST": "base", "HOME": "/home"})
+
+    assert subprocess_env.to_dict() == {"HOST": "x", "HOME": "/home", "PORT": "80", "FLAG": "True"}
+    assert len(subprocess_env) == 4
+    assert "HOME" in subprocess_env
+    with pytest.raises(TypeError):
+        subprocess_env["HOST"] = "y"
+
+
+def test_environb_is_built_once():
+    subprocess_env = SubprocessEnv(config_env_dict={"HOST": "x"})
+
+    environb = subprocess_env.environb
+
+    assert environb == {b"HOST": b"x"}
+    assert subprocess_env.environb is environb
+
+
+@pytest.mark.parametrize("is_environb_built", [True, False])
+def test_merge_does_not_change_the_original(is_environb_built):
+    subprocess_env = SubprocessEnv(config_env_dict={"HOST": "x", "PORT": "80"})
+    if is_environb_built:
+        environb = subprocess_env.environb
+
+    merged_env = subprocess_env.merge({"PORT": 8080, "WORKER": "1"})
+
+    assert merged_env.to_dict() == {"HOST": "x", "PORT": "8080", "WORKER": "1"}
+    assert merged_env.environb == {b"HOST": b"x", b"PORT": b"8080", b"WORKER": b"1"}
+    assert subprocess_env.to_dict() == {"HOST": "x", "PORT": "80"}
+    if is_environb_built:
+        assert subprocess_env.environb is environb
+        assert environb == {b"HOST": b"x", b"PORT": b"80"}
+
+
+def test_build_subprocess_env_does_not_change_environ(tmp_path):
+    file_path_list = []
+    for index, content in enumerate(["TEST_CHILD_HOST=a\nTEST_CHILD_PORT=80\n",
+                                     "TEST_CHILD_PORT=8080\nTEST_CHILD_URL=${TEST_CHILD_HOST}:${TEST_CHILD_PORT}\n"]):
+        file_path = tmp_path / f"config_{index}.env"
+        file_path.write_text(content, encoding="utf-8")
+        file_path_list.append(str(file_path))
+
+    subprocess_env = CraftsEnvConfig().build_subprocess_env(
+        file_path_list=file_path_list, base_env=os.environ, is_interpolate=True,
+        root_full_path="", naming_case_type="upper",
+    )
+
+    assert subprocess_env["TEST_CHILD_URL"] == "a:8080"
+    assert "PATH" in subprocess_env
+    assert "TEST_CHILD_URL" not in os.environ
+
+    output = subprocess.run(
+        [sys.executable, "-c", "import os; print(os.environ['TEST_CHILD_URL'])"],
+        env=subprocess_env.environb if os.name == "posix" else subprocess_env,
+        stdout=subprocess.PIPE, check=True,
+    ).stdout
+
+    assert output.decode().strip() == "a:8080"
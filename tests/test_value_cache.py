@@ -0,0 +1,55 @@
+"""
+This file tests the typed value cache behind 'CraftsEnvConfig.get'.
+"""
+
+import os
+
+from craftsperson_env import CraftsEnvConfig
+from craftsperson_env.utils.value_cache import CACHE_MISS, TypedValueCache
+
+
+def test_get_returns_copies_of_cached_containers():
+    config = CraftsEnvConfig()
+    config.set("TEST_VALUE_CACHE_DICT", "{'a': [1, 2]}")
+
+    value = config.get("TEST_VALUE_CACHE_DICT", dict)
+    value["a"].append(3)
+    value["b"] = 1
+
+    assert config.get("TEST_VALUE_CACHE_DICT", dict) == {"a": [1, 2]}
+    assert config.cache_info()["hits"] == 1
+
+
+def test_external_change_is_parsed_again():
+    config = CraftsEnvConfig()
+    config.set("TEST_VALUE_CACHE_INT", 1)
+    assert config.get("TEST_VALUE_CACHE_INT", int) == 1
+
+    os.environ["TEST_VALUE_CACHE_INT"] = "2"
+
+    assert config.get("TEST_VALUE_CACHE_INT", int) == 2
+
+
+def test_size_counts_entries_and_is_bounded():
+    value_cache = TypedValueCache(max_size=3)
+    value_cache.set("A", int, "1", 1)
+    value_cache.set("A", str, "1", "1")
+    assert value_cache.cache_info()["size"] == 2
+
+    value_cache.set("B", int, "2", 2)
+    value_cache.set("C", int, "3", 3)
+
+    assert value_cache.cache_info()["size"] == 2
+    assert value_cache.get("A", int, "1") is CACHE_MISS
+    assert value_cache.get("C", int, "3") == 3
+
+
+def test_least_recently_used_key_is_removed():
+    value_cache = TypedValueCache(max_size=2)
+    value_cache.set("A", int, "1", 1)
+    value_cache.set("B", int, "2", 2)
+    value_cache.get("A", int, "1")
+    value_cache.set("C", int, "3", 3)
+
+    assert value_cache.get("A", int, "1") == 1
+    assert value_cache.get("B", int, "2") is CACHE_MISS
@@ -0,0 +1,28 @@
+"""
+This file tests the streamed loads of xml config files.
+"""
+
+import os
+
+from craftsperson_env import CraftsEnvConfig
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "")
+
+
+def load_xml_config_file(is_stream_xml: bool) -> tuple:
+    stats_list = []
+    config_env_dict = CraftsEnvConfig().load_config_file(
+        file_path="xml_config_file.xml", root_full_path=EXAMPLES_PATH, naming_case_type="upper",
+        naming_case_join_type="_", is_stream_xml=is_stream_xml, stats_callback=stats_list.append, dry_run=True,
+    )
+    return config_env_dict, stats_list[0]
+
+
+def test_streamed_xml_gives_the_same_keys():
+    assert load_xml_config_file(is_stream_xml=True)[0] == load_xml_config_file(is_stream_xml=False)[0]
+
+
+def test_streamed_xml_counts_the_file_once():
+    _, stats = load_xml_config_file(is_stream_xml=True)
+
+    assert stats.bytes_read == os.path.getsize(os.path.join(EXAMPLES_PATH, "xml_config_file.xml"))